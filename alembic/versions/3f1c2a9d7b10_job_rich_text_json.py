@@ -0,0 +1,59 @@
+"""store job rich text as native json
+
+Revision ID: 3f1c2a9d7b10
+Revises: 1c0e5b7a9d20
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9d7b10"
+down_revision: Union[str, None] = "1c0e5b7a9d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RICH_TEXT_COLUMNS = ("job_description", "job_requirement", "job_benefit")
+
+
+def upgrade() -> None:
+    # Rows were written through json.dumps, so they are already valid JSON
+    # documents. Quote anything that is not, so the type change cannot fail.
+    for column in RICH_TEXT_COLUMNS:
+        op.execute(
+            f"UPDATE job SET {column} = JSON_QUOTE({column}) "
+            f"WHERE JSON_VALID({column}) = 0"
+        )
+        op.alter_column(
+            "job",
+            column,
+            existing_type=mysql.TEXT(),
+            type_=sa.JSON(),
+            existing_nullable=False,
+        )
+    # email_contact was a JSON column holding a json.dumps'd list (a JSON
+    # string); unwrap it into a native array.
+    op.execute(
+        "UPDATE job SET email_contact = CAST(JSON_UNQUOTE(email_contact) AS JSON) "
+        "WHERE JSON_TYPE(email_contact) = 'STRING'"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE job SET email_contact = JSON_QUOTE(CAST(email_contact AS CHAR)) "
+        "WHERE JSON_TYPE(email_contact) = 'ARRAY'"
+    )
+    for column in RICH_TEXT_COLUMNS:
+        op.alter_column(
+            "job",
+            column,
+            existing_type=sa.JSON(),
+            type_=mysql.TEXT(),
+            existing_nullable=False,
+        )
@@ -0,0 +1,60 @@
+"""copy the approval status onto the job row
+
+Revision ID: 5d9c2f7a8e61
+Revises: e7b3a1c9d402
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d9c2f7a8e61"
+down_revision: Union[str, None] = "e7b3a1c9d402"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job",
+        sa.Column(
+            "approval_status",
+            sa.Enum(
+                "PENDING", "APPROVED", "REJECTED", "STOPPED", name="jobapprovalstatus"
+            ),
+            server_default="PENDING",
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "job", sa.Column("approved_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    # The approval row is stamped when it is approved, there is no separate
+    # approval time to copy.
+    op.execute(
+        "UPDATE job JOIN job_approval_request "
+        "ON job_approval_request.job_id = job.id "
+        "SET job.approval_status = job_approval_request.status, "
+        "job.approved_at = IF(job_approval_request.status = 'APPROVED', "
+        "COALESCE(job_approval_request.updated_at, job_approval_request.created_at), "
+        "NULL)"
+    )
+    op.create_index("ix_job_approved_at", "job", ["approved_at"])
+    op.create_index(
+        "ix_job_status_approval_status_deadline_id",
+        "job",
+        ["status", "approval_status", "deadline", "id"],
+    )
+    op.drop_index("ix_job_status_deadline_id", table_name="job")
+
+
+def downgrade() -> None:
+    op.create_index("ix_job_status_deadline_id", "job", ["status", "deadline", "id"])
+    op.drop_index("ix_job_status_approval_status_deadline_id", table_name="job")
+    op.drop_index("ix_job_approved_at", table_name="job")
+    op.drop_column("job", "approved_at")
+    op.drop_column("job", "approval_status")
@@ -0,0 +1,35 @@
+"""add image thumbnail columns
+
+Revision ID: 8b2e4c6d1a33
+Revises: 3f1c2a9d7b10
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e4c6d1a33"
+down_revision: Union[str, None] = "3f1c2a9d7b10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+THUMBNAIL_COLUMNS = (
+    ("company", "logo_thumbnail"),
+    ("company", "banner_thumbnail"),
+    ("manager_base", "avatar_thumbnail"),
+    ("user", "avatar_thumbnail"),
+)
+
+
+def upgrade() -> None:
+    for table, column in THUMBNAIL_COLUMNS:
+        op.add_column(table, sa.Column(column, sa.String(255), nullable=True))
+
+
+def downgrade() -> None:
+    for table, column in reversed(THUMBNAIL_COLUMNS):
+        op.drop_column(table, column)
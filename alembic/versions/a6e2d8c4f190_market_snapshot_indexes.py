@@ -0,0 +1,31 @@
+"""index the market snapshots by time
+
+Revision ID: a6e2d8c4f190
+Revises: 5d9c2f7a8e61
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e2d8c4f190"
+down_revision: Union[str, None] = "5d9c2f7a8e61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_work_market_time_scan", "work_market", ["time_scan"])
+    op.create_index("ix_cruitment_demand_time_scan", "cruitment_demand", ["time_scan"])
+    op.create_index(
+        "ix_cruitment_demand_key_time_scan", "cruitment_demand", ["key", "time_scan"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cruitment_demand_key_time_scan", table_name="cruitment_demand")
+    op.drop_index("ix_cruitment_demand_time_scan", table_name="cruitment_demand")
+    op.drop_index("ix_work_market_time_scan", table_name="work_market")
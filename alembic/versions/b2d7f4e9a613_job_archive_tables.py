@@ -0,0 +1,204 @@
+"""archive tables for old expired jobs
+
+Revision ID: b2d7f4e9a613
+Revises: f3b8e1a5c727
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d7f4e9a613"
+down_revision: Union[str, None] = "f3b8e1a5c727"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+APPROVAL_STATUS = ("PENDING", "APPROVED", "REJECTED", "STOPPED")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("business_id", sa.Integer(), nullable=False),
+        sa.Column("campaign_id", sa.Integer(), nullable=False),
+        sa.Column("job_experience_id", sa.Integer(), nullable=False),
+        sa.Column("job_position_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("job_description", sa.JSON(), nullable=False),
+        sa.Column("job_requirement", sa.JSON(), nullable=False),
+        sa.Column("job_benefit", sa.JSON(), nullable=False),
+        sa.Column("job_location", sa.String(255), nullable=False),
+        sa.Column("max_salary", sa.Integer(), nullable=True),
+        sa.Column("min_salary", sa.Integer(), nullable=True),
+        sa.Column(
+            "salary_type",
+            sa.Enum("VND", "USD", "DEAL", name="salarytype"),
+            nullable=False,
+        ),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("full_name_contact", sa.String(50), nullable=False),
+        sa.Column("phone_number_contact", sa.String(10), nullable=False),
+        sa.Column("email_contact", sa.JSON(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING",
+                "PUBLISHED",
+                "REJECTED",
+                "EXPIRED",
+                "DRAFT",
+                "BANNED",
+                "STOPPED",
+                name="jobstatus",
+            ),
+            nullable=True,
+        ),
+        sa.Column(
+            "approval_status",
+            sa.Enum(*APPROVAL_STATUS, name="jobapprovalstatus"),
+            nullable=False,
+        ),
+        sa.Column("approved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "employment_type",
+            sa.Enum("FULL_TIME", "PART_TIME", "INTERNSHIP", name="jobtype"),
+            nullable=True,
+        ),
+        sa.Column(
+            "gender_requirement",
+            sa.Enum("MALE", "FEMALE", "OTHER", name="gender"),
+            nullable=True,
+        ),
+        sa.Column("deadline", sa.Date(), nullable=False),
+        sa.Column("employer_verified", sa.Boolean(), nullable=True),
+        sa.Column("is_featured", sa.Boolean(), nullable=True),
+        sa.Column("is_highlight", sa.Boolean(), nullable=True),
+        sa.Column("is_urgent", sa.Boolean(), nullable=True),
+        sa.Column("is_paid_featured", sa.Boolean(), nullable=True),
+        sa.Column("is_bg_featured", sa.Boolean(), nullable=True),
+        sa.Column("is_vip_employer", sa.Boolean(), nullable=True),
+        sa.Column("is_diamond_employer", sa.Boolean(), nullable=True),
+        sa.Column("is_job_flash", sa.Boolean(), nullable=True),
+        sa.Column("working_time_text", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()")
+        ),
+        sa.ForeignKeyConstraint(["business_id"], ["business.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["campaign_id"], ["campaign.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_job_archive_id", "job_archive", ["id"])
+    op.create_index("ix_job_archive_campaign_id", "job_archive", ["campaign_id"])
+
+    op.create_table(
+        "work_location_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=True),
+        sa.Column("province_id", sa.Integer(), nullable=False),
+        sa.Column("district_id", sa.Integer(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["job_archive.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "job_category_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=True),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["job_archive.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["category_id"], ["category.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "job_skill_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=True),
+        sa.Column("skill_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["job_archive.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["skill_id"], ["skill.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "working_time_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=True),
+        sa.Column("start_time", sa.Time(), nullable=False),
+        sa.Column("end_time", sa.Time(), nullable=False),
+        sa.Column("date_from", sa.Integer(), nullable=False),
+        sa.Column("date_to", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["job_archive.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "job_approval_request_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum(*APPROVAL_STATUS, name="jobapprovalstatus"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["job_archive.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "approval_log_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_approval_request_id", sa.Integer(), nullable=True),
+        sa.Column("admin_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "previous_status",
+            sa.Enum(*APPROVAL_STATUS, name="jobapprovalstatus"),
+            nullable=False,
+        ),
+        sa.Column(
+            "new_status",
+            sa.Enum(*APPROVAL_STATUS, name="jobapprovalstatus"),
+            nullable=False,
+        ),
+        sa.Column("reason", sa.String(100), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["job_approval_request_id"],
+            ["job_approval_request_archive.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    for table in (
+        "work_location_archive",
+        "job_category_archive",
+        "job_skill_archive",
+        "working_time_archive",
+        "job_approval_request_archive",
+    ):
+        op.create_index(f"ix_{table}_id", table, ["id"])
+        op.create_index(f"ix_{table}_job_id", table, ["job_id"])
+    op.create_index("ix_approval_log_archive_id", "approval_log_archive", ["id"])
+    op.create_index(
+        "ix_approval_log_archive_job_approval_request_id",
+        "approval_log_archive",
+        ["job_approval_request_id"],
+    )
+    op.create_index(
+        "ix_approval_log_archive_admin_id", "approval_log_archive", ["admin_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("approval_log_archive")
+    op.drop_table("job_approval_request_archive")
+    op.drop_table("working_time_archive")
+    op.drop_table("job_skill_archive")
+    op.drop_table("job_category_archive")
+    op.drop_table("work_location_archive")
+    op.drop_table("job_archive")
@@ -0,0 +1,38 @@
+"""make social_network.access_token nullable
+
+Revision ID: d5a9f3c2e817
+Revises: b2d7f4e9a613
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a9f3c2e817"
+down_revision: Union[str, None] = "b2d7f4e9a613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Logins with a Google ID token have no access token to store.
+    op.alter_column(
+        "social_network",
+        "access_token",
+        existing_type=sa.String(500),
+        nullable=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE social_network SET access_token = '' WHERE access_token IS NULL")
+    op.alter_column(
+        "social_network",
+        "access_token",
+        existing_type=sa.String(500),
+        nullable=False,
+    )
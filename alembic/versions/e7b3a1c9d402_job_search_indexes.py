@@ -0,0 +1,55 @@
+"""add composite indexes for the job search filters
+
+Revision ID: e7b3a1c9d402
+Revises: c41d7e9f2b58
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3a1c9d402"
+down_revision: Union[str, None] = "c41d7e9f2b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Composite indexes follow the predicates of CRUDJob.apply_filters; each one
+# starts with the column of a single index it replaces, so the foreign keys
+# keep an index to use while the old one is dropped.
+INDEXES = (
+    ("ix_job_status_deadline_id", "job", ["status", "deadline", "id"]),
+    (
+        "ix_work_location_province_id_district_id_job_id",
+        "work_location",
+        ["province_id", "district_id", "job_id"],
+    ),
+    ("ix_job_category_category_id_job_id", "job_category", ["category_id", "job_id"]),
+    (
+        "ix_job_approval_request_job_id_status_updated_at",
+        "job_approval_request",
+        ["job_id", "status", "updated_at"],
+    ),
+)
+REPLACED = (
+    ("ix_job_status", "job", ["status"]),
+    ("ix_work_location_province_id", "work_location", ["province_id"]),
+    ("ix_job_category_category_id", "job_category", ["category_id"]),
+    ("ix_job_approval_request_job_id", "job_approval_request", ["job_id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    for name, table, _ in REPLACED:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, columns in REPLACED:
+        op.create_index(name, table, columns)
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,90 @@
+"""archive tables for the retention purges
+
+Revision ID: f3b8e1a5c727
+Revises: a6e2d8c4f190
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8e1a5c727"
+down_revision: Union[str, None] = "a6e2d8c4f190"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "business_history_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("business_id", sa.Integer(), nullable=True),
+        sa.Column("content", sa.String(255), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum(
+                "REGISTER",
+                "LOGIN",
+                "VERIFY_SUCCESS",
+                "CREATE_NEW_CAMPAIGN",
+                "OFF_CAMPAIGN",
+                "ON_CAMPAIGN",
+                "DELETE_CAMPAIGN",
+                "UPDATE_CAMPAIGN",
+                "APPROVE_JOB",
+                "REJECT_JOB",
+                name="historytype",
+            ),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()")
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_business_history_archive_id", "business_history_archive", ["id"]
+    )
+    op.create_index(
+        "ix_business_history_archive_business_id",
+        "business_history_archive",
+        ["business_id"],
+    )
+    op.create_table(
+        "job_report_archive",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("report_type", sa.String(10), nullable=True),
+        sa.Column("report_content", sa.String(100), nullable=True),
+        sa.Column("report_status", sa.String(10), nullable=True),
+        sa.Column("report_created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("report_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "archived_at", sa.DateTime(timezone=True), server_default=sa.text("now()")
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_job_report_archive_id", "job_report_archive", ["id"])
+    op.create_index("ix_job_report_archive_job_id", "job_report_archive", ["job_id"])
+    op.create_index("ix_job_report_archive_user_id", "job_report_archive", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_report_archive_user_id", table_name="job_report_archive")
+    op.drop_index("ix_job_report_archive_job_id", table_name="job_report_archive")
+    op.drop_index("ix_job_report_archive_id", table_name="job_report_archive")
+    op.drop_table("job_report_archive")
+    op.drop_index(
+        "ix_business_history_archive_business_id",
+        table_name="business_history_archive",
+    )
+    op.drop_index(
+        "ix_business_history_archive_id", table_name="business_history_archive"
+    )
+    op.drop_table("business_history_archive")
@@ -18,11 +18,16 @@ from app.api.api_v1.endpoint import (
     business_job,
     company,
     job,
+    user_upload,
+    business_upload,
 )
 
 api_router = APIRouter(prefix="/v1/api")
 api_router.include_router(user_auth.router, prefix="/user", tags=["user_auth"])
 api_router.include_router(user.router, prefix="/user/users", tags=["user"])
+api_router.include_router(
+    user_upload.router, prefix="/user/upload", tags=["user_upload"]
+)
 api_router.include_router(verify.router, prefix="/verify", tags=["verify"])
 api_router.include_router(location.router, prefix="/location", tags=["location"])
 api_router.include_router(position.router, prefix="/position", tags=["position"])
@@ -46,6 +51,9 @@ api_router.include_router(
 api_router.include_router(
     business_campaign.router, prefix="/business/campaign", tags=["business_campaign"]
 )
+api_router.include_router(
+    business_upload.router, prefix="/business/upload", tags=["business_upload"]
+)
 api_router.include_router(
     business_admin.router, prefix="/admin", tags=["business_admin"]
 )
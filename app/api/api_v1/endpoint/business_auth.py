@@ -15,6 +15,8 @@ from app.db.base import get_db
 from app.core.auth import service_business_auth
 from app.core import constant
 from app.core.business import service_business
+from app.core.config import settings
+from app.core.rate_limit import RateLimiter
 from app.hepler.response_custom import custom_response_error, custom_response
 from app.hepler.enum import Gender
 
@@ -143,7 +145,11 @@ def register_business(
         return custom_response(status_code, constant.SUCCESS, response)
 
 
-@router.post("/login", summary="Login business.")
+@router.post(
+    "/login",
+    summary="Login business.",
+    dependencies=[Depends(RateLimiter("business_login", settings.RATE_LIMIT_LOGIN))],
+)
 def login_auth(
     data: dict = Body(
         ..., example={"email": "tungong@email.com", "password": "@Password1234"}
@@ -37,6 +37,7 @@ def get_job(
     job_approve_status: JobApprovalStatus = Query(
         None, description="The job approve status.", example=JobApprovalStatus.PENDING
     ),
+    archived: bool = Query(False, description="List the archived jobs.", example=False),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -55,6 +56,7 @@ def get_job(
     - job_status (str): The job status.
     - job_approve_status (str): The job approve status.
     - campaign_id (int): The campaign id.
+    - archived (bool): List the archived jobs, expired long ago.
 
     Returns:
     - status_code (200): The list of job has been found successfully.
@@ -11,6 +11,8 @@ from typing import List
 from app.db.base import get_db
 from app.core import constant
 from app.core.company import service_company
+from app.core.config import settings
+from app.core.rate_limit import RateLimiter
 from app.hepler.response_custom import custom_response_error, custom_response
 from app.hepler.enum import OrderType, SortBy
 
@@ -61,7 +63,13 @@ def get_companies(
         return custom_response(status_code, constant.SUCCESS, response)
 
 
-@router.get("/search", summary="Search list of company.")
+@router.get(
+    "/search",
+    summary="Search list of company.",
+    dependencies=[
+        Depends(RateLimiter("company_search", settings.RATE_LIMIT_COMPANY_SEARCH))
+    ],
+)
 def get_company(
     skip: int = Query(None, description="The number of users to skip.", example=0),
     limit: int = Query(None, description="The number of users to return.", example=10),
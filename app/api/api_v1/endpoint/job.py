@@ -1,3 +1,4 @@
+from datetime import date
 from fastapi import APIRouter, Depends, Query, Path
 
 from sqlalchemy.orm import Session
@@ -7,13 +8,20 @@ from app.db.base import get_db
 from app.storage.redis import redis_dependency
 from app.core import constant
 from app.core.job import service_job
+from app.core.market import service_market
+from app.core.config import settings
+from app.core.rate_limit import RateLimiter
 from app.hepler.response_custom import custom_response_error, custom_response
-from app.hepler.enum import OrderType, SortJobBy, JobType, SalaryType
+from app.hepler.enum import OrderType, SortJobBy, JobType, SalaryType, MarketPeriod
 
 router = APIRouter()
 
 
-@router.get("/search", summary="Search list of job.")
+@router.get(
+    "/search",
+    summary="Search list of job.",
+    dependencies=[Depends(RateLimiter("job_search", settings.RATE_LIMIT_JOB_SEARCH))],
+)
 async def search_job(
     skip: int = Query(None, description="The number of users to skip.", example=0),
     limit: int = Query(None, description="The number of users to return.", example=100),
@@ -176,22 +184,68 @@ async def count_job_by_salary(
 
 
 @router.get("/cruitment_demand", summary="Get information of recruitment demand.")
-async def get_cruitment_demand(
-    redis: Redis = Depends(redis_dependency),
+def get_cruitment_demand(
     db: Session = Depends(get_db),
 ):
     """
     Get information of recruitment demand.
 
-    This endpoint allows getting information of recruitment demand.
+    This endpoint allows getting information of recruitment demand from the
+    latest market snapshot.
 
     Returns:
     - status_code (200): The recruitment demand has been found successfully.
     - status_code (400): The request is invalid.
-    - status_code (404): The recruitment demand is not found.
+    - status_code (404): No market snapshot has been taken yet.
 
     """
-    status, status_code, response = await service_job.get_cruitment_demand(redis, db)
+    status, status_code, response = service_market.get_cruitment_demand(db)
+
+    if status == constant.ERROR:
+        return custom_response_error(status_code, constant.ERROR, response)
+    elif status == constant.SUCCESS:
+        return custom_response(status_code, constant.SUCCESS, response)
+
+
+@router.get(
+    "/cruitment_demand/history",
+    summary="Get history of recruitment demand.",
+)
+def get_cruitment_demand_history(
+    period: MarketPeriod = Query(
+        None, description="The rollup period.", example=MarketPeriod.DAY
+    ),
+    from_date: date = Query(None, description="The first day.", example="2024-01-01"),
+    to_date: date = Query(None, description="The last day.", example="2024-01-31"),
+    key: str = Query(None, description="The breakdown key.", example="category:1"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get history of recruitment demand.
+
+    This endpoint allows getting the market snapshots of a date range rolled
+    up by day or by week.
+
+    Parameters:
+    - period (str): The rollup period, day or week.
+    - from_date (date): The first day, 30 days before to_date by default.
+    - to_date (date): The last day, today by default.
+    - key (str): The breakdown key, category:<id> or province:<id>.
+
+    Returns:
+    - status_code (200): The history has been found successfully.
+    - status_code (400): The request is invalid.
+
+    """
+    status, status_code, response = service_market.get_cruitment_demand_history(
+        db,
+        {
+            "period": period,
+            "from_date": from_date,
+            "to_date": to_date,
+            "key": key,
+        },
+    )
 
     if status == constant.ERROR:
         return custom_response_error(status_code, constant.ERROR, response)
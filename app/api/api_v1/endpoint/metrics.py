@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", summary="Prometheus metrics.", include_in_schema=False)
+def get_metrics():
+    """
+    Prometheus metrics.
+
+    This endpoint exposes the metrics of the service in the Prometheus text format.
+    """
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
@@ -13,6 +13,8 @@ from app.db.base import get_db
 from app.core.auth import service_user_auth
 from app.core import constant
 from app.core.user import service_user
+from app.core.config import settings
+from app.core.rate_limit import RateLimiter
 from app.hepler.response_custom import custom_response_error, custom_response
 
 router = APIRouter()
@@ -71,7 +73,11 @@ def register_auth(
         return custom_response(status_code, constant.SUCCESS, response)
 
 
-@router.post("/login", summary="Login user.")
+@router.post(
+    "/login",
+    summary="Login user.",
+    dependencies=[Depends(RateLimiter("user_login", settings.RATE_LIMIT_LOGIN))],
+)
 def login_auth(
     data: dict = Body(
         ...,
@@ -106,7 +112,7 @@ def login_auth(
 
 @router.post("/login_google", summary="Login user by google.")
 async def login_google(
-    data: dict = Body(..., example={"access_token": "access_token"}),
+    data: dict = Body(..., example={"id_token": "id_token"}),
     db: Session = Depends(get_db),
 ):
     """
@@ -115,7 +121,8 @@ async def login_google(
     This endpoint allows logging in a user by google.
 
     Parameters:
-    - access_token (str): The access token from google.
+    - id_token (str): The ID token from google, verified locally.
+    - access_token (str): The access token from google, used when no id_token is sent.
 
     Returns:
     - status_code (200): The user has been logged in successfully.
@@ -125,7 +132,9 @@ async def login_google(
 
     """
 
-    status, status_code, response = service_user_auth.authenticate_google(db, data)
+    status, status_code, response = await service_user_auth.authenticate_google(
+        db, data
+    )
 
     if status == constant.ERROR:
         return custom_response_error(status_code, constant.ERROR, response)
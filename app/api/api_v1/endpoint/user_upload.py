@@ -0,0 +1,93 @@
+from fastapi import APIRouter, Depends, Body
+from sqlalchemy.orm import Session
+
+from app.db.base import get_db
+from app.core import constant
+from app.core.upload import service_upload
+from app.core.auth.service_user_auth import get_current_user
+from app.hepler.response_custom import custom_response_error, custom_response
+from app.hepler.enum import FolderBucket
+
+router = APIRouter()
+
+
+@router.post("/intent", summary="Create an upload intent.")
+def create_upload_intent(
+    data: dict = Body(
+        ...,
+        example={
+            "type": FolderBucket.CV,
+            "file_name": "cv.pdf",
+            "content_type": "application/pdf",
+            "size": 102400,
+        },
+    ),
+    current_user=Depends(get_current_user),
+):
+    """
+    Create an upload intent.
+
+    This endpoint returns a presigned POST url so the user uploads the file
+    directly to the bucket. The url only accepts the declared content type and
+    sizes up to the limit of the upload type.
+
+    Parameters:
+    - type (str): The upload type (avatar, cv).
+    - file_name (str): The name of the file.
+    - content_type (str): The content type of the file.
+    - size (int): The size of the file in bytes.
+
+    Returns:
+    - status_code (200): The upload intent has been created successfully.
+    - status_code (400): The request is invalid.
+    - status_code (403): The permission is denied.
+    - status_code (501): The storage does not support direct uploads.
+
+    """
+    status, status_code, response = service_upload.create_upload_intent(
+        data, current_user, [FolderBucket.AVATAR, FolderBucket.CV]
+    )
+
+    if status == constant.ERROR:
+        return custom_response_error(status_code, constant.ERROR, response)
+    elif status == constant.SUCCESS:
+        return custom_response(status_code, constant.SUCCESS, response)
+
+
+@router.post("/confirm", summary="Confirm an upload.")
+def confirm_upload(
+    data: dict = Body(
+        ...,
+        example={
+            "type": FolderBucket.CV,
+            "key": "",
+        },
+    ),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Confirm an upload.
+
+    This endpoint verifies that the object of an upload intent exists before
+    storing its key.
+
+    Parameters:
+    - type (str): The upload type.
+    - key (str): The key returned by the upload intent.
+
+    Returns:
+    - status_code (200): The upload has been confirmed successfully.
+    - status_code (400): The request is invalid or the file does not match the intent.
+    - status_code (403): The permission is denied.
+    - status_code (404): The file is not found.
+
+    """
+    status, status_code, response = service_upload.confirm_user_upload(
+        db, data, current_user
+    )
+
+    if status == constant.ERROR:
+        return custom_response_error(status_code, constant.ERROR, response)
+    elif status == constant.SUCCESS:
+        return custom_response(status_code, constant.SUCCESS, response)
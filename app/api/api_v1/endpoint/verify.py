@@ -5,18 +5,28 @@ from fastapi import (
     BackgroundTasks,
 )
 from sqlalchemy.orm import Session
+from redis import Redis
 
 from app.db.base import get_db
 from app.core import constant
 from app.core.verify import service_verify
+from app.core.config import settings
+from app.core.rate_limit import RateLimiter
 from app.core.auth.service_business_auth import get_current_user
 from app.hepler.response_custom import custom_response_error, custom_response
 from app.hepler.enum import VerifyType
+from app.storage.redis import redis_dependency
 
 router = APIRouter()
 
 
-@router.post("/send_verify_code", summary="Send verify code.")
+@router.post(
+    "/send_verify_code",
+    summary="Send verify code.",
+    dependencies=[
+        Depends(RateLimiter("send_verify_code", settings.RATE_LIMIT_SEND_VERIFY_CODE))
+    ],
+)
 async def send_verify_code(
     data: dict = Body(
         ...,
@@ -25,6 +35,7 @@ async def send_verify_code(
         },
     ),
     background_tasks: BackgroundTasks = BackgroundTasks(),
+    redis: Redis = Depends(redis_dependency),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -45,7 +56,7 @@ async def send_verify_code(
     """
 
     status, status_code, response = await service_verify.send_verify_background(
-        db, background_tasks, data, current_user
+        db, redis, background_tasks, data, current_user
     )
 
     if status == constant.ERROR:
@@ -55,7 +66,7 @@ async def send_verify_code(
 
 
 @router.post("/verify_code", summary="Verify code.")
-def verify_code(
+async def verify_code(
     data: dict = Body(
         ...,
         example={
@@ -63,6 +74,8 @@ def verify_code(
             "session_id": "",
         },
     ),
+    background_tasks: BackgroundTasks = BackgroundTasks(),
+    redis: Redis = Depends(redis_dependency),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
@@ -83,7 +96,9 @@ def verify_code(
 
     """
 
-    status, status_code, response = service_verify.verify_code(db, data, current_user)
+    status, status_code, response = await service_verify.verify_code(
+        db, redis, background_tasks, data, current_user
+    )
 
     if status == constant.ERROR:
         return custom_response_error(status_code, constant.ERROR, response)
@@ -0,0 +1,89 @@
+"""
+Benchmark of authentication overhead per request.
+
+Run with: python -m app.bench.auth_overhead [number_of_requests]
+
+Compares the size of the previous access token, signed from every column of
+the row, against the lean claims, and the cost of checking a token on each
+request with and without the verified token cache.
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+
+from app.core.auth.auth_handler import (
+    ALGORITHM,
+    SECRET_KEY,
+    decodeJWT,
+    signJWT,
+    verified_tokens,
+)
+from app.hepler.enum import Role, TypeAccount, TokenType
+
+
+def build_user() -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "id": 1,
+        "email": "ongtung@gmail.com",
+        "full_name": "Tung Ong",
+        "phone_number": "0323456789",
+        "avatar": "avatar/3f1c2a9d7b10c41d7e9f2b58.png",
+        "avatar_thumbnail": "avatar/3f1c2a9d7b10c41d7e9f2b58_thumb.webp",
+        "gender": "male",
+        "is_active": True,
+        "is_verified": True,
+        "role": Role.USER,
+        "type_account": TypeAccount.NORMAL,
+        "created_at": now.isoformat(),
+        "updated_at": now.isoformat(),
+    }
+
+
+def sign_full(user: dict) -> str:
+    iat = datetime.now(timezone.utc)
+    payload = {
+        **user,
+        "iat": iat,
+        "exp": iat + timedelta(minutes=30),
+        "type": TokenType.ACCESS.value,
+    }
+    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM).decode()
+
+
+def measure(label: str, check, count: int):
+    start = time.perf_counter()
+    for _ in range(count):
+        check()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed / count * 1e6:>8.2f} us/request")
+
+
+def main(count: int):
+    user = build_user()
+    full_token = sign_full(user)
+    lean_token = signJWT(user)
+    if isinstance(lean_token, bytes):
+        lean_token = lean_token.decode()
+    print(f"full claims token  {len(full_token):>5} bytes")
+    print(f"lean claims token  {len(lean_token):>5} bytes")
+
+    measure(
+        "decode full, no cache",
+        lambda: jwt.decode(full_token, SECRET_KEY, algorithms=[ALGORITHM]),
+        count,
+    )
+    measure(
+        "decode lean, no cache",
+        lambda: jwt.decode(lean_token, SECRET_KEY, algorithms=[ALGORITHM]),
+        count,
+    )
+    verified_tokens.tokens.clear()
+    measure("decode lean, cached", lambda: decodeJWT(lean_token), count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
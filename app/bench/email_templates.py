@@ -0,0 +1,71 @@
+"""
+Benchmark of email template rendering throughput.
+
+Run with: python -m app.bench.email_templates [number_of_renders]
+
+Compares the previous verification path, which read email.html from disk and
+did one str.replace per variable on every email, against the compiled
+templates, for both the verification and the notification template.
+"""
+
+import sys
+import time
+
+from app.core.email.template import TEMPLATE_DIR, email_templates
+
+VERIFY_CONTEXT = {
+    "email": "clone46191@gmail.com",
+    "verify_code": "123456",
+    "full_name": "Tung Ong",
+    "title": "xác thực tài khoản",
+}
+NOTIFICATION_CONTEXT = {
+    "full_name": "Tung Ong",
+    "message": "Tin tuyển dụng Backend developer của bạn đã được duyệt.",
+    "link": "http://localhost:3000/tuyen-dung/app",
+}
+
+
+def render_from_disk(name: str, **kwargs) -> str:
+    template = (TEMPLATE_DIR / name).read_text(encoding="utf-8")
+    for key, value in kwargs.items():
+        template = template.replace("{{ " + key + " }}", value)
+    return template
+
+
+def measure(label: str, render, count: int):
+    start = time.perf_counter()
+    for _ in range(count):
+        render()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} {count / elapsed:>10.0f} renders/s "
+        f"{elapsed / count * 1e6:>8.1f} us/render"
+    )
+
+
+def main(count: int):
+    measure(
+        "verify (disk + replace)",
+        lambda: render_from_disk("email.html", **VERIFY_CONTEXT),
+        count,
+    )
+    measure(
+        "verify (compiled)",
+        lambda: email_templates.render("email.html", **VERIFY_CONTEXT),
+        count,
+    )
+    measure(
+        "verify en (compiled)",
+        lambda: email_templates.render("email.html", "en", **VERIFY_CONTEXT),
+        count,
+    )
+    measure(
+        "notification (compiled)",
+        lambda: email_templates.render("notification.html", **NOTIFICATION_CONTEXT),
+        count,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
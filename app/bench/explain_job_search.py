@@ -0,0 +1,124 @@
+"""
+Check that every supported job search filter combination uses an index.
+
+Run with: python -m app.bench.explain_job_search
+
+Runs CRUDJob.search and CRUDJob.count with each combination of filters the
+public endpoints send, captures the statements they execute and EXPLAINs
+them against the database in DATABASE_URL (fill it with app.bench.seed, an
+empty table is always scanned). A plan that reads job, work_location,
+job_category or job_approval_request without an index is reported and the
+command exits with status 1. tests/test_job_search_indexes.py runs the same
+checks under pytest.
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+
+from app import crud
+from app.core.query_stats import explain_rows
+from app.db.base import SessionLocal, engine
+from app.hepler.enum import JobApprovalStatus, JobStatus, SalaryType
+
+FILTERED_TABLES = ("job", "work_location", "job_category", "job_approval_request")
+
+PUBLIC = {
+    "job_status": JobStatus.PUBLISHED,
+    "job_approve_status": JobApprovalStatus.APPROVED,
+    "deadline": date.today(),
+}
+
+COMBINATIONS = {
+    "public": {},
+    "province": {"province_id": 1},
+    "province_district": {"province_id": 1, "district_id": 2},
+    "district": {"district_id": 2},
+    "category": {"category_id": 1},
+    "province_category": {"province_id": 1, "category_id": 1},
+    "salary": {"min_salary": 5000000, "max_salary": 20000000},
+    "salary_type": {"salary_type": SalaryType.USD},
+    "company": {"company_id": 1},
+    "field": {"field_id": 1},
+    "approved_time": {"approved_time": datetime.now() - timedelta(days=1)},
+}
+
+
+def full_scans(conn, statement: str, parameters) -> list:
+    """The tables of FILTERED_TABLES the plan reads without an index"""
+    rows = explain_rows(conn, statement, parameters)
+    scans = []
+    if conn.dialect.name == "sqlite":
+        # Walking the primary key in ORDER BY order until LIMIT is found is
+        # shown as a bare SCAN too; it is only a full scan when the rows are
+        # sorted afterwards.
+        sorted_after = any("ORDER BY" in row["detail"] for row in rows)
+        for row in rows:
+            words = row["detail"].split()
+            if words[0] != "SCAN" or "USING" in words:
+                continue
+            if "LIMIT" in statement and not sorted_after and row["parent"] == 0:
+                continue
+            scans.append(words[1])
+    else:
+        scans = [row["table"] for row in rows if row.get("type") == "ALL"]
+    return [table for table in scans if table in FILTERED_TABLES]
+
+
+def indexes_used(conn, statement: str, parameters) -> set:
+    """The names of the indexes the plan reads"""
+    rows = explain_rows(conn, statement, parameters)
+    if conn.dialect.name == "sqlite":
+        indexes = set()
+        for row in rows:
+            words = row["detail"].split()
+            if "INDEX" in words and words.index("INDEX") + 1 < len(words):
+                indexes.add(words[words.index("INDEX") + 1])
+        return indexes
+    return {row["key"] for row in rows if row.get("key")}
+
+
+def capture(run) -> list:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def main() -> int:
+    failures = 0
+    db = SessionLocal()
+    try:
+        for name, filters in COMBINATIONS.items():
+            filters = {**PUBLIC, **filters}
+            for method in (crud.job.search, crud.job.count):
+                statements = capture(lambda: method(db, **filters))
+                conn = db.connection()
+                scans = sorted(
+                    {
+                        table
+                        for statement, parameters in statements
+                        for table in full_scans(conn, statement, parameters)
+                    }
+                )
+                label = f"{name} ({method.__name__})"
+                if scans:
+                    failures += 1
+                    print(f"FAIL {label}: full scan of {', '.join(scans)}")
+                else:
+                    print(f"ok   {label}")
+    finally:
+        db.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Check that the semi-join job filters return what the join + DISTINCT
+filters did.
+
+Run with: python -m app.bench.job_filter_equivalence [--cases 200]
+
+Builds random filter combinations from the ids in the database in
+DATABASE_URL (fill it with app.bench.seed) and compares CRUDJob.search,
+CRUDJob.count and CRUDJob.get_number_job_of_district with the previous
+implementation, kept below as legacy_filters. Mismatches are printed and
+the command exits with status 1. tests/test_job_filter_equivalence.py runs
+the comparison under pytest.
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import distinct, func
+
+from app import crud
+from app.db.base import SessionLocal
+from app.hepler.enum import JobApprovalStatus, JobStatus, JobType, SalaryType
+from app.model import (
+    Campaign,
+    Category,
+    Company,
+    CompanyField,
+    District,
+    Field,
+    Job,
+    JobCategory,
+    WorkLocation,
+)
+
+
+def legacy_filters(query, **filters):
+    """CRUDJob.apply_filters before the semi-joins, without the plain filters"""
+    if filters.get("company_id") or filters.get("field_id"):
+        query = query.join(Campaign, Job.campaign_id == Campaign.id)
+        if filters.get("company_id"):
+            query = query.filter(Campaign.company_id == filters["company_id"])
+        if filters.get("field_id"):
+            query = query.join(Company, Campaign.company_id == Company.id)
+            query = query.join(
+                CompanyField, Company.id == CompanyField.company_id
+            ).filter(CompanyField.field_id == filters["field_id"])
+    if filters.get("province_id"):
+        query = query.filter(WorkLocation.province_id == filters["province_id"])
+    if filters.get("district_id"):
+        query = query.filter(WorkLocation.district_id == filters["district_id"])
+    if filters.get("category_id"):
+        query = query.join(JobCategory, Job.id == JobCategory.job_id).filter(
+            JobCategory.category_id == filters["category_id"]
+        )
+    plain = {
+        key: value
+        for key, value in filters.items()
+        if key
+        not in ("company_id", "field_id", "province_id", "district_id", "category_id")
+    }
+    return crud.job.apply_filters(query, **plain)
+
+
+def legacy_query(db, *entities, **filters):
+    query = db.query(*entities)
+    if filters.get("province_id") or filters.get("district_id"):
+        query = query.join(WorkLocation, Job.id == WorkLocation.job_id)
+    return legacy_filters(query, **filters)
+
+
+def legacy_search(db, **filters):
+    return [
+        job.id
+        for job in legacy_query(db, Job, **filters)
+        .order_by(Job.id.desc())
+        .limit(filters["limit"])
+        .distinct()
+    ]
+
+
+def legacy_districts(db, **filters):
+    query = (
+        db.query(WorkLocation.district_id, func.count(distinct(Job.id)))
+        .join(Job, WorkLocation.job_id == Job.id)
+        .group_by(WorkLocation.district_id)
+    )
+    return sorted(legacy_filters(query, **filters).all())
+
+
+def get_ids(db) -> dict:
+    return {
+        "district": db.query(District.id, District.province_id).all(),
+        "category": [row.id for row in db.query(Category.id)],
+        "company": [row.id for row in db.query(Company.id)],
+        "field": [row.id for row in db.query(Field.id)],
+    }
+
+
+def random_filters(rng: random.Random, ids: dict) -> dict:
+    filters = {
+        "job_status": JobStatus.PUBLISHED,
+        "job_approve_status": JobApprovalStatus.APPROVED,
+        "limit": 50,
+    }
+    options = {
+        "province_id": lambda: province_id,
+        "district_id": lambda: district_id,
+        "category_id": lambda: rng.choice(ids["category"]),
+        "company_id": lambda: rng.choice(ids["company"]),
+        "field_id": lambda: rng.choice(ids["field"]),
+        "employment_type": lambda: rng.choice(list(JobType)),
+        "salary_type": lambda: rng.choice([SalaryType.VND, SalaryType.USD]),
+        "min_salary": lambda: rng.randrange(3, 30) * 1000000,
+        "deadline": lambda: date.today() - timedelta(days=rng.randint(0, 30)),
+        "keyword": lambda: rng.choice(["Developer", "Kế toán", "Senior"]),
+    }
+    district_id, province_id = rng.choice(ids["district"])
+    for key in rng.sample(list(options), k=rng.randint(1, 4)):
+        filters[key] = options[key]()
+    return filters
+
+
+def compare(db, filters: dict) -> list:
+    """The (check, current, legacy) results that differ for the filters"""
+    checks = (
+        (
+            "search",
+            [job.id for job in crud.job.search(db, **filters)],
+            legacy_search(db, **filters),
+        ),
+        (
+            "count",
+            crud.job.count(db, **filters),
+            legacy_query(db, Job, **filters).distinct().count(),
+        ),
+        (
+            "districts",
+            sorted(crud.job.get_number_job_of_district(db, **filters)),
+            legacy_districts(db, **filters),
+        ),
+    )
+    return [check for check in checks if check[1] != check[2]]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mismatches = 0
+    db = SessionLocal()
+    try:
+        ids = get_ids(db)
+        for _ in range(args.cases):
+            filters = random_filters(rng, ids)
+            for name, current, legacy in compare(db, filters):
+                mismatches += 1
+                print(f"MISMATCH {name} {filters}: {current} != {legacy}")
+    finally:
+        db.close()
+    print(f"{args.cases} cases, {mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Benchmark of job serialization time.
+
+Run with: python -m app.bench.job_serialization [number_of_jobs]
+
+Compares building JobItemResponse from native JSON column values against the
+previous read path, which decoded the rich text fields on every serialization.
+"""
+import sys
+import json
+import time
+from datetime import datetime, timedelta
+
+from app.schema.job import JobItemResponse
+from app.hepler.enum import JobStatus
+
+
+def build_job(id: int) -> dict:
+    now = datetime.now()
+    return {
+        "id": id,
+        "campaign_id": id,
+        "title": f"Backend developer {id}",
+        "max_salary": 20000000,
+        "min_salary": 10000000,
+        "job_description": "<p>Develop and maintain services.</p>" * 20,
+        "job_requirement": "<ul><li>3 years of Python</li></ul>" * 20,
+        "job_benefit": "<p>13th month salary, insurance.</p>" * 20,
+        "phone_number_contact": "0323456789",
+        "full_name_contact": "Tung Ong",
+        "email_contact": ["hr@congtyabc.com", "jobs@congtyabc.com"],
+        "deadline": (now + timedelta(days=30)).date(),
+        "job_location": "Ha Noi",
+        "job_position_id": 1,
+        "job_experience_id": 1,
+        "created_at": now,
+        "updated_at": now,
+        "status": JobStatus.PUBLISHED,
+        "locations": [],
+        "categories": [],
+        "working_times": [],
+        "must_have_skills": [],
+        "should_have_skills": [],
+        "company": {},
+    }
+
+
+def encode_legacy(job: dict) -> dict:
+    legacy = dict(job)
+    for key in ["job_description", "job_requirement", "job_benefit", "email_contact"]:
+        legacy[key] = json.dumps(job[key])
+    return legacy
+
+
+def decode_legacy(job: dict) -> dict:
+    for key in ["job_description", "job_requirement", "job_benefit", "email_contact"]:
+        job[key] = json.loads(job[key])
+    return job
+
+
+def run(number_of_jobs: int = 10000):
+    jobs = [build_job(i) for i in range(1, number_of_jobs + 1)]
+    legacy_jobs = [encode_legacy(job) for job in jobs]
+
+    start_time = time.perf_counter()
+    for job in legacy_jobs:
+        JobItemResponse(**decode_legacy(dict(job)))
+    legacy_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for job in jobs:
+        JobItemResponse(**job)
+    native_time = time.perf_counter() - start_time
+
+    print(f"jobs: {number_of_jobs}")
+    print(f"decode on read: {legacy_time / number_of_jobs * 1e6:.2f} us/job")
+    print(f"native json:    {native_time / number_of_jobs * 1e6:.2f} us/job")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
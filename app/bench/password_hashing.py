@@ -0,0 +1,64 @@
+"""
+Load test of login throughput against the rest of the API.
+
+Run with: python -m app.bench.password_hashing [logins] [threads]
+
+Sync endpoints share one thread pool. The test runs a burst of password
+verifications on that pool next to a stream of cheap requests, once with
+bcrypt inline and once through the password hashing process pool, and
+reports login throughput and the latency of the cheap requests.
+"""
+
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.security import (
+    _verify_password,
+    password_hasher,
+    pwd_context,
+    verify_password,
+)
+
+PASSWORD = "@Password1234"
+
+
+def cheap_request() -> float:
+    # Stands in for a sync endpoint doing a little Python work.
+    start = time.perf_counter()
+    sum(i * i for i in range(2000))
+    return time.perf_counter() - start
+
+
+def run(label: str, verify, hashed: str, logins: int, threads: int):
+    latencies = []
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit(verify, PASSWORD, hashed) for _ in range(logins)]
+        while not all(future.done() for future in futures):
+            latencies.append(cheap_request())
+            time.sleep(0.005)
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(
+        f"{label:<10} {logins / elapsed:>7.1f} logins/s  "
+        f"other requests p50 {statistics.median(latencies) * 1e3:>6.2f} ms  "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:>6.2f} ms"
+    )
+
+
+def main(logins: int, threads: int):
+    hashed = pwd_context.hash(PASSWORD)
+    print(f"bcrypt rounds {pwd_context.to_dict()['bcrypt__rounds']}")
+    run("inline", lambda p, h: _verify_password(p, h)[0], hashed, logins, threads)
+    verify_password(PASSWORD, hashed)  # start the pool outside the measure
+    run("pool", verify_password, hashed, logins, threads)
+    password_hasher.close()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+    )
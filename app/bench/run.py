@@ -0,0 +1,263 @@
+"""
+Repeatable benchmark of the public read paths and the auth flows.
+
+Run with: python -m app.bench.run [--requests 200] [--output baseline.json]
+                                  [--compare baseline.json]
+
+Drives the application in-process through httpx's ASGI transport, so no
+server or network is involved, against the database in DATABASE_URL (fill
+it first with app.bench.seed) and an in-memory fakeredis instead of Redis.
+Rate limiting is switched off and the per request query count is read from
+the X-DB-Query-Count header of app.core.query_stats.
+
+Every scenario records p50/p95/p99 latency in milliseconds and the mean
+number of queries per request. --output writes the results as a JSON
+baseline, --compare prints the change against an earlier one. With --cold
+the cache is flushed before each request to measure the database path.
+
+httpx and fakeredis are only needed here, they are not runtime
+dependencies of the API.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+SCENARIOS = (
+    "job_search",
+    "job_search_keyword",
+    "job_list",
+    "job_detail",
+    "company_search",
+    "count_job_by_category",
+    "count_job_by_salary",
+    "user_login",
+    "user_refresh_token",
+    "user_verify_token",
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="per scenario")
+    parser.add_argument("--scenarios", nargs="*", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--cold", action="store_true")
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    parser.add_argument("--seed", type=int, default=2024)
+    return parser.parse_args()
+
+
+def percentile(samples: list, rank: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(rank / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarize(latencies: list, queries: list, errors: int) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "queries_per_request": round(statistics.fmean(queries), 2),
+    }
+
+
+def compare(results: dict, baseline: dict):
+    print(f"{'scenario':24} {'p50':>24} {'p95':>24} {'queries':>20}")
+    for name, current in results["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        cells = []
+        for key in ("p50_ms", "p95_ms", "queries_per_request"):
+            before, after = previous[key], current[key]
+            change = (after - before) / before * 100 if before else 0.0
+            cells.append(f"{before:g}->{after:g} ({change:+.0f}%)")
+        print(f"{name:24} {cells[0]:>24} {cells[1]:>24} {cells[2]:>20}")
+
+
+class Benchmark:
+    def __init__(self, client, redis, args):
+        self.client = client
+        self.redis = redis
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.tokens = {}
+
+    def load_ids(self):
+        from sqlalchemy import func, select
+
+        from app.db.base import engine
+        from app.model import Category, Company, Field, Job, Province, User
+        from app.bench.seed import SEED_EMAIL_DOMAIN
+
+        with engine.connect() as conn:
+
+            def ids(column, limit=1000):
+                return (
+                    conn.execute(select(column).order_by(func.random()).limit(limit))
+                    .scalars()
+                    .all()
+                )
+
+            self.province_ids = ids(Province.id)
+            self.category_ids = ids(Category.id)
+            self.field_ids = ids(Field.id)
+            self.company_ids = ids(Company.id)
+            self.job_ids = ids(Job.id)
+            self.emails = ids(User.email)
+        self.emails = [email for email in self.emails if SEED_EMAIL_DOMAIN in email]
+        if not (self.job_ids and self.emails):
+            sys.exit("No seeded data, run python -m app.bench.seed first.")
+
+    def request(self, name: str):
+        pick = self.random.choice
+        if name == "job_search":
+            return (
+                "GET",
+                "/v1/api/job/search",
+                {
+                    "params": {
+                        "province_id": pick(self.province_ids),
+                        "category_id": pick(self.category_ids),
+                        "limit": 10,
+                    }
+                },
+            )
+        if name == "job_search_keyword":
+            return (
+                "GET",
+                "/v1/api/job/search",
+                {
+                    "params": {
+                        "keyword": pick(["Developer", "Kế toán", "QA"]),
+                        "limit": 10,
+                    }
+                },
+            )
+        if name == "job_list":
+            return (
+                "GET",
+                "/v1/api/job",
+                {"params": {"company_id": pick(self.company_ids), "limit": 10}},
+            )
+        if name == "job_detail":
+            return "GET", f"/v1/api/job/{pick(self.job_ids)}", {}
+        if name == "company_search":
+            return (
+                "GET",
+                "/v1/api/company/search",
+                {"params": {"fields": [pick(self.field_ids)], "limit": 10}},
+            )
+        if name == "count_job_by_category":
+            return "GET", "/v1/api/job/count_job_by_category", {}
+        if name == "count_job_by_salary":
+            return "GET", "/v1/api/job/count_job_by_salary", {}
+        if name == "user_login":
+            from app.bench.seed import SEED_PASSWORD
+
+            return (
+                "POST",
+                "/v1/api/user/login",
+                {"json": {"email": pick(self.emails), "password": SEED_PASSWORD}},
+            )
+        token_type = "refresh_token" if name == "user_refresh_token" else "access_token"
+        path = "/refresh_token" if name == "user_refresh_token" else "/verify_token"
+        return (
+            "POST",
+            f"/v1/api/user{path}",
+            {"headers": {"Authorization": f"Bearer {self.tokens[token_type]}"}},
+        )
+
+    async def login(self):
+        from app.bench.seed import SEED_PASSWORD
+
+        response = await self.client.post(
+            "/v1/api/user/login",
+            json={"email": self.emails[0], "password": SEED_PASSWORD},
+        )
+        response.raise_for_status()
+        self.tokens = response.json()["data"]
+
+    async def run_scenario(self, name: str) -> dict:
+        latencies, queries, errors = [], [], 0
+        for i in range(self.args.warmup + self.args.requests):
+            method, path, kwargs = self.request(name)
+            if self.args.cold:
+                await self.redis.flushall()
+            start = time.perf_counter()
+            response = await self.client.request(method, path, **kwargs)
+            elapsed = (time.perf_counter() - start) * 1000
+            if i < self.args.warmup:
+                continue
+            latencies.append(elapsed)
+            queries.append(int(response.headers.get("X-DB-Query-Count", 0)))
+            errors += response.status_code >= 400
+        return summarize(latencies, queries, errors)
+
+    async def run(self) -> dict:
+        self.load_ids()
+        await self.login()
+        results = {}
+        for name in self.args.scenarios:
+            results[name] = await self.run_scenario(name)
+            print(name, json.dumps(results[name]), flush=True)
+        return results
+
+
+async def main(args) -> dict:
+    import fakeredis
+    import httpx
+
+    from app.core.config import settings
+    from app.core.security import password_hasher
+    from app.db.base import engine
+    from app.main import app
+    from app.storage.redis import RedisBackend, redis_dependency
+
+    backend = RedisBackend.__new__(RedisBackend)
+    backend.expire = settings.REDIS_EXPIRE
+    backend.scripts = {}
+    backend.connection = fakeredis.aioredis.FakeRedis()
+    redis_dependency.redis = backend
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            scenarios = await Benchmark(client, backend.connection, args).run()
+    finally:
+        password_hasher.close()
+    return {
+        "database": engine.url.render_as_string(hide_password=True),
+        "cold": args.cold,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scenarios": scenarios,
+    }
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ["SQL_DEBUG_HEADERS"] = "true"
+    # The per request N+1 warnings would drown the results.
+    logging.getLogger("app.core.query_stats").setLevel(logging.ERROR)
+    results = asyncio.run(main(arguments))
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            compare(results, json.load(file))
@@ -0,0 +1,448 @@
+"""
+Synthetic dataset generator for benchmarks.
+
+Run with: python -m app.bench.seed [--jobs 1000000] [--companies 20000] ...
+
+Fills the schema with provinces and districts, businesses with their
+companies and fields, campaigns, and jobs with their work locations,
+categories, skills and approval requests. Rows are written with Core bulk
+inserts in batches, so the ORM events that normally maintain the approval
+request, company_business and field.count rows do not fire; the generator
+writes those rows itself and recomputes the counters at the end.
+
+Ids are allocated after the current maximum of each table, so the seed can
+be run on top of an existing database. Point DATABASE_URL at a local MySQL
+or at SQLite (DATABASE_URL=sqlite:///bench.db, tables are created with
+--create-tables) to keep the benchmark away from shared data. Every
+generated account uses the password in SEED_PASSWORD.
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import func, select, update
+
+from app.db.base import engine
+from app.db.base_class import Base
+from app.core.security import get_password_hash
+from app.hepler.enum import (
+    CompanyType,
+    Gender,
+    JobApprovalStatus,
+    JobStatus,
+    JobType,
+    Role,
+    SalaryType,
+    TypeAccount,
+)
+from app.model import (
+    Business,
+    Campaign,
+    Category,
+    Company,
+    CompanyBusiness,
+    CompanyField,
+    District,
+    Field,
+    GroupPosition,
+    Job,
+    JobApprovalRequest,
+    JobCategory,
+    JobExperience,
+    JobPosition,
+    JobSkill,
+    ManagerBase,
+    Province,
+    Skill,
+    User,
+    WorkLocation,
+)
+
+SEED_PASSWORD = "@Password1234"
+SEED_EMAIL_DOMAIN = "seed.tvnow.vn"
+
+TITLES = [
+    "Backend Developer",
+    "Frontend Developer",
+    "Data Engineer",
+    "Kế toán tổng hợp",
+    "Nhân viên kinh doanh",
+    "Chăm sóc khách hàng",
+    "Marketing Executive",
+    "QA Engineer",
+    "Thiết kế đồ họa",
+    "Nhân viên hành chính",
+]
+LEVELS = ["Junior", "Senior", "Intern", "Lead", "Trưởng nhóm", "Chuyên viên"]
+EXPERIENCES = [(0, 0), (0, 1), (1, 2), (2, 3), (3, 5), (5, 10)]
+NAMES = [
+    "Nguyễn Văn An",
+    "Trần Thị Bình",
+    "Lê Minh Châu",
+    "Phạm Quốc Dũng",
+    "Hoàng Thu Hà",
+]
+SCALES = ["1-9", "10-24", "25-99", "100-499", "500-1000", "1000+"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--provinces", type=int, default=63)
+    parser.add_argument("--districts", type=int, default=12, help="per province")
+    parser.add_argument("--categories", type=int, default=60)
+    parser.add_argument("--fields", type=int, default=40)
+    parser.add_argument("--skills", type=int, default=300)
+    parser.add_argument("--positions", type=int, default=120)
+    parser.add_argument("--companies", type=int, default=20000)
+    parser.add_argument("--campaigns", type=int, default=3, help="per company")
+    parser.add_argument("--jobs", type=int, default=1000000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--approved-ratio", type=float, default=0.85)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument(
+        "--create-tables",
+        action="store_true",
+        help="Create missing tables from the models (SQLite).",
+    )
+    return parser.parse_args()
+
+
+class Seeder:
+    def __init__(self, conn, args):
+        self.conn = conn
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.today = date.today()
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.hashed_password = get_password_hash(SEED_PASSWORD)
+
+    def next_id(self, model) -> int:
+        return (self.conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+    def insert(self, model, rows):
+        if rows:
+            self.conn.execute(model.__table__.insert(), rows)
+
+    def insert_batches(self, model, rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.args.batch_size:
+                self.insert(model, batch)
+                batch = []
+        self.insert(model, batch)
+
+    def named(self, model, count: int, prefix: str, **extra):
+        start = self.next_id(model)
+        rows = [
+            {
+                "id": start + i,
+                "name": f"{prefix} {start + i}",
+                "slug": f"{prefix.lower()}-{start + i}",
+                **extra,
+            }
+            for i in range(count)
+        ]
+        self.insert(model, rows)
+        return [row["id"] for row in rows]
+
+    def seed_locations(self):
+        province_start = self.next_id(Province)
+        district_start = self.next_id(District)
+        provinces = []
+        districts = []
+        for i in range(self.args.provinces):
+            province_id = province_start + i
+            provinces.append(
+                {
+                    "id": province_id,
+                    "name": f"Tỉnh {province_id}",
+                    "code": f"P{province_id}",
+                    "name_with_type": f"Tỉnh Seed {province_id}",
+                    "slug": f"tinh-{province_id}",
+                    "type": "tinh",
+                }
+            )
+            for j in range(self.args.districts):
+                district_id = district_start + len(districts)
+                districts.append(
+                    {
+                        "id": district_id,
+                        "name": f"Quận {district_id}",
+                        "code": f"D{district_id}",
+                        "name_with_type": f"Quận Seed {district_id}",
+                        "slug": f"quan-{district_id}",
+                        "type": "quan",
+                        "province_id": province_id,
+                    }
+                )
+        self.insert(Province, provinces)
+        self.insert_batches(District, districts)
+        self.districts = [(row["province_id"], row["id"]) for row in districts]
+
+    def seed_catalog(self):
+        self.category_ids = self.named(Category, self.args.categories, "Category")
+        self.field_ids = self.named(Field, self.args.fields, "Field")
+        self.skill_ids = self.named(Skill, self.args.skills, "Skill")
+        group_ids = self.named(
+            GroupPosition, max(self.args.positions // 10, 1), "Group"
+        )
+        position_start = self.next_id(JobPosition)
+        positions = [
+            {
+                "id": position_start + i,
+                "name": f"Position {position_start + i}",
+                "slug": f"position-{position_start + i}",
+                "group_position_id": self.random.choice(group_ids),
+            }
+            for i in range(self.args.positions)
+        ]
+        self.insert(JobPosition, positions)
+        self.position_ids = [row["id"] for row in positions]
+        experience_start = self.next_id(JobExperience)
+        experiences = [
+            {
+                "id": experience_start + i,
+                "title": f"{from_year} - {to_year} năm",
+                "from_year": from_year,
+                "to_year": to_year,
+            }
+            for i, (from_year, to_year) in enumerate(EXPERIENCES)
+        ]
+        self.insert(JobExperience, experiences)
+        self.experience_ids = [row["id"] for row in experiences]
+
+    def seed_companies(self):
+        business_start = self.next_id(ManagerBase)
+        company_start = self.next_id(Company)
+        campaign_start = self.next_id(Campaign)
+        managers, businesses, companies, links, fields, campaigns = (
+            [],
+            [],
+            [],
+            [],
+            [],
+            [],
+        )
+        self.campaigns = []
+        for i in range(self.args.companies):
+            business_id = business_start + i
+            company_id = company_start + i
+            province_id, district_id = self.random.choice(self.districts)
+            managers.append(
+                {
+                    "id": business_id,
+                    "full_name": self.random.choice(NAMES),
+                    "email": f"business{business_id}@{SEED_EMAIL_DOMAIN}",
+                    "hashed_password": self.hashed_password,
+                    "role": Role.BUSINESS,
+                    "type_account": TypeAccount.BUSINESS,
+                }
+            )
+            businesses.append(
+                {
+                    "id": business_id,
+                    "province_id": province_id,
+                    "district_id": district_id,
+                    "phone_number": f"09{business_id:08d}"[-10:],
+                    "gender": self.random.choice(list(Gender)),
+                    "company_name": f"Công ty {company_id}",
+                    "work_position": "HR",
+                    "is_verified_email": True,
+                }
+            )
+            companies.append(
+                {
+                    "id": company_id,
+                    "name": f"Công ty {company_id}",
+                    "email": f"company{company_id}@{SEED_EMAIL_DOMAIN}",
+                    "type": CompanyType.COMPANY,
+                    "address": f"{company_id} Đường Seed",
+                    "phone_number": f"02{company_id:08d}"[-10:],
+                    "scale": self.random.choice(SCALES),
+                    "tax_code": f"{company_id:010d}",
+                    "is_verified": self.random.random() < 0.5,
+                    "business_id": business_id,
+                }
+            )
+            links.append({"business_id": business_id, "company_id": company_id})
+            for field_id in self.random.sample(
+                self.field_ids, k=min(self.random.randint(1, 3), len(self.field_ids))
+            ):
+                fields.append({"company_id": company_id, "field_id": field_id})
+            for _ in range(self.args.campaigns):
+                campaign_id = campaign_start + len(campaigns)
+                campaigns.append(
+                    {
+                        "id": campaign_id,
+                        "title": f"Campaign {campaign_id}",
+                        "business_id": business_id,
+                        "company_id": company_id,
+                    }
+                )
+                self.campaigns.append((business_id, campaign_id))
+        self.insert_batches(ManagerBase, managers)
+        self.insert_batches(Business, businesses)
+        self.insert_batches(Company, companies)
+        self.insert_batches(CompanyBusiness, links)
+        self.insert_batches(CompanyField, fields)
+        self.insert_batches(Campaign, campaigns)
+
+    def seed_users(self):
+        start = self.next_id(User)
+        self.insert_batches(
+            User,
+            (
+                {
+                    "id": start + i,
+                    "full_name": self.random.choice(NAMES),
+                    "email": f"user{start + i}@{SEED_EMAIL_DOMAIN}",
+                    "hashed_password": self.hashed_password,
+                    "is_verified": True,
+                }
+                for i in range(self.args.users)
+            ),
+        )
+
+    def job_row(self, job_id: int, approved: bool) -> dict:
+        business_id, campaign_id = self.random.choice(self.campaigns)
+        salary_type = self.random.choices(list(SalaryType), weights=(75, 10, 15))[0]
+        min_salary = max_salary = 0
+        if salary_type != SalaryType.DEAL:
+            min_salary = self.random.randrange(3, 40) * 1000000
+            max_salary = min_salary + self.random.randrange(1, 20) * 1000000
+        title = f"{self.random.choice(LEVELS)} {self.random.choice(TITLES)}"
+        return {
+            "id": job_id,
+            "business_id": business_id,
+            "campaign_id": campaign_id,
+            "job_experience_id": self.random.choice(self.experience_ids),
+            "job_position_id": self.random.choice(self.position_ids),
+            "title": title,
+            "job_description": f"Mô tả công việc {title}",
+            "job_requirement": "Yêu cầu ứng viên",
+            "job_benefit": "Quyền lợi",
+            "job_location": "Seed",
+            "min_salary": min_salary,
+            "max_salary": max_salary,
+            "salary_type": salary_type,
+            "quantity": self.random.randint(1, 10),
+            "full_name_contact": "Seed Contact",
+            "phone_number_contact": "0323456789",
+            "email_contact": [f"hr{business_id}@{SEED_EMAIL_DOMAIN}"],
+            "status": JobStatus.PUBLISHED if approved else JobStatus.PENDING,
+            "employment_type": self.random.choice(list(JobType)),
+            "gender_requirement": Gender.OTHER,
+            "deadline": self.today + timedelta(days=self.random.randint(-30, 90)),
+        }
+
+    def seed_jobs(self):
+        start = self.next_id(Job)
+        size = self.args.batch_size
+        for offset in range(0, self.args.jobs, size):
+            jobs, approvals, locations, categories, skills = [], [], [], [], []
+            for job_id in range(
+                start + offset, start + min(offset + size, self.args.jobs)
+            ):
+                approved = self.random.random() < self.args.approved_ratio
+                approval = {
+                    "status": (
+                        JobApprovalStatus.APPROVED
+                        if approved
+                        else JobApprovalStatus.PENDING
+                    ),
+                    "updated_at": None,
+                }
+                if approved:
+                    approval["updated_at"] = self.now - timedelta(
+                        minutes=self.random.randint(0, 60 * 24 * 60)
+                    )
+                jobs.append(
+                    {
+                        **self.job_row(job_id, approved),
+                        "approval_status": approval["status"],
+                        "approved_at": approval["updated_at"],
+                    }
+                )
+                approvals.append({"job_id": job_id, **approval})
+                for province_id, district_id in self.random.sample(
+                    self.districts, k=self.random.randint(1, 2)
+                ):
+                    locations.append(
+                        {
+                            "job_id": job_id,
+                            "province_id": province_id,
+                            "district_id": district_id,
+                        }
+                    )
+                for category_id in self.random.sample(
+                    self.category_ids, k=self.random.randint(1, 3)
+                ):
+                    categories.append({"job_id": job_id, "category_id": category_id})
+                for skill_id in self.random.sample(
+                    self.skill_ids, k=self.random.randint(2, 5)
+                ):
+                    skills.append({"job_id": job_id, "skill_id": skill_id})
+            self.insert(Job, jobs)
+            self.insert(JobApprovalRequest, approvals)
+            self.insert(WorkLocation, locations)
+            self.insert(JobCategory, categories)
+            self.insert(JobSkill, skills)
+            self.conn.commit()
+            print(f"jobs: {offset + len(jobs)}/{self.args.jobs}", flush=True)
+
+    def refresh_counters(self):
+        # Category and position counts only include published jobs, as the
+        # Job.status events maintain them.
+        published = select(Job.id).where(Job.status == JobStatus.PUBLISHED)
+        counters = (
+            (Field, select(func.count(CompanyField.id)), CompanyField.field_id),
+            (
+                Category,
+                select(func.count(JobCategory.id)).where(
+                    JobCategory.job_id.in_(published)
+                ),
+                JobCategory.category_id,
+            ),
+            (
+                JobPosition,
+                select(func.count(Job.id)).where(Job.status == JobStatus.PUBLISHED),
+                Job.job_position_id,
+            ),
+        )
+        for model, count, column in counters:
+            self.conn.execute(
+                update(model).values(
+                    count=count.where(column == model.id).scalar_subquery()
+                )
+            )
+
+    def run(self):
+        steps = (
+            ("locations", self.seed_locations),
+            ("catalog", self.seed_catalog),
+            ("companies", self.seed_companies),
+            ("users", self.seed_users),
+            ("jobs", self.seed_jobs),
+            ("counters", self.refresh_counters),
+        )
+        for name, step in steps:
+            start = time.perf_counter()
+            step()
+            self.conn.commit()
+            print(f"{name}: {time.perf_counter() - start:.1f}s", flush=True)
+
+
+def main():
+    args = parse_args()
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        Seeder(conn, args).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,108 @@
 from sqlalchemy.orm import Session
 import jwt
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, Depends
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional
 
 from app.hepler.enum import TokenType
 from app.schema.token import TokenPayload
 from app.core.security import pwd_context
 from app.core.config import settings
+from app.core import constant
 from app.db.base_class import Base
 from pydantic import BaseModel
 
-
 ACCESS_TOKEN_EXPIRE = settings.ACCESS_TOKEN_EXPIRE
 REFRESH_TOKEN_EXPIRE = settings.REFRESH_TOKEN_EXPIRE
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = settings.SECURITY_ALGORITHM
 
 
-def signJWT(payload: Union[Base, Dict[str, Any], BaseModel]):
-    iat = datetime.now(timezone.utc)
-    exp = iat + timedelta(seconds=ACCESS_TOKEN_EXPIRE)
-    if isinstance(payload, Base):
-        payload = payload.__dict__
-        payload.update({"iat": iat, "exp": exp, "type": TokenType.ACCESS.value})
-    elif isinstance(payload, BaseModel):
+def build_payload(
+    payload: Union[Base, Dict[str, Any], BaseModel], token_type: TokenType, expire: int
+) -> dict:
+    """Only the claims JWTBearer consumers need, not every column of the row"""
+    if isinstance(payload, BaseModel):
         payload = payload.model_dump()
-        payload.update({"iat": iat, "exp": exp, "type": TokenType.ACCESS.value})
-    data = TokenPayload(**payload)
-    access_token = jwt.encode(data.model_dump(), SECRET_KEY, algorithm=ALGORITHM)
+    elif not isinstance(payload, dict):
+        payload = {
+            "id": payload.id,
+            "role": payload.role,
+            "type_account": payload.type_account,
+        }
+    iat = datetime.now(timezone.utc)
+    data = TokenPayload(
+        **{
+            **payload,
+            "type": token_type.value,
+            "jti": uuid.uuid4().hex,
+            "iat": iat,
+            "exp": iat + timedelta(seconds=expire),
+        }
+    )
+    return data.model_dump()
+
+
+def signJWT(payload: Union[Base, Dict[str, Any], BaseModel]):
+    data = build_payload(payload, TokenType.ACCESS, ACCESS_TOKEN_EXPIRE)
+    access_token = jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
     return access_token
 
 
 def signJWTRefreshToken(payload: Union[Base, Dict[str, Any], BaseModel]):
-    iat = datetime.now(timezone.utc)
-    exp = iat + timedelta(seconds=REFRESH_TOKEN_EXPIRE)
-    if isinstance(payload, Base):
-        payload = payload.__dict__
-        payload.update({"iat": iat, "exp": exp, "type": TokenType.REFRESH.value})
-    elif isinstance(payload, BaseModel):
-        payload = payload.model_dump()
-        payload.update({"iat": iat, "exp": exp, "type": TokenType.REFRESH.value})
-    data = TokenPayload(**payload)
-    refresh_token = jwt.encode(data.model_dump(), SECRET_KEY, algorithm=ALGORITHM)
+    data = build_payload(payload, TokenType.REFRESH, REFRESH_TOKEN_EXPIRE)
+    refresh_token = jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
     return refresh_token
 
 
+class VerifiedTokenCache:
+    """
+    LRU of tokens whose signature was already checked.
+
+    Entries are keyed by the token itself, the dict hashes it and compares it
+    on lookup, so only the exact same token hits. An entry is dropped once
+    the token expires, so the cache never outlives the exp claim.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.tokens = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[dict]:
+        with self.lock:
+            payload = self.tokens.get(token)
+            if payload is None:
+                return None
+            if payload["exp"] <= time.time():
+                del self.tokens[token]
+                return None
+            self.tokens.move_to_end(token)
+            return dict(payload)
+
+    def set(self, token: str, payload: dict):
+        with self.lock:
+            self.tokens[token] = payload
+            self.tokens.move_to_end(token)
+            if len(self.tokens) > self.max_size:
+                self.tokens.popitem(last=False)
+
+
+verified_tokens = VerifiedTokenCache(constant.TOKEN_CACHE_SIZE)
+
+
 def decodeJWT(token: str):
+    payload = verified_tokens.get(token)
+    if payload is not None:
+        return payload
     try:
         decode_token = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return decode_token
     except:
         return {}
+    if isinstance(decode_token.get("exp"), (int, float)):
+        verified_tokens.set(token, decode_token)
+    return dict(decode_token)
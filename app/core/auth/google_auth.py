@@ -0,0 +1,114 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from typing import Optional
+
+import jwt
+from jwt.algorithms import RSAAlgorithm
+
+from app.core import constant
+from app.core.config import settings
+from app.core.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+
+class GoogleJWKS:
+    """
+    Google signing keys cached for the max-age Google sends with them.
+
+    A background task refreshes the keys shortly before they expire, so
+    verifying an ID token normally needs no network call. An unknown kid
+    forces one refresh, at most every JWKS_MIN_REFRESH_INTERVAL seconds.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        self.keys = {}
+        self.expires_at = 0.0
+        self.refreshed_at = 0.0
+        self.lock = asyncio.Lock()
+        self.task: Optional[asyncio.Task] = None
+
+    async def refresh(self):
+        async with self.lock:
+            response = await http_client.client.get(self.url)
+            response.raise_for_status()
+            self.keys = {
+                key["kid"]: RSAAlgorithm.from_jwk(json.dumps(key))
+                for key in response.json()["keys"]
+            }
+            match = re.search(
+                r"max-age=(\d+)", response.headers.get("Cache-Control", "")
+            )
+            max_age = int(match.group(1)) if match else constant.JWKS_DEFAULT_MAX_AGE
+            self.refreshed_at = time.monotonic()
+            self.expires_at = self.refreshed_at + max_age
+
+    async def get_key(self, kid: str):
+        now = time.monotonic()
+        stale = now >= self.expires_at
+        unknown = kid not in self.keys
+        throttled = now - self.refreshed_at < constant.JWKS_MIN_REFRESH_INTERVAL
+        if stale or (unknown and not throttled):
+            await self.refresh()
+        return self.keys.get(kid)
+
+    async def run(self):
+        while True:
+            try:
+                if time.monotonic() >= self.expires_at - constant.JWKS_REFRESH_MARGIN:
+                    await self.refresh()
+                delay = self.expires_at - constant.JWKS_REFRESH_MARGIN
+                delay -= time.monotonic()
+            except Exception as e:
+                logger.warning("Refresh Google JWKS failed: %s", e)
+                delay = constant.JWKS_MIN_REFRESH_INTERVAL
+            await asyncio.sleep(max(delay, constant.JWKS_MIN_REFRESH_INTERVAL))
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+
+google_jwks = GoogleJWKS(settings.GOOGLE_JWKS_URI)
+
+
+async def verify_google_id_token(token: str) -> Optional[dict]:
+    """Claims of a Google ID token issued to this app, None when invalid"""
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = await google_jwks.get_key(kid)
+        if key is None:
+            return None
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=settings.GOOGLE_CLIENT_ID,
+        )
+    except jwt.PyJWTError:
+        return None
+    if claims.get("iss") not in constant.GOOGLE_ISSUERS:
+        return None
+    if not claims.get("email_verified"):
+        return None
+    return claims
+
+
+async def get_google_user_info(access_token: str) -> Optional[dict]:
+    """Fallback for clients that still send an OAuth access token"""
+    response = await http_client.client.get(
+        constant.GOOGLE_GET_USER_INFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    if response.status_code != 200:
+        return None
+    return response.json()
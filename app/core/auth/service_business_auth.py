@@ -4,7 +4,7 @@ from fastapi import HTTPException, Depends
 from typing import List
 
 from app.core import constant
-from app.core.security import pwd_context
+from app.core.security import verify_password, verify_and_update_password
 from app import crud
 from app.schema import (
     auth as schema_auth,
@@ -27,8 +27,15 @@ def authenticate(db: Session, data: dict):
     user = crud.manager_base.get_by_email(db, user_data.email)
     if not user:
         return constant.ERROR, 404, "User not found"
-    if not verify_password(user_data.password, user.hashed_password):
+    verified, new_hash = verify_and_update_password(
+        user_data.password, user.hashed_password
+    )
+    if not verified:
         return constant.ERROR, 401, "Incorrect password"
+    if new_hash:
+        user = crud.manager_base.update(
+            db, db_obj=user, obj_in={"hashed_password": new_hash}
+        )
 
     access_token = signJWT(user)
     refresh_token = signJWTRefreshToken(user)
@@ -58,10 +65,6 @@ def authenticate(db: Session, data: dict):
     return response
 
 
-def verify_password(password: str, hashed_password: str):
-    return pwd_context.verify(password, hashed_password)
-
-
 def get_current_active_user(email: str):
     pass
 
@@ -1,10 +1,11 @@
+import asyncio
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 from fastapi import HTTPException, Depends
-import requests
+import httpx
 
 from app.core import constant
-from app.core.security import pwd_context
+from app.core.security import verify_password, verify_and_update_password
 from app import crud
 from app.schema import (
     user as schema_user,
@@ -14,6 +15,7 @@ from app.schema import (
 from app.db.base import get_db
 from app.core.auth.auth_bearer import JWTBearer
 from app.core.auth.auth_handler import signJWT, decodeJWT, signJWTRefreshToken
+from app.core.auth.google_auth import verify_google_id_token, get_google_user_info
 from app.hepler.enum import Role, TypeAccount
 from app.hepler.exception_handler import get_message_validation_error
 from app.hepler.enum import Role, TypeAccount, Provider
@@ -27,8 +29,13 @@ def authenticate(db: Session, data: dict):
     user = crud.user.get_by_email(db, user_data.email)
     if not user:
         return constant.ERROR, 404, "User not found"
-    if not verify_password(user_data.password, user.hashed_password):
+    verified, new_hash = verify_and_update_password(
+        user_data.password, user.hashed_password
+    )
+    if not verified:
         return constant.ERROR, 401, "Incorrect password"
+    if new_hash:
+        user = crud.user.update(db, db_obj=user, obj_in={"hashed_password": new_hash})
 
     access_token = signJWT(user)
     refresh_token = signJWTRefreshToken(user)
@@ -42,26 +49,36 @@ def authenticate(db: Session, data: dict):
     return response
 
 
-def authenticate_google(db: Session, data: dict):
+async def authenticate_google(db: Session, data: dict):
+    id_token = data.get("id_token")
     token = data.get("access_token")
-    if token is None:
+    if id_token is None and token is None:
         return constant.ERROR, 400, "Token is required"
-    url = f"{constant.GOOGLE_GET_USER_INFO_URL}{token}"
-    response = requests.get(url)
-    if response.status_code != 200:
+    try:
+        if id_token:
+            data = await verify_google_id_token(id_token)
+        else:
+            data = await get_google_user_info(token)
+    except httpx.HTTPError:
+        return constant.ERROR, 503, "Google is unavailable"
+    if data is None:
         return constant.ERROR, 400, "Invalid token"
-    data = response.json()
-    email = data.get("email")
-    if email is None:
+    if data.get("email") is None:
         return constant.ERROR, 400, "Invalid token"
-    social_network = crud.social_network.get_by_email(db, email)
+    # The handler is async, the session is only used off the event loop.
+    return await asyncio.to_thread(login_social_network, db, data, token)
+
+
+def login_social_network(db: Session, data: dict, token: str = None):
+    social_network = crud.social_network.get_by_email(db, data["email"])
     if not social_network:
         data = schema_social_network.SocialNetworkCreateRequest(
             **data,
             type=Provider.GOOGLE,
-            social_id=data.get("id"),
+            social_id=data.get("sub") or data.get("id"),
             full_name=data.get("name"),
             avatar=data.get("picture"),
+            # ID token logins come without a Google access token.
             access_token=token,
         )
         social_network = crud.social_network.create(db=db, obj_in=data)
@@ -87,10 +104,6 @@ def authenticate_google(db: Session, data: dict):
     return response
 
 
-def verify_password(password: str, hashed_password: str):
-    return pwd_context.verify(password, hashed_password)
-
-
 def get_current_active_user(username: str):
     pass
 
@@ -138,8 +151,7 @@ def refresh_token(db: Session, request):
     token_decode = decodeJWT(refresh_token)
     if token_decode["type"] != "refresh_token":
         return constant.ERROR, 401, "Invalid token"
-    email = token_decode["email"]
-    user = crud.user.get_by_email(db, email)
+    user = crud.user.get(db, token_decode["id"])
     if user is None:
         return constant.ERROR, 404, "User not found"
 
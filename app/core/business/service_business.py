@@ -16,9 +16,10 @@ from app.schema import (
 )
 from app.core.auth.service_business_auth import signJWT, signJWTRefreshToken
 from app.hepler.exception_handler import get_message_validation_error
-from app.hepler.enum import Role
+from app.hepler.enum import Role, FolderBucket
 from app.core.company import service_company
 from app.storage.s3 import s3_service
+from app.storage.image import image_processor
 
 
 def get_me(db: Session, current_user):
@@ -76,11 +77,6 @@ def create(db: Session, data: dict):
     manager_base = manager_baseCRUD.get_by_email(db, manager_base_data.email)
     if manager_base:
         return constant.ERROR, 409, "Email already registered"
-    avatar = manager_base_data.avatar
-    if avatar:
-        key = avatar.filename
-        s3_service.upload_file(avatar, key)
-        manager_base_data.avatar = key
     province = provinceCRUD.get(db, business_data.province_id)
     if not province:
         return constant.ERROR, 404, "Province not found"
@@ -89,18 +85,35 @@ def create(db: Session, data: dict):
         districts = province.district
         if district not in districts:
             return constant.ERROR, 404, "District not found"
+    avatar = manager_base_data.avatar
+    key = s3_service.content_key(avatar, FolderBucket.AVATAR.value) if avatar else None
+    if avatar:
+        manager_base_data.avatar = key
 
-    manager_base = manager_baseCRUD.create(
-        db,
-        obj_in=manager_base_data,
-    )
-
-    business_input = dict(business_data)
-    business_input["id"] = manager_base.id
-    business = businessCRUD.create(
-        db,
-        obj_in=business_input,
-    )
+    upload = s3_service.upload_file_background(avatar, key) if avatar else None
+    try:
+        manager_base = manager_baseCRUD.create(
+            db,
+            obj_in=manager_base_data,
+        )
+
+        business_input = dict(business_data)
+        business_input["id"] = manager_base.id
+        business = businessCRUD.create(
+            db,
+            obj_in=business_input,
+        )
+    except Exception:
+        if upload:
+            upload.discard()
+        raise
+    if upload and not upload.succeeded():
+        manager_baseCRUD.remove(db, id=manager_base.id)
+        return constant.ERROR, 500, "Upload avatar failed"
+    if avatar:
+        image_processor.generate_from_file(
+            avatar, manager_baseCRUD.model, manager_base.id, "avatar", key
+        )
 
     business_response = get_info_user(db, manager_base)
     access_token = signJWT(manager_base)
@@ -127,11 +140,6 @@ def update(db: Session, data: dict, current_user):
     except Exception as e:
         error = [f'{error["loc"][0]}: {error["msg"]}' for error in e.errors()]
         return constant.ERROR, 400, error
-    avatar = manager_base.avatar
-    if avatar:
-        key = avatar.filename
-        s3_service.upload_file(avatar, key)
-        manager_base.avatar = key
     if business.province_id:
         province = provinceCRUD.get(db, business.province_id)
         if not province:
@@ -142,11 +150,39 @@ def update(db: Session, data: dict, current_user):
         districts = province.district
         if district not in districts:
             return constant.ERROR, 404, "District not found"
-
-    manager_base = manager_baseCRUD.update(
-        db=db, db_obj=current_user, obj_in=manager_base
+    old_avatar, old_avatar_thumbnail = (
+        current_user.avatar,
+        current_user.avatar_thumbnail,
     )
-    business = businessCRUD.update(db=db, db_obj=current_user.business, obj_in=business)
+    avatar = manager_base.avatar
+    key = s3_service.content_key(avatar, FolderBucket.AVATAR.value) if avatar else None
+    if avatar:
+        manager_base.avatar = key
+        current_user.avatar_thumbnail = None
+
+    upload = s3_service.upload_file_background(avatar, key) if avatar else None
+    try:
+        manager_base = manager_baseCRUD.update(
+            db=db, db_obj=current_user, obj_in=manager_base
+        )
+        business = businessCRUD.update(
+            db=db, db_obj=current_user.business, obj_in=business
+        )
+    except Exception:
+        if upload:
+            upload.discard()
+        raise
+    if upload and not upload.succeeded():
+        manager_base.avatar, manager_base.avatar_thumbnail = (
+            old_avatar,
+            old_avatar_thumbnail,
+        )
+        db.commit()
+        return constant.ERROR, 500, "Upload avatar failed"
+    if avatar:
+        image_processor.generate_from_file(
+            avatar, manager_baseCRUD.model, manager_base.id, "avatar", key
+        )
     business_response = get_info_user(db, manager_base)
 
     return constant.SUCCESS, 200, business_response
@@ -37,17 +37,7 @@ def get(db: Session, data: dict, current_user):
             return constant.ERROR, 403, "Permission denied"
         page.business_id = business_id
         page.company_id = company.id
-        campaigns = campaignCRUD.get_multi(db, **page.model_dump())
-        count_pagination = schema_campaign.CountGetListPagination(**page.model_dump())
-        count = campaignCRUD.count(
-            db,
-            **count_pagination.model_dump(),
-        )
-    else:
-        campaigns = campaignCRUD.get_multi(db, **page.model_dump())
-        count = campaignCRUD.count(
-            db, **schema_campaign.CountGetListPagination(**data).model_dump()
-        )
+    campaigns, count = campaignCRUD.get_page(db, **page.model_dump())
     campaigns_response = [get_campaign_info(db, campaign) for campaign in campaigns]
     return constant.SUCCESS, 200, {"count": count, "campaigns": campaigns_response}
 
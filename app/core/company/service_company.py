@@ -8,10 +8,11 @@ from app.schema import (
     company as schema_company,
     field as schema_field,
 )
-from app.hepler.enum import Role
+from app.hepler.enum import Role, FolderBucket
 from app.core import constant
 from app.hepler.exception_handler import get_message_validation_error
 from app.storage.s3 import s3_service
+from app.storage.image import image_processor
 from app.core.auth import service_business_auth
 from app.core.field import service_field
 from app.core.job import service_job
@@ -98,9 +99,8 @@ def create(db: Session, data: dict, current_user):
         service_field.check_fields_exist(db, fields)
 
     logo = company_data.logo
+    key = s3_service.content_key(logo, FolderBucket.LOGO.value) if logo else None
     if logo:
-        key = logo.filename
-        s3_service.upload_file(logo, key)
         company_data.logo = key
 
     if current_user.role == Role.BUSINESS:
@@ -109,9 +109,23 @@ def create(db: Session, data: dict, current_user):
             "business_id": current_user.id,
         }
     obj_in = schema_company.CompanyCreate(**company_data)
-    company = companyCRUD.create(db, obj_in=obj_in)
-    if fields:
-        service_field.create_fields_company(db, company.id, fields)
+
+    upload = s3_service.upload_file_background(logo, key) if logo else None
+    try:
+        company = companyCRUD.create(db, obj_in=obj_in)
+        if fields:
+            service_field.create_fields_company(db, company.id, fields)
+    except Exception:
+        if upload:
+            upload.discard()
+        raise
+    if upload and not upload.succeeded():
+        companyCRUD.remove(db, id=company.id)
+        return constant.ERROR, 500, "Upload logo failed"
+    if logo:
+        image_processor.generate_from_file(
+            logo, companyCRUD.model, company.id, "logo", key
+        )
     company_response = get_company_info_private(db, company)
     return constant.SUCCESS, 201, company_response
 
@@ -132,14 +146,29 @@ def update(db: Session, data: dict, current_user):
     new_fields = company_data.fields
     if new_fields:
         service_field.check_fields_exist(db, new_fields)
+    old_logo, old_logo_thumbnail = company.logo, company.logo_thumbnail
+    key = s3_service.content_key(logo, FolderBucket.LOGO.value) if logo else None
     if logo:
-        key = logo.filename
-        s3_service.upload_file(logo, key)
         company_data.logo = key
+        company.logo_thumbnail = None
 
     obj_in = schema_company.CompanyUpdate(**company_data.model_dump())
-    company = companyCRUD.update(db, db_obj=company, obj_in=obj_in)
-    service_field.update_fields_company(db, company.id, new_fields, old_fields)
+    upload = s3_service.upload_file_background(logo, key) if logo else None
+    try:
+        company = companyCRUD.update(db, db_obj=company, obj_in=obj_in)
+        service_field.update_fields_company(db, company.id, new_fields, old_fields)
+    except Exception:
+        if upload:
+            upload.discard()
+        raise
+    if upload and not upload.succeeded():
+        company.logo, company.logo_thumbnail = old_logo, old_logo_thumbnail
+        db.commit()
+        return constant.ERROR, 500, "Upload logo failed"
+    if logo:
+        image_processor.generate_from_file(
+            logo, companyCRUD.model, company.id, "logo", key
+        )
 
     company_response = get_company_info_private(db, company)
     return constant.SUCCESS, 200, company_response
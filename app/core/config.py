@@ -15,10 +15,21 @@ class Settings(BaseSettings):
     MYSQL_SERVER: str
     MYSQL_PORT: str
     MYSQL_DATABASE: str
+    DATABASE_URL: str = ""
+    SQL_SLOW_QUERY_MS: int = 200
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10
+    SQL_DEBUG_HEADERS: bool = False
+    # "exact" or "approximate": broad job searches report an estimated total
+    JOB_COUNT_MODE: str = "exact"
+    JOB_COUNT_EXACT_LIMIT: int = 10000
     # Token information
     ACCESS_TOKEN_EXPIRE: int
     REFRESH_TOKEN_EXPIRE: int
     SECURITY_ALGORITHM: str
+    # Password hashing information
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
     # Superuser information
     FIRST_SUPERUSER: str
     FIRST_SUPERUSER_EMAIL: str
@@ -34,6 +45,34 @@ class Settings(BaseSettings):
     MAIL_STARTTLS: bool = True
     MAIL_SSL_TLS: bool = False
     USE_CREDENTIALS: bool = True
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_INTERVAL: float = 2
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    # Job expiry information
+    JOB_EXPIRY_BATCH_SIZE: int = 500
+    JOB_EXPIRY_INTERVAL: float = 300
+    # Job archive information
+    JOB_ARCHIVE_AFTER_DAYS: int = 90
+    JOB_ARCHIVE_BATCH_SIZE: int = 200
+    JOB_ARCHIVE_SCHEDULE: str = "0 4 * * *"
+    # Recruitment market snapshot information
+    MARKET_SNAPSHOT_SCHEDULE: str = "5 0 * * *"
+    MARKET_HISTORY_MAX_DAYS: int = 366
+    # Retention information
+    RETENTION_SCHEDULE: str = "30 3 * * *"
+    RETENTION_BATCH_SIZE: int = 1000
+    RETENTION_BATCH_PAUSE: float = 0.1
+    VERIFY_CODE_RETENTION_DAYS: int = 7
+    BUSINESS_HISTORY_RETENTION_DAYS: int = 365
+    JOB_REPORT_RETENTION_DAYS: int = 365
+    # Scheduler information
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_LOCK_LEASE: float = 60
+    SCHEDULER_JITTER: float = 30
+    SCHEDULER_POLL_INTERVAL: float = 5
+    EMAIL_DEFAULT_LOCALE: str = "vi"
+    EMAIL_TEMPLATE_RELOAD: bool = False
+    EMAIL_TEMPLATE_CACHE_DIR: str = ""
     # Google OAuth2 information
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
@@ -43,17 +82,31 @@ class Settings(BaseSettings):
     GOOGLE_AUTH_PROVIDER_X509_CERT_URL: str
     GOOGLE_REDIRECT_URI: str
     GOOGLE_JAVASCRIPT_ORIGIN: str
+    GOOGLE_JWKS_URI: str = "https://www.googleapis.com/oauth2/v3/certs"
     # AWS S3 information
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
     AWS_DEFAULT_REGION: str
     AWS_BUCKET_NAME: str
+    # Storage information
+    STORAGE_BACKEND: str = "s3"
+    LOCAL_STORAGE_DIR: str = "media"
+    STORAGE_MAX_CONCURRENCY: int = 10
+    IMAGE_PROCESS_WORKERS: int = 2
     # Redis information
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PASSWORD: str
     REDIS_DB: int
     REDIS_EXPIRE: int
+    # Rate limit information
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_JOB_SEARCH: str = "120/minute"
+    RATE_LIMIT_COMPANY_SEARCH: str = "120/minute"
+    RATE_LIMIT_LOGIN: str = "10/minute"
+    RATE_LIMIT_SEND_VERIFY_CODE: str = "5/minute"
+    # Verify code information
+    OTP_AUDIT_ENABLED: bool = True
 
     class Config:
         env_file = ".env"
@@ -10,11 +10,45 @@ SUCCESS = "success"
 # MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")
 # MYSQL_PORT = os.getenv("MYSQL_PORT")
 # MYSQL_DATABASE = os.getenv("MYSQL_DATABASE")
-DATABASE_URL = f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_SERVER}:{settings.MYSQL_PORT}/{settings.MYSQL_DATABASE}"
+DATABASE_URL = (
+    settings.DATABASE_URL
+    or f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_SERVER}:{settings.MYSQL_PORT}/{settings.MYSQL_DATABASE}"
+)
 REGEX_EMAIL = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
 REGEX_PASSWORD = r"^(?=.*[A-Za-z])(?=.*\d)(?=.*[@$!%*#?&])[A-Za-z\d@$!%*#?&]{8,16}$"
 REGEX_PHONE_NUMBER = r"(84|0[3|5|7|8|9])+([0-9]{8})\b"
 ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/jpg", "image/svg+xml"]
 MAX_IMAGE_SIZE = 2 * 1024 * 1024
+ALLOWED_CV_TYPES = [
+    "application/pdf",
+    "application/msword",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+]
+MAX_CV_SIZE = 5 * 1024 * 1024
+PRESIGNED_URL_EXPIRE = 15 * 60
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+HASH_CHUNK_SIZE = 64 * 1024
+RASTER_EXTENSIONS = ["jpg", "jpeg", "png", "webp"]
+IMAGE_THUMBNAIL_SIZE = (256, 256)
+IMAGE_QUALITY = 80
+EMAIL_RETRY_BASE_DELAY = 30
+EMAIL_RETRY_MAX_DELAY = 60 * 60
+EMAIL_SEND_LEASE = 5 * 60
+EMAIL_SMTP_IDLE_TIMEOUT = 60
+OTP_EXPIRE = 5 * 60
+OTP_BLOCK_EXPIRE = 5 * 60
+OTP_MAX_ATTEMPTS = 5
+RATE_LIMIT_LOCAL_MAX_KEYS = 10000
+TOKEN_CACHE_SIZE = 4096
+JOB_COUNT_CACHE_EXPIRE = 60 * 60
+JOB_COUNT_EXACT_CACHE_EXPIRE = 60
 BUCKET_URL = "https://tvnow-bucket.s3.amazonaws.com/"
-GOOGLE_GET_USER_INFO_URL = "https://www.googleapis.com/oauth2/v1/userinfo?access_token="
+GOOGLE_GET_USER_INFO_URL = "https://www.googleapis.com/oauth2/v1/userinfo"
+GOOGLE_ISSUERS = ["accounts.google.com", "https://accounts.google.com"]
+JWKS_DEFAULT_MAX_AGE = 60 * 60
+JWKS_REFRESH_MARGIN = 60
+JWKS_MIN_REFRESH_INTERVAL = 30
+HTTP_CLIENT_TIMEOUT = 5
+HTTP_CLIENT_MAX_CONNECTIONS = 20
+SCHEDULER_STATE_EXPIRE = 7 * 24 * 60 * 60
@@ -1,41 +1,22 @@
-from fastapi import BackgroundTasks
-from fastapi_mail import FastMail, MessageSchema
+import logging
+
 from sqlalchemy.orm import Session
-from pathlib import Path
 
-from app.core.email_config import conf
+from app.crud import email_outbox as email_outboxCRUD
+from app.schema.email_outbox import EmailOutboxCreate
+
+logger = logging.getLogger(__name__)
 
 
-async def send_email_background(
-    db: Session,
-    background_tasks: BackgroundTasks,
-    subject: str,
-    email_to: str,
-    body: str,
-):
+def enqueue_email(db: Session, subject: str, email_to: str, body: str):
+    # Delivery happens in the outbox worker (python -m app.worker.email_outbox)
     try:
-        message = MessageSchema(
-            subject=subject,
-            recipients=[email_to],
-            body=body,
-            subtype="html",
+        email_outboxCRUD.create(
+            db,
+            obj_in=EmailOutboxCreate(recipient=email_to, subject=subject, body=body),
         )
-
-        fm = FastMail(conf)
-
-        background_tasks.add_task(fm.send_message, message)
-
         return True
     except Exception as e:
+        logger.warning("Enqueue email to %s failed: %s", email_to, e)
+        db.rollback()
         return False
-
-
-def fill_template(template: str, **kwargs) -> str:
-    for key, value in kwargs.items():
-        template = template.replace("{{ " + key + " }}", value)
-    return template
-
-
-async def read_email_templates(file_path: Path) -> str:
-    html_file_template = Path(__file__).parent / "templates" / file_path
-    return html_file_template.read_text(encoding="utf-8")
@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+
+from app.core.config import settings
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+class EmailTemplates:
+    """
+    Email templates compiled once per process.
+
+    A template for a locale lives in templates/<locale>/<name> and falls back to
+    templates/<name>. Compiled templates are kept in memory and their bytecode
+    on disk, so a new worker skips parsing too. Files are only checked for
+    changes when EMAIL_TEMPLATE_RELOAD is enabled, which is meant for
+    development.
+    """
+
+    def __init__(self, directory: Path, reload: bool = False, cache_dir: str = None):
+        self.reload = reload
+        self.environment = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=reload,
+            bytecode_cache=FileSystemBytecodeCache(cache_dir or None),
+        )
+        self.templates = {}
+
+    def get(self, name: str, locale: Optional[str] = None) -> Template:
+        locale = locale or settings.EMAIL_DEFAULT_LOCALE
+        if self.reload:
+            return self.environment.select_template([f"{locale}/{name}", name])
+        template = self.templates.get((name, locale))
+        if template is None:
+            template = self.environment.select_template([f"{locale}/{name}", name])
+            self.templates[(name, locale)] = template
+        return template
+
+    def render(self, name: str, locale: Optional[str] = None, **kwargs) -> str:
+        return self.get(name, locale).render(**kwargs)
+
+
+email_templates = EmailTemplates(
+    TEMPLATE_DIR,
+    reload=settings.EMAIL_TEMPLATE_RELOAD,
+    cache_dir=settings.EMAIL_TEMPLATE_CACHE_DIR,
+)
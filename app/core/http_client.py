@@ -0,0 +1,42 @@
+from typing import Optional
+
+import httpx
+
+from app.core import constant
+
+
+class HttpClient:
+    """
+    Shared async HTTP client for outbound calls.
+
+    One connection pool per process, created on first use and closed on
+    shutdown, so calls to the same host reuse their TLS connections.
+    """
+
+    def __init__(self, timeout: float, max_connections: int):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+http_client = HttpClient(
+    timeout=constant.HTTP_CLIENT_TIMEOUT,
+    max_connections=constant.HTTP_CLIENT_MAX_CONNECTIONS,
+)
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timezone, timedelta
@@ -8,6 +11,7 @@ from app.schema import (
 )
 from app.crud import (
     job as jobCRUD,
+    job_archive as job_archiveCRUD,
     campaign as campaignCRUD,
     experience as experienceCRUD,
     job_position as job_positionCRUD,
@@ -15,6 +19,7 @@ from app.crud import (
 )
 from app.core.auth import service_business_auth
 from app.core import constant
+from app.core.config import settings
 from app.hepler.exception_handler import get_message_validation_error
 from app.hepler.enum import (
     Role,
@@ -33,6 +38,12 @@ from app.core.skill import service_skill
 from app.core.campaign import service_campaign
 from app.storage.redis import redis_client
 
+JOB_CACHE_KEYS = ("count_job_by_category", "count_job_by_salary")
+JOB_CACHE_PATTERNS = (
+    "count_job_search_by_user:*",
+    "jobs_of_province_district:*",
+)
+
 
 def get_by_business(db: Session, data: dict, current_user):
     try:
@@ -49,7 +60,10 @@ def get_by_business(db: Session, data: dict, current_user):
         if page.company_id and page.company_id != company.id:
             return constant.ERROR, 403, "Permission denied"
         page.company_id = company.id
-    response = get_list_job(db, page.model_dump())
+    if page.archived:
+        response = get_list_job_archive(db, page.model_dump())
+    else:
+        response = get_list_job(db, page.model_dump())
     return constant.SUCCESS, 200, response
 
 
@@ -60,14 +74,11 @@ def get_by_user(db: Session, data: dict):
         return constant.ERROR, 400, get_message_validation_error(e)
     page.job_status = JobStatus.PUBLISHED
     page.job_approve_status = JobApprovalStatus.APPROVED
-    jobs = get_list_job(db, page.model_dump())
-
-    params = job_schema.JobCount(**data)
-    number_of_all_jobs = jobCRUD.count(db, **params.model_dump())
+    jobs, number_of_all_jobs = jobCRUD.get_page(db, **page.model_dump())
 
     response = {
         "count": number_of_all_jobs,
-        "jobs": jobs,
+        "jobs": get_list_job_info(db, jobs),
     }
     return constant.SUCCESS, 200, response
 
@@ -82,6 +93,7 @@ async def search_by_user(db: Session, redis, data: dict):
 
     jobs = jobCRUD.search(db, **page.model_dump())
     count = 0
+    count_exact = True
     jobs_of_district_response = []
 
     if (page.province_id or page.district_id) and page.suggest:
@@ -90,8 +102,6 @@ async def search_by_user(db: Session, redis, data: dict):
             cache_key = f"jobs_of_province_district:{page.model_dump()}"
             jobs_of_district_response = await redis.get_list(cache_key)
         except Exception as e:
-            # log
-            print(e)
             jobs_of_district_response = None
         if not jobs_of_district_response:
             jobs_of_district = jobCRUD.get_number_job_of_district(
@@ -123,27 +133,11 @@ async def search_by_user(db: Session, redis, data: dict):
                     expire_time,
                 )
             except Exception as e:
-                # log
-                print(e)
                 pass
 
     else:
-        cache_key = f"count_job_search_by_user:{page.deadline}"
-        count = None
-        try:
-            count = await redis.get(cache_key)
-        except Exception as e:
-            # log
-            pass
-        if not count:
-            params = job_schema.JobCount(**data)
-            count = jobCRUD.count(db, **params.model_dump())
-            try:
-                expire_time = 60 * 60 * 24
-                await redis.set(cache_key, count, expire_time)
-            except Exception as e:
-                # log
-                pass
+        params = job_schema.JobCount(**data)
+        count, count_exact = await count_search_jobs(db, redis, params.model_dump())
 
     jobs_response = []
     for job in jobs:
@@ -152,6 +146,7 @@ async def search_by_user(db: Session, redis, data: dict):
 
     response = {
         "count": count,
+        "count_exact": count_exact,
         "option": page,
         "jobs": jobs_response,
         "jobs_of_district": jobs_of_district_response,
@@ -159,8 +154,80 @@ async def search_by_user(db: Session, redis, data: dict):
     return constant.SUCCESS, 200, response
 
 
+async def count_search_jobs(db: Session, redis, params: dict):
+    """
+    Total of a public job search and whether it is exact.
+
+    Narrow searches are counted exactly. In the "approximate" JOB_COUNT_MODE
+    a search matching more than JOB_COUNT_EXACT_LIMIT jobs reports the
+    optimizer's row estimate instead, never less than the rows already
+    counted; databases without an estimate fall back to the exact count.
+    Totals are cached per mode and filter combination, exact ones only
+    briefly so new and approved jobs show up in them.
+    """
+    filters = {key: value for key, value in params.items() if value is not None}
+    signature = hashlib.sha1(
+        json.dumps(
+            [settings.JOB_COUNT_MODE, filters], sort_keys=True, default=str
+        ).encode()
+    ).hexdigest()
+    cache_key = f"count_job_search_by_user:{signature}"
+    try:
+        cached = await redis.get(cache_key)
+        if cached:
+            cached = json.loads(cached)
+            return cached["count"], cached["exact"]
+    except Exception as e:
+        pass
+
+    count, exact = None, True
+    if settings.JOB_COUNT_MODE == "approximate":
+        limit = settings.JOB_COUNT_EXACT_LIMIT
+        count = jobCRUD.count(db, **params, count_limit=limit + 1)
+        if count > limit:
+            estimate = jobCRUD.estimate_count(db, **params)
+            if estimate is None:
+                count = None
+            else:
+                count, exact = max(estimate, count), False
+    if count is None:
+        count = jobCRUD.count(db, **params)
+    try:
+        await redis.set(
+            cache_key,
+            json.dumps({"count": count, "exact": exact}),
+            (
+                constant.JOB_COUNT_EXACT_CACHE_EXPIRE
+                if exact
+                else constant.JOB_COUNT_CACHE_EXPIRE
+            ),
+        )
+    except Exception as e:
+        pass
+    return count, exact
+
+
+async def evict_job_caches(redis):
+    """Drop the cached listings and counts after jobs left the public set"""
+    for key in JOB_CACHE_KEYS:
+        await redis.delete(key)
+    for pattern in JOB_CACHE_PATTERNS:
+        await redis.delete_pattern(pattern)
+
+
 def get_list_job(db: Session, data: dict):
     jobs = jobCRUD.get_multi(db, **data)
+    return get_list_job_info(db, jobs)
+
+
+def get_list_job_archive(db: Session, data: dict):
+    jobs = job_archiveCRUD.get_multi(db, **data)
+    return [
+        get_job_info(db, job, Schema=job_schema.JobArchiveItemResponse) for job in jobs
+    ]
+
+
+def get_list_job_info(db: Session, jobs):
     jobs_response = []
     for job in jobs:
         job_res = get_job_info(db, job)
@@ -170,7 +237,12 @@ def get_list_job(db: Session, data: dict):
 
 
 def get_by_id_for_business(db: Session, job_id: int, current_user):
+    Schema = job_schema.JobItemResponse
     job = jobCRUD.get(db, job_id)
+    if not job:
+        # Old expired jobs have been moved to the archive.
+        Schema = job_schema.JobArchiveItemResponse
+        job = job_archiveCRUD.get(db, job_id)
     company = companyCRUD.get_company_by_business_id(db, current_user.id)
     if not job:
         return constant.ERROR, 404, "Job not found"
@@ -184,7 +256,7 @@ def get_by_id_for_business(db: Session, job_id: int, current_user):
         or not company
     ):
         return constant.ERROR, 403, "Permission denied"
-    job_response = get_job_info(db, job)
+    job_response = get_job_info(db, job, Schema=Schema)
     return constant.SUCCESS, 200, job_response
 
 
@@ -194,7 +266,7 @@ def get_by_id_for_user(db: Session, job_id: int):
         return constant.ERROR, 404, "Job not found"
     if (
         job.status != JobStatus.PUBLISHED
-        or job.job_approval_request.status != JobApprovalStatus.APPROVED
+        or job.approval_status != JobApprovalStatus.APPROVED
     ):
         return constant.ERROR, 404, "Job not found"
     job_response = get_job_info(db, job)
@@ -243,8 +315,6 @@ async def count_job_by_category(redis: Redis, db: Session):
             expire_time = 60 * 60 * 24
             await redis.set_list("count_job_by_category", response, expire_time)
         except Exception as e:
-            print(e)
-            # log
             pass
     return constant.SUCCESS, 200, response
 
@@ -292,45 +362,6 @@ def count_job_by_district(db: Session):
     return constant.SUCCESS, 200, response
 
 
-async def get_cruitment_demand(redis: Redis, db: Session):
-    time_scan = db.query(func.now()).first()[0]
-    approved_time = time_scan - timedelta(days=1)
-    params = job_schema.JobCount(
-        job_status=JobStatus.PUBLISHED,
-        job_approve_status=JobApprovalStatus.APPROVED,
-    )
-
-    cache_key = f"cruitment_demand:{params.deadline}"
-    try:
-        response = await redis.get_dict(cache_key)
-    except Exception as e:
-        # log
-        response = None
-    if not response:
-        number_of_job_24h = jobCRUD.count(
-            db, **params.model_dump(), approved_time=approved_time
-        )
-        number_of_job_active = jobCRUD.count(
-            db,
-            **params.model_dump(),
-        )
-        number_of_company_active = jobCRUD.count_company_active_job(db)
-        response = {
-            "number_of_job_24h": number_of_job_24h,
-            "number_of_job_active": number_of_job_active,
-            "number_of_company_active": number_of_company_active,
-            "time_scan": str(time_scan),
-        }
-        try:
-            expire_time = 60 * 60 * 24
-            await redis.set_dict(cache_key, response, expire_time)
-        except Exception as e:
-            # log
-            pass
-
-    return constant.SUCCESS, 200, response
-
-
 def create(db: Session, data: dict, current_user):
     business = current_user.business
     service_business_auth.verified_level(business, 2)
@@ -471,11 +502,12 @@ def get_jobs_active_by_company(db: Session, company_id: int):
 
 
 def get_job_info(db: Session, job, Schema=job_schema.JobItemResponse):
-    working_times_response = service_working_times.get_working_times_by_job_id(
-        db, job.id
+    # Through the relationships, so an archived job renders the same way.
+    working_times_response = service_working_times.get_list_working_time_by_model(
+        db, job.working_times
     )
-    work_locations_response = service_work_locations.get_work_locations_by_job_id(
-        db, job.id
+    work_locations_response = service_work_locations.get_list_work_location_by_model(
+        db, job.work_locations
     )
     company = companyCRUD.get_company_by_business_id(db, job.business_id)
     company_response = service_company.get_company_info(db, company)
@@ -495,6 +527,7 @@ def get_job_info(db: Session, job, Schema=job_schema.JobItemResponse):
             if k
             not in [
                 "working_times",
+                "work_locations",
                 "must_have_skills",
                 "should_have_skills",
                 "locations",
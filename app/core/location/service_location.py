@@ -24,7 +24,6 @@ async def get_province(db: Session, redis: Redis, data: dict):
     try:
         provinces_response = await redis.get_list(cache_key)
     except Exception as e:
-        print(e)
         pass
     if not provinces_response:
         provinces_response = get_list_province_info(db, page.model_dump())
@@ -36,7 +35,6 @@ async def get_province(db: Session, redis: Redis, data: dict):
                 expire_time,
             )
         except Exception as e:
-            print(e)
             pass
     return constant.SUCCESS, 200, provinces_response
 
@@ -56,7 +54,6 @@ async def get_district(db: Session, redis: Redis, data: dict):
     try:
         districts_response = await redis.get_list(cache_key)
     except Exception as e:
-        print(e)
         pass
     if not districts_response:
         districts_response = get_list_district_info(
@@ -70,7 +67,6 @@ async def get_district(db: Session, redis: Redis, data: dict):
                 expire_time,
             )
         except Exception as e:
-            print(e)
             pass
     return constant.SUCCESS, 200, districts_response
 
@@ -79,7 +75,7 @@ async def get_province_by_id(db: Session, redis: Redis, id: int):
     province_response = None
     cache_key = f"provinces:{id}"
     try:
-        await redis.set_dict(cache_key, province_response.__dict__)
+        province_response = await redis.get_dict(cache_key)
     except Exception as e:
         pass
 
@@ -0,0 +1,125 @@
+from sqlalchemy.orm import Session
+from datetime import datetime, time, timedelta
+
+from app.schema import work_market as work_market_schema
+from app.crud import (
+    job as jobCRUD,
+    work_market as work_marketCRUD,
+    cruitment_demand as cruitment_demandCRUD,
+)
+from app.core import constant
+from app.hepler.exception_handler import get_message_validation_error
+from app.hepler.enum import MarketPeriod
+
+CATEGORY_KEY = "category:{}"
+PROVINCE_KEY = "province:{}"
+# Counts of jobs that arrived during a day add up over a week, the number of
+# active jobs and companies is averaged instead.
+FLOWS = ("number_of_job_24h", "number_of_job_new_today")
+
+
+def take_snapshot(db: Session):
+    time_scan = datetime.now()
+    today = time_scan.date()
+    number_of_job_active, number_of_job_24h, number_of_job_new_today, companies = (
+        jobCRUD.get_market_stats(
+            db,
+            today,
+            approved_time=time_scan - timedelta(days=1),
+            created_time=datetime.combine(today, time.min),
+        )
+    )
+    demand = {
+        CATEGORY_KEY.format(category_id): count
+        for category_id, count in jobCRUD.count_active_by_category(db, today)
+    }
+    demand.update(
+        {
+            PROVINCE_KEY.format(province_id): count
+            for province_id, count in jobCRUD.count_active_by_province(db, today)
+            if province_id is not None
+        }
+    )
+    obj_in = work_market_schema.WorkMarketCreate(
+        quantity_company_recruitment=companies,
+        quantity_job_recruitment=number_of_job_active,
+        quantity_job_recruitment_yesterday=number_of_job_24h,
+        quantity_job_new_today=number_of_job_new_today,
+        time_scan=time_scan,
+    )
+    return work_marketCRUD.create_snapshot(db, obj_in, demand)
+
+
+def get_market_info(work_market) -> dict:
+    return {
+        "number_of_job_24h": work_market.quantity_job_recruitment_yesterday,
+        "number_of_job_active": work_market.quantity_job_recruitment,
+        "number_of_company_active": work_market.quantity_company_recruitment,
+        "number_of_job_new_today": work_market.quantity_job_new_today,
+        "time_scan": str(work_market.time_scan),
+    }
+
+
+def get_cruitment_demand(db: Session):
+    # Snapshots are only written by app.worker.market_snapshot, requests never
+    # run the aggregates themselves.
+    work_market = work_marketCRUD.get_latest(db)
+    if work_market is None:
+        return constant.ERROR, 404, "Recruitment demand is not found"
+    return constant.SUCCESS, 200, get_market_info(work_market)
+
+
+def daily_closings(rows, get_values) -> list:
+    # Rows are ordered by time_scan, the last snapshot of a day wins.
+    closings = {}
+    for row in rows:
+        closings[row.time_scan.date()] = get_values(row)
+    return list(closings.items())
+
+
+def rollup(closings: list, period: MarketPeriod) -> list:
+    if period == MarketPeriod.DAY:
+        return [{"date": str(day), **values} for day, values in closings]
+    weeks = {}
+    for day, values in closings:
+        weeks.setdefault(day - timedelta(days=day.weekday()), []).append(values)
+    response = []
+    for week, days in weeks.items():
+        item = {"date": str(week), "days": len(days)}
+        for key in days[0]:
+            total = sum(values[key] for values in days)
+            item[key] = total if key in FLOWS else round(total / len(days))
+        response.append(item)
+    return response
+
+
+def get_cruitment_demand_history(db: Session, data: dict):
+    try:
+        params = work_market_schema.WorkMarketHistoryRequest(**data)
+    except Exception as e:
+        return constant.ERROR, 400, get_message_validation_error(e)
+    start = datetime.combine(params.from_date, time.min)
+    end = datetime.combine(params.to_date + timedelta(days=1), time.min)
+
+    if params.key:
+        rows = cruitment_demandCRUD.get_by_key(db, params.key, start, end)
+        closings = daily_closings(rows, lambda row: {"value": row.value})
+    else:
+        rows = work_marketCRUD.get_by_range(db, start, end)
+        closings = daily_closings(
+            rows,
+            lambda row: {
+                key: value
+                for key, value in get_market_info(row).items()
+                if key != "time_scan"
+            },
+        )
+
+    response = {
+        "period": params.period,
+        "from_date": str(params.from_date),
+        "to_date": str(params.to_date),
+        "key": params.key,
+        "items": rollup(closings, params.period),
+    }
+    return constant.SUCCESS, 200, response
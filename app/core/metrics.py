@@ -0,0 +1,147 @@
+"""
+Prometheus metrics of the service.
+
+With several uvicorn workers set PROMETHEUS_MULTIPROC_DIR to an empty
+directory shared by the workers, every process then writes its samples there
+and /metrics aggregates them. Without it the metrics are per process.
+"""
+
+import os
+import time
+
+from fastapi import Request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latency of HTTP requests by route.",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route and status code.",
+    ["method", "route", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements issued per HTTP request by route.",
+    ["method", "route"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Redis cache requests by cache and result (hit, miss, error, write_error).",
+    ["cache", "result"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OPEN = Gauge(
+    "db_pool_open_connections",
+    "Database connections currently open in the pool.",
+    multiprocess_mode="livesum",
+)
+SCHEDULED_RUNS = Counter(
+    "scheduled_task_runs_total",
+    "Scheduled task runs by task and result (success, error, lock_lost).",
+    ["task", "result"],
+)
+SCHEDULED_RUN_DURATION = Histogram(
+    "scheduled_task_duration_seconds",
+    "Run time of scheduled tasks.",
+    ["task"],
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600),
+)
+SCHEDULED_LAST_SUCCESS = Gauge(
+    "scheduled_task_last_success_timestamp_seconds",
+    "Time of the last successful run of a scheduled task.",
+    ["task"],
+    multiprocess_mode="max",
+)
+RETENTION_ROWS = Counter(
+    "retention_rows_total",
+    "Rows removed by the retention purges by table and action (deleted, archived).",
+    ["table", "action"],
+)
+
+
+def record_cache(key: str, result: str):
+    # The prefix before the first ":" names the cache, the rest is unbounded.
+    CACHE_REQUESTS.labels(cache=key.split(":", 1)[0], result=result).inc()
+
+
+def record_task_run(task: str, result: str, duration: float, finished_at: float):
+    SCHEDULED_RUNS.labels(task=task, result=result).inc()
+    SCHEDULED_RUN_DURATION.labels(task=task).observe(duration)
+    if result == "success":
+        SCHEDULED_LAST_SUCCESS.labels(task=task).set(finished_at)
+
+
+def record_retention(table: str, action: str, rows: int):
+    RETENTION_ROWS.labels(table=table, action=action).inc(rows)
+
+
+def instrument_engine(engine: Engine):
+    """Keep the pool gauges current from pool events"""
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        DB_POOL_OPEN.inc()
+
+    @event.listens_for(engine, "close")
+    def on_close(dbapi_connection, connection_record):
+        DB_POOL_OPEN.dec()
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKED_OUT.inc()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.dec()
+
+
+async def record_request(request: Request, call_next):
+    """Record latency and status code of every request by route template"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = route.path if route else "unmatched"
+        REQUEST_LATENCY.labels(request.method, path).observe(
+            time.perf_counter() - start
+        )
+        REQUESTS.labels(request.method, path, str(status)).inc()
+
+
+def close_metrics():
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def render_metrics():
+    """Metrics in the Prometheus text format, with their content type"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,178 @@
+"""
+SQL statement statistics per request.
+
+Cursor events on the engine add every statement to the QueryStats of the
+current request: the number of statements, the time spent in the database
+and how often each statement fingerprint ran. Slow statements are logged
+with their query plan and fingerprints that run more than
+SQL_N_PLUS_ONE_THRESHOLD times in one request are reported as likely N+1
+query fan-out.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.config import settings
+from app.core.metrics import REQUEST_QUERIES
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_PATTERNS = [
+    (re.compile(r"'(?:[^'\\]|\\.|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"%\(\w+\)s|%s|:\w+"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?+)"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def fingerprint(statement: str) -> str:
+    """Statement with literals and parameters replaced, IN lists collapsed"""
+    for pattern, replacement in FINGERPRINT_PATTERNS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def add(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> list:
+        return [
+            (statement, count)
+            for statement, count in self.fingerprints.most_common()
+            if count > threshold
+        ]
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def explain_rows(conn, statement: str, parameters) -> list:
+    """The plan of a statement as dicts keyed by the EXPLAIN columns"""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def explain(conn, statement: str, parameters) -> str:
+    return "\n".join(str(row) for row in explain_rows(conn, statement, parameters))
+
+
+class ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN FORMAT=JSON of a statement, its parameters bound as usual"""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(ExplainJSON, "mysql")
+def compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN FORMAT=JSON " + compiler.process(element.statement, **kw)
+
+
+def plan_output_rows(block: dict) -> Optional[float]:
+    for key in ("ordering_operation", "grouping_operation", "duplicates_removal"):
+        if key in block:
+            return plan_output_rows(block[key])
+    if "nested_loop" in block:
+        return block["nested_loop"][-1]["table"].get("rows_produced_per_join")
+    if "table" in block:
+        return block["table"].get("rows_produced_per_join")
+    return None
+
+
+def estimate_rows(db: Session, statement) -> Optional[int]:
+    """The optimizer's estimate of the rows a SELECT returns, on MySQL only"""
+    if db.get_bind().dialect.name != "mysql":
+        return None
+    plan = json.loads(db.execute(ExplainJSON(statement)).scalar())
+    rows = plan_output_rows(plan["query_block"])
+    return None if rows is None else int(rows)
+
+
+def instrument_queries(engine: Engine):
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_start"].pop()
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.add(statement, duration)
+        if duration * 1000 < settings.SQL_SLOW_QUERY_MS:
+            return
+        plan = None
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            try:
+                plan = explain(conn, statement, parameters)
+            except Exception as e:
+                plan = f"EXPLAIN failed: {e}"
+        logger.warning(
+            "Slow query %.1f ms: %s\n%s", duration * 1000, statement, plan or ""
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        starts = (
+            context.connection.info.get("query_start") if context.connection else None
+        )
+        if starts:
+            starts.pop()
+
+
+async def record_queries(request: Request, call_next):
+    """Attach a QueryStats to the request and report it once it is done"""
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        current_query_stats.reset(token)
+    route = request.scope.get("route")
+    path = route.path if route else "unmatched"
+    REQUEST_QUERIES.labels(request.method, path).observe(stats.count)
+    for statement, count in stats.repeated(settings.SQL_N_PLUS_ONE_THRESHOLD):
+        logger.warning(
+            "Possible N+1 on %s %s, ran %d times: %s",
+            request.method,
+            path,
+            count,
+            statement,
+        )
+    if settings.SQL_DEBUG_HEADERS:
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Time-Ms"] = f"{stats.duration * 1000:.1f}"
+    return response
@@ -0,0 +1,146 @@
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from fastapi import Request, HTTPException
+from redis.exceptions import RedisError
+
+from app.core import constant
+from app.core.config import settings
+from app.core.auth.auth_handler import decodeJWT
+from app.storage.redis import redis_dependency
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 60 * 60, "day": 24 * 60 * 60}
+
+# KEYS[1] bucket
+# ARGV[1] capacity, ARGV[2] refill rate in tokens per millisecond
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate))
+return {allowed, math.floor(tokens), retry_after, math.ceil((capacity - tokens) / rate)}
+"""
+
+
+def parse_quota(quota: str) -> Tuple[int, int]:
+    """Parse a quota such as 60/minute into (limit, period in seconds)"""
+    limit, period = quota.split("/")
+    return int(limit), PERIODS[period.strip()]
+
+
+class LocalTokenBucket:
+    """
+    In process token bucket used while Redis is unreachable.
+
+    Limits are per worker process, so they are looser than the shared ones,
+    but a Redis outage does not let every request through to MySQL.
+    """
+
+    def __init__(self, max_keys: int = constant.RATE_LIMIT_LOCAL_MAX_KEYS):
+        self.max_keys = max_keys
+        self.buckets = OrderedDict()
+
+    def hit(self, key: str, capacity: int, rate: float) -> Tuple[int, int, int, int]:
+        now = time.monotonic() * 1000
+        tokens, ts = self.buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - ts) * rate)
+        allowed, retry_after = 0, 0
+        if tokens >= 1:
+            tokens -= 1
+            allowed = 1
+        else:
+            retry_after = math.ceil((1 - tokens) / rate)
+        self.buckets[key] = (tokens, now)
+        if len(self.buckets) > self.max_keys:
+            self.buckets.popitem(last=False)
+        return (
+            allowed,
+            math.floor(tokens),
+            retry_after,
+            math.ceil((capacity - tokens) / rate),
+        )
+
+
+local_bucket = LocalTokenBucket()
+
+
+class RateLimiter:
+    """
+    Route dependency throttling requests with a token bucket in Redis.
+
+    A bucket is kept per route, client IP and user id taken from the bearer
+    token, if any. Usage: dependencies=[Depends(RateLimiter("job_search",
+    settings.RATE_LIMIT_JOB_SEARCH))]
+    """
+
+    def __init__(self, scope: str, quota: str):
+        self.scope = scope
+        self.limit, period = parse_quota(quota)
+        self.rate = self.limit / (period * 1000)
+
+    def identity(self, request: Request) -> str:
+        ip = request.client.host if request.client else "unknown"
+        user = "anonymous"
+        authorization = request.headers.get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            payload = decodeJWT(authorization[len("Bearer ") :])
+            if payload.get("id"):
+                user = f"{payload.get('type_account')}:{payload['id']}"
+        return f"{ip}:{user}"
+
+    async def hit(self, key: str) -> Tuple[int, int, int, int]:
+        redis = redis_dependency.redis
+        if redis:
+            try:
+                result = await redis.run_script(
+                    TOKEN_BUCKET_SCRIPT, keys=[key], args=[self.limit, self.rate]
+                )
+                return tuple(int(value) for value in result)
+            except (RedisError, OSError) as e:
+                logger.warning("Rate limit falls back to local bucket: %s", e)
+        return local_bucket.hit(key, self.limit, self.rate)
+
+    async def __call__(self, request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        key = f"rate_limit:{self.scope}:{self.identity(request)}"
+        allowed, remaining, retry_after, reset = await self.hit(key)
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(math.ceil(reset / 1000)),
+        }
+        if not allowed:
+            headers["Retry-After"] = str(math.ceil(retry_after / 1000))
+            raise HTTPException(
+                status_code=429, detail="Too many requests", headers=headers
+            )
+        request.state.rate_limit_headers = headers
+
+
+async def rate_limit_headers(request: Request, call_next):
+    """Copy the RateLimit headers of the route onto its response"""
+    response = await call_next(request)
+    headers = getattr(request.state, "rate_limit_headers", None)
+    if headers:
+        response.headers.update(headers)
+    return response
@@ -0,0 +1,293 @@
+"""
+Periodic tasks run inside the API processes.
+
+Every API process runs the scheduler, a due task only runs in the process
+that takes its Redis lock. The lock is a lease of SCHEDULER_LOCK_LEASE
+seconds renewed while the task runs, so the tasks of a process that dies
+are free again once the lease ends, and a run that outlasts its interval
+keeps the lock and is not started a second time. The next due time of every
+task is kept in Redis too: the process that runs a slot moves it forward,
+the others find it moved when they get the lock and skip the slot.
+
+Schedules are five field cron expressions (minute hour day month weekday,
+in local time) or a number of seconds between runs. A random delay of up
+to the task's jitter is added to every due time, so tasks sharing a
+schedule do not all start at once.
+
+The clock, sleep and random generator can be replaced, with fakeredis and
+a fake clock tick() starts the due tasks deterministically.
+"""
+
+import asyncio
+import logging
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+from app.core import constant
+from app.core.config import settings
+from app.core.metrics import record_task_run
+from app.storage.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+def parse_field(field: str, low: int, high: int) -> set:
+    values = set()
+    for part in field.split(","):
+        part, _, step = part.partition("/")
+        step = int(step) if step else 1
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"Invalid cron field {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    ALIASES = {
+        "@hourly": "0 * * * *",
+        "@daily": "0 0 * * *",
+        "@weekly": "0 0 * * 0",
+        "@monthly": "0 0 1 * *",
+    }
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = self.ALIASES.get(expression, expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression {expression}")
+        self.minutes = parse_field(fields[0], 0, 59)
+        self.hours = parse_field(fields[1], 0, 23)
+        self.days = parse_field(fields[2], 1, 31)
+        self.months = parse_field(fields[3], 1, 12)
+        # 0 and 7 are both Sunday.
+        self.weekdays = {day % 7 for day in parse_field(fields[4], 0, 7)}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    def day_matches(self, moment: datetime) -> bool:
+        in_days = moment.day in self.days
+        in_weekdays = (moment.weekday() + 1) % 7 in self.weekdays
+        # Like cron, a restricted day and weekday match when either does.
+        if self.any_day or self.any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, timestamp: float) -> float:
+        moment = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0)
+        moment += timedelta(minutes=1)
+        limit = moment + timedelta(days=5 * 366)
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = moment.replace(day=1, hour=0, minute=0)
+                moment = (moment + timedelta(days=32)).replace(day=1)
+            elif not self.day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment.timestamp()
+        raise ValueError(f"Cron expression {self.expression} never matches")
+
+
+class IntervalSchedule:
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("The interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, timestamp: float) -> float:
+        return timestamp + self.seconds
+
+
+def parse_schedule(schedule: Union[str, float]):
+    if isinstance(schedule, (int, float)):
+        return IntervalSchedule(schedule)
+    return CronSchedule(schedule)
+
+
+class ScheduledTask:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable],
+        schedule: Union[str, float],
+        jitter: float,
+    ):
+        self.name = name
+        self.func = func
+        self.schedule = parse_schedule(schedule)
+        self.jitter = jitter
+        self.next_run: Optional[float] = None
+        self.running: Optional[asyncio.Task] = None
+        self.lock_lost = False
+
+    def is_running(self) -> bool:
+        return self.running is not None and not self.running.done()
+
+
+class Scheduler:
+    def __init__(
+        self,
+        redis=None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+        rng: random.Random = None,
+        lease: float = None,
+        poll_interval: float = None,
+        prefix: str = "scheduler",
+    ):
+        self.redis = redis or redis_client
+        self.clock = clock
+        self.sleep = sleep
+        self.random = rng or random.Random()
+        self.lease = lease or settings.SCHEDULER_LOCK_LEASE
+        self.poll_interval = poll_interval or settings.SCHEDULER_POLL_INTERVAL
+        self.prefix = prefix
+        self.token = uuid.uuid4().hex
+        self.tasks: Dict[str, ScheduledTask] = {}
+        self.task: Optional[asyncio.Task] = None
+
+    def register(
+        self,
+        name: str,
+        func: Callable[[], Awaitable],
+        schedule: Union[str, float],
+        jitter: float = None,
+    ):
+        if name in self.tasks:
+            raise ValueError(f"Task {name} is already registered")
+        jitter = settings.SCHEDULER_JITTER if jitter is None else jitter
+        self.tasks[name] = ScheduledTask(name, func, schedule, jitter)
+
+    def lock_key(self, task: ScheduledTask) -> str:
+        return f"{self.prefix}:lock:{task.name}"
+
+    def next_key(self, task: ScheduledTask) -> str:
+        return f"{self.prefix}:next:{task.name}"
+
+    async def set_next_run(self, task: ScheduledTask, now: float):
+        task.next_run = task.schedule.next_after(now)
+        task.next_run += self.random.uniform(0, task.jitter)
+        await self.redis.set(
+            self.next_key(task),
+            repr(task.next_run),
+            int(task.next_run - now) + constant.SCHEDULER_STATE_EXPIRE,
+        )
+
+    async def claim(self, task: ScheduledTask, now: float) -> bool:
+        """Take the lock of a due task, False when it is not this process' run"""
+        if not await self.redis.acquire_lock(
+            self.lock_key(task), self.token, self.lease
+        ):
+            # Running elsewhere, look again when its next slot is due.
+            shared = await self.redis.get(self.next_key(task))
+            task.next_run = max(float(shared or 0), now + self.poll_interval)
+            return False
+        shared = await self.redis.get(self.next_key(task))
+        if shared is None or float(shared) > now:
+            # A first start only schedules the task, and a slot that moved
+            # forward has been run by another process.
+            if shared is None:
+                await self.set_next_run(task, now)
+            else:
+                task.next_run = float(shared)
+            await self.redis.release_lock(self.lock_key(task), self.token)
+            return False
+        await self.set_next_run(task, now)
+        return True
+
+    async def renew(self, task: ScheduledTask):
+        while True:
+            await self.sleep(self.lease / 3)
+            try:
+                if not await self.redis.renew_lock(
+                    self.lock_key(task), self.token, self.lease
+                ):
+                    task.lock_lost = True
+                    logger.warning("Scheduled task %s lost its lock", task.name)
+                    return
+            except Exception as e:
+                logger.warning("Renew lock of %s failed: %s", task.name, e)
+
+    async def run_task(self, task: ScheduledTask):
+        task.lock_lost = False
+        renewal = asyncio.create_task(self.renew(task))
+        started_at = self.clock()
+        result = "error"
+        try:
+            await task.func()
+            result = "success"
+        except Exception:
+            logger.exception("Scheduled task %s failed", task.name)
+        finally:
+            renewal.cancel()
+            if task.lock_lost:
+                result = "lock_lost"
+            try:
+                await self.redis.release_lock(self.lock_key(task), self.token)
+            except Exception as e:
+                logger.warning("Release lock of %s failed: %s", task.name, e)
+            finished_at = self.clock()
+            record_task_run(task.name, result, finished_at - started_at, finished_at)
+
+    async def tick(self) -> list:
+        """Start the due tasks this process wins, returns their asyncio tasks"""
+        now = self.clock()
+        started = []
+        for task in self.tasks.values():
+            if task.is_running():
+                continue
+            if task.next_run is not None and task.next_run > now:
+                continue
+            try:
+                claimed = await self.claim(task, now)
+            except Exception as e:
+                logger.warning("Claim of %s failed: %s", task.name, e)
+                task.next_run = now + self.poll_interval
+                continue
+            if claimed:
+                task.running = asyncio.create_task(self.run_task(task))
+                started.append(task.running)
+        return started
+
+    def delay(self) -> float:
+        now = self.clock()
+        due = [
+            task.next_run - now
+            for task in self.tasks.values()
+            if task.next_run is not None and not task.is_running()
+        ]
+        return max(0, min(due + [self.poll_interval]))
+
+    async def run(self):
+        while True:
+            try:
+                await self.tick()
+            except Exception:
+                logger.exception("Scheduler tick failed")
+            await self.sleep(self.delay())
+
+    def start(self):
+        if self.task is None and self.tasks:
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        running = [task.running for task in self.tasks.values() if task.is_running()]
+        for run in running:
+            run.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
@@ -1,13 +1,84 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
 from fastapi.security import HTTPBearer
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 oauth2_scheme = HTTPBearer(scheme_name="Authorization")
 
 
-def get_password_hash(password: str):
+def _hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def _verify_password(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    # verify_and_update returns a new hash when the stored one uses an old cost
+    return pwd_context.verify_and_update(password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a bounded process pool.
+
+    A hash costs hundreds of milliseconds of CPU, run inline it holds the GIL
+    and starves every other request of the worker. Calls past max_pending are
+    refused with 503 instead of queuing behind a login burst.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.pending = threading.BoundedSemaphore(max_pending)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def run(self, fn, *args):
+        if not self.pending.acquire(blocking=False):
+            raise HTTPException(
+                status_code=503,
+                detail="Server is busy, please try again",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            return self.pool.submit(fn, *args).result()
+        finally:
+            self.pending.release()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+def get_password_hash(password: str):
+    return password_hasher.run(_hash_password, password)
+
+
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.run(_verify_password, plain_password, hashed_password)[0]
+
+
+def verify_and_update_password(
+    plain_password, hashed_password
+) -> Tuple[bool, Optional[str]]:
+    """Verify a password, with the rehashed value when BCRYPT_ROUNDS changed"""
+    return password_hasher.run(_verify_password, plain_password, hashed_password)
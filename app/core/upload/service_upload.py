@@ -0,0 +1,143 @@
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.crud import (
+    company as companyCRUD,
+    manager_base as manager_baseCRUD,
+    user as userCRUD,
+    social_network as social_networkCRUD,
+)
+from app.schema import (
+    upload as schema_upload,
+    manager_base as schema_manager_base,
+    user as schema_user,
+)
+from app.core import constant
+from app.core.company import service_company
+from app.hepler.enum import FolderBucket, Role
+from app.hepler.exception_handler import get_message_validation_error
+from app.hepler.generate_file_name import generate_file_name
+from app.storage.s3 import s3_service
+from app.storage.image import image_processor
+
+
+def get_upload_prefix(owner, type: FolderBucket) -> str:
+    # Users, social network accounts and businesses are separate id spaces,
+    # the role of the account keeps their keys apart.
+    return f"{Role(owner.role).value}/{owner.id}/{type.value}/"
+
+
+def create_upload_intent(data: dict, owner, allowed_types: List[FolderBucket]):
+    try:
+        upload_data = schema_upload.UploadIntentRequest(**data)
+    except Exception as e:
+        return constant.ERROR, 400, get_message_validation_error(e)
+    if upload_data.type not in allowed_types:
+        return constant.ERROR, 403, "Permission denied"
+
+    _, max_size = schema_upload.UPLOAD_RULES[upload_data.type]
+    key = generate_file_name(
+        get_upload_prefix(owner, upload_data.type).rstrip("/"),
+        upload_data.file_name,
+    )
+    presigned = s3_service.generate_presigned_post(
+        key, upload_data.content_type, max_size, constant.PRESIGNED_URL_EXPIRE
+    )
+    if presigned is None:
+        return constant.ERROR, 501, "Direct upload is not supported by the storage"
+    return (
+        constant.SUCCESS,
+        200,
+        {
+            "key": key,
+            "url": presigned["url"],
+            "fields": presigned["fields"],
+            "expires_in": constant.PRESIGNED_URL_EXPIRE,
+        },
+    )
+
+
+def check_uploaded_file(upload_data, owner):
+    if not upload_data.key.startswith(get_upload_prefix(owner, upload_data.type)):
+        return constant.ERROR, 403, "Permission denied"
+    uploaded = s3_service.head_file(upload_data.key)
+    if not uploaded:
+        return constant.ERROR, 404, "File not found"
+    allowed_types, max_size = schema_upload.UPLOAD_RULES[upload_data.type]
+    content_type = uploaded["content_type"]
+    if uploaded["size"] > max_size or (
+        content_type and content_type not in allowed_types
+    ):
+        s3_service.delete_file(upload_data.key)
+        return constant.ERROR, 400, "Invalid file"
+    return constant.SUCCESS, 200, upload_data.key
+
+
+def confirm_business_upload(db: Session, data: dict, current_user):
+    try:
+        upload_data = schema_upload.UploadConfirmRequest(**data)
+    except Exception as e:
+        return constant.ERROR, 400, get_message_validation_error(e)
+    if upload_data.type not in [FolderBucket.LOGO, FolderBucket.AVATAR]:
+        return constant.ERROR, 403, "Permission denied"
+    status, status_code, response = check_uploaded_file(upload_data, current_user)
+    if status == constant.ERROR:
+        return status, status_code, response
+
+    if upload_data.type == FolderBucket.LOGO:
+        company = companyCRUD.get_company_by_business_id(db, current_user.id)
+        if not company:
+            return constant.ERROR, 404, "Business not join company"
+        company.logo_thumbnail = None
+        company = companyCRUD.update(
+            db, db_obj=company, obj_in={"logo": upload_data.key}
+        )
+        image_processor.generate(companyCRUD.model, company.id, "logo", upload_data.key)
+        return (
+            constant.SUCCESS,
+            200,
+            service_company.get_company_info_private(db, company),
+        )
+
+    current_user.avatar_thumbnail = None
+    manager_base = manager_baseCRUD.update(
+        db, db_obj=current_user, obj_in={"avatar": upload_data.key}
+    )
+    image_processor.generate(
+        manager_baseCRUD.model, manager_base.id, "avatar", upload_data.key
+    )
+    return (
+        constant.SUCCESS,
+        200,
+        schema_manager_base.ManagerBaseItemResponse(**manager_base.__dict__),
+    )
+
+
+def confirm_user_upload(db: Session, data: dict, current_user):
+    try:
+        upload_data = schema_upload.UploadConfirmRequest(**data)
+    except Exception as e:
+        return constant.ERROR, 400, get_message_validation_error(e)
+    if upload_data.type not in [FolderBucket.AVATAR, FolderBucket.CV]:
+        return constant.ERROR, 403, "Permission denied"
+    status, status_code, response = check_uploaded_file(upload_data, current_user)
+    if status == constant.ERROR:
+        return status, status_code, response
+
+    if upload_data.type == FolderBucket.CV:
+        # The key is stored on CVApplication.cv when the user applies to a job.
+        return (
+            constant.SUCCESS,
+            200,
+            {"key": upload_data.key, "url": s3_service.get_file_url(upload_data.key)},
+        )
+
+    if current_user.role != Role.USER:
+        user = social_networkCRUD.update(
+            db, db_obj=current_user, obj_in={"avatar": upload_data.key}
+        )
+        return constant.SUCCESS, 200, schema_user.UserItemResponse(**user.__dict__)
+    current_user.avatar_thumbnail = None
+    user = userCRUD.update(db, db_obj=current_user, obj_in={"avatar": upload_data.key})
+    image_processor.generate(userCRUD.model, user.id, "avatar", upload_data.key)
+    return constant.SUCCESS, 200, schema_user.UserItemResponse(**user.__dict__)
@@ -9,8 +9,9 @@ from app.schema import (
 )
 from app.core.auth.service_user_auth import signJWT, signJWTRefreshToken
 from app.hepler.exception_handler import get_message_validation_error
-from app.hepler.enum import Role
+from app.hepler.enum import Role, FolderBucket
 from app.storage.s3 import s3_service
+from app.storage.image import image_processor
 
 
 def get_me(current_user):
@@ -70,12 +71,25 @@ def create(db: Session, data: dict):
     if user:
         return constant.ERROR, 409, "Email already registered"
     avatar = user_data.avatar
+    key = s3_service.content_key(avatar, FolderBucket.AVATAR.value) if avatar else None
     if avatar:
-        key = avatar.filename
-        s3_service.upload_file(avatar, key)
         user_data.avatar = key
     obj_in = schema_user.UserCreate(**user_data.__dict__)
-    user = userCRUD.create(db, obj_in=obj_in)
+
+    upload = s3_service.upload_file_background(avatar, key) if avatar else None
+    try:
+        user = userCRUD.create(db, obj_in=obj_in)
+    except Exception:
+        if upload:
+            upload.discard()
+        raise
+    if upload and not upload.succeeded():
+        userCRUD.remove(db, id=user.id)
+        return constant.ERROR, 500, "Upload avatar failed"
+    if avatar:
+        image_processor.generate_from_file(
+            avatar, userCRUD.model, user.id, "avatar", key
+        )
     user_reponse = schema_user.UserItemResponse(**user.__dict__)
 
     access_token = signJWT(user)
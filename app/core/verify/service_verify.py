@@ -1,107 +1,121 @@
+import asyncio
 from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 import uuid
 
+from app.db.base import SessionLocal
 from app.hepler.verify_code import generate_code
 from app.crud.verify_code import verify_code as verify_codeCRUD
 from app.crud.verify_code_block import verify_code_block as verify_code_blockCRUD
 from app.crud.business import business as businessCRUD
 from app.schema.verify_code import VerifyCodeCreate, VerifyCodeUpdate, VerifyCodeRequest
 from app.schema.verify_code_block import VerifyCodeBlockCreate
-from app.hepler.enum import VerifyCodeType
+from app.hepler.enum import VerifyCodeType, VerifyCodeStatus
 from app.core import constant
-from app.core.email.service_email import (
-    send_email_background,
-    read_email_templates,
-    fill_template,
-)
+from app.core.config import settings
+from app.core.email.service_email import enqueue_email
+from app.core.email.template import email_templates
 from app.hepler.exception_handler import get_message_validation_error
+from app.storage.otp import otp_store, OTPResult
 
 
 async def send_verify_background(
-    db: Session, background_tasks: BackgroundTasks, data: dict, current_user
+    db: Session, redis, background_tasks: BackgroundTasks, data: dict, current_user
 ):
     if data.get("type") == VerifyCodeType.EMAIL:
-        if not current_user.business:
+        # The handlers are async, the session is only used off the event loop.
+        business = await asyncio.to_thread(getattr, current_user, "business")
+        if not business:
             return constant.ERROR, 400, "Business not found"
-        if current_user.business.is_verified_email:
+        if business.is_verified_email:
             return constant.ERROR, 400, "Email is verified"
-        verify_code_block = verify_code_blockCRUD.search(
-            db, email=current_user.email, delta=5
-        )
-        if verify_code_block:
-            return constant.ERROR, 400, "Please wait 5 minutes to resend email"
 
+        # Read before the outbox commit expires the loaded attributes.
         email_to = current_user.email
+        manager_base_id = current_user.id
         subject = "Verify Email"
         verify_code = generate_code(6)
         session_id = str(uuid.uuid4())
 
-        body = fill_template(
-            await read_email_templates("email.html"),
+        issued = await otp_store.issue(
+            redis, session_id, email_to, verify_code, manager_base_id
+        )
+        if not issued:
+            return constant.ERROR, 400, "Please wait 5 minutes to resend email"
+
+        body = email_templates.render(
+            "email.html",
             email=email_to,
             verify_code=verify_code,
             full_name=current_user.full_name,
             title="xác thực tài khoản",
         )
 
-        obj_in = VerifyCodeCreate(
-            manager_base_id=current_user.id,
-            email=email_to,
-            code=verify_code,
-            session_id=session_id,
-        )
-
-        verify_codeCRUD.create(db, obj_in=obj_in)
-
-        response = await send_email_background(
-            db, background_tasks, subject, email_to, body
-        )
-        if response:
-            return constant.SUCCESS, 200, {"session_id": session_id}
-        return constant.ERROR, 400, "Send email failed"
+        response = await asyncio.to_thread(enqueue_email, db, subject, email_to, body)
+        if not response:
+            return constant.ERROR, 400, "Send email failed"
+        if settings.OTP_AUDIT_ENABLED:
+            background_tasks.add_task(
+                audit_code_issued,
+                VerifyCodeCreate(
+                    manager_base_id=manager_base_id,
+                    email=email_to,
+                    code=verify_code,
+                    session_id=session_id,
+                ),
+            )
+        return constant.SUCCESS, 200, {"session_id": session_id}
 
 
-def verify_code(db: Session, data: dict, current_user):
+async def verify_code(
+    db: Session, redis, background_tasks: BackgroundTasks, data: dict, current_user
+):
     try:
         data = VerifyCodeRequest(**data)
     except Exception as e:
         return constant.ERROR, 404, get_message_validation_error(e)
-    code_block = verify_code_blockCRUD.search(db, email=current_user.email, delta=5)
-    if code_block:
-        return constant.ERROR, 400, "Please wait 5 minutes to resend email"
-    code_by_session_id_and_email = (
-        verify_codeCRUD.get_valid_code_by_session_id_and_email(
-            db, data.session_id, current_user.email, 5
-        )
+    result, attempts = await otp_store.verify(
+        redis, data.session_id, current_user.email, data.code
     )
-    if not code_by_session_id_and_email:
+    if result == OTPResult.BLOCKED:
+        return constant.ERROR, 400, "Please wait 5 minutes to resend email"
+    if result == OTPResult.NOT_FOUND:
         return constant.ERROR, 404, "Verify code not found"
-    if code_by_session_id_and_email.code != data.code:
-        if code_by_session_id_and_email.failed_attempts >= 4:
-            verify_codeCRUD.remove(db=db, id=code_by_session_id_and_email.id)
-            verify_code_blockCRUD.create(
-                db,
-                obj_in=VerifyCodeBlockCreate(
-                    email=current_user.email,
-                    delta=5,
-                ),
-            )
-            return (
-                constant.ERROR,
-                400,
-                "Verify code is incorrect. Please wait 5 minutes to resend email",
-            )
-        verify_codeCRUD.update(
-            db,
-            db_obj=code_by_session_id_and_email,
-            obj_in=VerifyCodeUpdate(
-                failed_attempts=code_by_session_id_and_email.failed_attempts + 1
-            ),
+    if settings.OTP_AUDIT_ENABLED:
+        background_tasks.add_task(
+            audit_code_checked, data.session_id, current_user.email, result, attempts
         )
+    if result == OTPResult.LOCKED_OUT:
+        return (
+            constant.ERROR,
+            400,
+            "Verify code is incorrect. Please wait 5 minutes to resend email",
+        )
+    if result == OTPResult.INCORRECT:
         return constant.ERROR, 404, "Verify code is incorrect"
-    verify_codeCRUD.remove(db=db, id=code_by_session_id_and_email.id)
+
+    await asyncio.to_thread(set_verified_email, db, current_user)
+    return constant.SUCCESS, 200, "Verify code is correct"
+
+
+def set_verified_email(db: Session, current_user):
     businessCRUD.set_is_verified_email(
         db=db, db_obj=current_user.business, is_verified_email=True
     )
-    return constant.SUCCESS, 200, "Verify code is correct"
+
+
+def audit_code_issued(obj_in: VerifyCodeCreate):
+    with SessionLocal() as db:
+        verify_codeCRUD.create(db, obj_in=obj_in)
+
+
+def audit_code_checked(session_id: str, email: str, result: int, attempts: int):
+    with SessionLocal() as db:
+        code = verify_codeCRUD.get_by_session_id(db, session_id)
+        if code:
+            obj_in = VerifyCodeUpdate(failed_attempts=attempts)
+            if result == OTPResult.VERIFIED:
+                obj_in = VerifyCodeUpdate(status=VerifyCodeStatus.INACTIVE)
+            verify_codeCRUD.update(db, db_obj=code, obj_in=obj_in)
+        if result == OTPResult.LOCKED_OUT:
+            verify_code_blockCRUD.create(db, obj_in=VerifyCodeBlockCreate(email=email))
@@ -15,11 +15,14 @@ from app.hepler.response_custom import custom_response_error
 
 def get_work_locations_by_job_id(db: Session, job_id: int):
     work_locations = work_locationCRUD.get_work_locations_by_job_id(db, job_id=job_id)
-    work_locations_response = []
-    for work_location in work_locations:
-        work_location = get_work_location_by_work_location_id(db, work_location)
-        work_locations_response.append(work_location)
-    return work_locations_response
+    return get_list_work_location_by_model(db, work_locations)
+
+
+def get_list_work_location_by_model(db: Session, work_locations):
+    return [
+        get_work_location_by_work_location_id(db, work_location)
+        for work_location in work_locations
+    ]
 
 
 def get_work_location_by_id(db: Session, work_location_id: int):
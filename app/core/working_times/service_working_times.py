@@ -9,6 +9,10 @@ from app.hepler.response_custom import custom_response_error
 
 def get_working_times_by_job_id(db: Session, job_id: int):
     working_times = working_timeCRUD.get_working_times_by_job_id(db, job_id=job_id)
+    return get_list_working_time_by_model(db, working_times)
+
+
+def get_list_working_time_by_model(db: Session, working_times):
     return [
         working_time_schema.WorkingTimeResponse(**working_time.__dict__)
         for working_time in working_times
@@ -21,3 +21,8 @@ from .skill import skill
 from .working_time import working_time
 from .work_location import work_location
 from .job_approval_request import job_approval_request
+from .email_outbox import email_outbox
+from .work_market import work_market
+from .cruitment_demand import cruitment_demand
+from .retention import retention
+from .job_archive import job_archive
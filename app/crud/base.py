@@ -1,7 +1,8 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, Query
 
 from app.db.base_class import Base
 from app.hepler.enum import Role
@@ -11,6 +12,17 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def supports_window_functions(db: Session) -> bool:
+    """COUNT(*) OVER() needs MySQL 8, MariaDB 10.2 or SQLite 3.25"""
+    dialect = db.get_bind().dialect
+    version = dialect.server_version_info or ()
+    if dialect.name == "mysql":
+        return version >= ((10, 2) if dialect.is_mariadb else (8, 0))
+    if dialect.name == "sqlite":
+        return version >= (3, 25)
+    return True
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
@@ -39,6 +51,53 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .all()
         )
 
+    def page(
+        self,
+        db: Session,
+        query: Query,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        sort_by: str = "id",
+        order_by: str = "desc",
+        count_limit: Optional[int] = None,
+    ) -> Tuple[List[ModelType], int]:
+        """
+        One page of a filtered query and the number of rows it matches.
+
+        The total comes from COUNT(*) OVER() in the page statement itself,
+        with a separate count only on servers without window functions or
+        for a page past the end. With count_limit the total is counted up
+        to that many rows only, for result sets too large to count exactly.
+        """
+        query = query.order_by(
+            getattr(self.model, sort_by).desc()
+            if order_by == "desc"
+            else getattr(self.model, sort_by)
+        )
+        if count_limit is None and supports_window_functions(db):
+            rows = (
+                query.add_columns(func.count().over().label("total"))
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+            if rows:
+                return [row[0] for row in rows], rows[0].total
+            items = []
+        else:
+            items = query.offset(skip).limit(limit).all()
+        if len(items) < limit and (items or not skip):
+            return items, skip + len(items)
+        return items, self.count_query(db, query, count_limit)
+
+    def count_query(self, db: Session, query: Query, limit: Optional[int] = None):
+        """Rows matched by a query, counting no further than limit"""
+        query = query.order_by(None)
+        if limit is not None:
+            query = query.limit(limit)
+        return db.query(func.count()).select_from(query.subquery()).scalar()
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)
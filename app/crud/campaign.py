@@ -19,13 +19,12 @@ class CRUDCampaign(CRUDBase[Campaign, CampaignCreate, CampaignUpdate]):
         order_by: OrderType = OrderType.DESC,
         status: CampaignStatus = None,
     ):
-        query = db.query(self.model)
-        if business_id:
-            query = query.filter(self.model.business_id == business_id)
-        if company_id:
-            query = query.filter(self.model.company_id == company_id)
-        if status:
-            query = query.filter(self.model.status == status)
+        query = self.apply_filters(
+            db.query(self.model),
+            business_id=business_id,
+            company_id=company_id,
+            status=status,
+        )
         return (
             query.order_by(
                 getattr(self.model, sort_by).desc()
@@ -45,14 +44,44 @@ class CRUDCampaign(CRUDBase[Campaign, CampaignCreate, CampaignUpdate]):
         company_id: int = None,
         status: CampaignStatus = None,
     ):
-        query = db.query(self.model)
+        query = self.apply_filters(
+            db.query(self.model),
+            business_id=business_id,
+            company_id=company_id,
+            status=status,
+        )
+        return query.count()
+
+    def get_page(
+        self,
+        db: Session,
+        *,
+        business_id: int = None,
+        company_id: int = None,
+        skip=0,
+        limit=10,
+        sort_by: SortBy = SortBy.ID,
+        order_by: OrderType = OrderType.DESC,
+        status: CampaignStatus = None,
+    ):
+        query = self.apply_filters(
+            db.query(self.model),
+            business_id=business_id,
+            company_id=company_id,
+            status=status,
+        )
+        return self.page(
+            db, query, skip=skip, limit=limit, sort_by=sort_by, order_by=order_by
+        )
+
+    def apply_filters(self, query, *, business_id, company_id, status):
         if business_id:
             query = query.filter(self.model.business_id == business_id)
-        if status:
-            query = query.filter(self.model.status == status)
         if company_id:
             query = query.filter(self.model.company_id == company_id)
-        return query.count()
+        if status:
+            query = query.filter(self.model.status == status)
+        return query
 
 
 campaign = CRUDCampaign(Campaign)
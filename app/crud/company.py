@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct
+from sqlalchemy import func, distinct, select
 
 from .base import CRUDBase
 from app.model import Company
@@ -52,22 +52,24 @@ class CRUDCompany(CRUDBase[Company, CompanyCreateRequest, CompanyUpdateRequest])
 
         query = db.query(self.model)
         query = self.apply_search_multi(query, **kwargs)
-        total = query.count()
-        query = query.order_by(
-            getattr(self.model, sort_by).desc()
-            if order_by == "desc"
-            else getattr(self.model, sort_by)
+        companies, total = self.page(
+            db, query, skip=skip, limit=limit, sort_by=sort_by, order_by=order_by
         )
-        query = query.offset(skip).limit(limit)
-        return total, query.all()
+        return total, companies
 
     def apply_search_multi(self, query, **kwargs):
         key_word = kwargs.get("keyword")
         fields = kwargs.get("fields")
 
         if fields:
-            query = query.join(CompanyField, CompanyField.company_id == Company.id)
-            query = query.filter(CompanyField.field_id.in_(fields))
+            # A semi-join, so a company with several of the fields is one row.
+            query = query.filter(
+                Company.id.in_(
+                    select(CompanyField.company_id).where(
+                        CompanyField.field_id.in_(fields)
+                    )
+                )
+            )
 
         if key_word:
             query = query.filter(Company.name.ilike(f"%{key_word}%"))
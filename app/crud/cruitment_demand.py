@@ -0,0 +1,28 @@
+from typing import List
+from sqlalchemy.orm import Session
+
+from .base import CRUDBase
+from app.model import CruitmentDemand
+from app.schema.cruitment_demand import CruitmentDemandCreate, CruitmentDemandUpdate
+
+
+class CRUDCruitmentDemand(
+    CRUDBase[CruitmentDemand, CruitmentDemandCreate, CruitmentDemandUpdate]
+):
+    def get_by_time_scan(self, db: Session, time_scan) -> List[CruitmentDemand]:
+        return db.query(self.model).filter(self.model.time_scan == time_scan).all()
+
+    def get_by_key(self, db: Session, key: str, start, end) -> List[CruitmentDemand]:
+        return (
+            db.query(self.model)
+            .filter(
+                self.model.key == key,
+                self.model.time_scan >= start,
+                self.model.time_scan < end,
+            )
+            .order_by(self.model.time_scan)
+            .all()
+        )
+
+
+cruitment_demand = CRUDCruitmentDemand(CruitmentDemand)
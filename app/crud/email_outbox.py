@@ -0,0 +1,77 @@
+from typing import List
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from datetime import datetime, timedelta
+
+from .base import CRUDBase
+from app.model import EmailOutbox
+from app.schema.email_outbox import EmailOutboxCreate, EmailOutboxUpdate
+from app.hepler.enum import EmailOutboxStatus
+
+
+class CRUDEmailOutbox(CRUDBase[EmailOutbox, EmailOutboxCreate, EmailOutboxUpdate]):
+    def now(self, db: Session) -> datetime:
+        # next_attempt_at and created_at default to the database clock, every
+        # time they are compared with or written here comes from it as well.
+        return db.query(func.now()).scalar()
+
+    def claim_batch(self, db: Session, limit: int, lease: int) -> List[EmailOutbox]:
+        # Rows stuck in SENDING past their lease belong to a worker that died
+        # mid-batch, so they are claimed again like pending rows.
+        now = self.now(db)
+        rows = (
+            db.query(EmailOutbox)
+            .filter(
+                or_(
+                    EmailOutbox.status == EmailOutboxStatus.PENDING,
+                    EmailOutbox.status == EmailOutboxStatus.SENDING,
+                ),
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for row in rows:
+            row.status = EmailOutboxStatus.SENDING
+            row.attempts += 1
+            row.next_attempt_at = now + timedelta(seconds=lease)
+        db.commit()
+        return rows
+
+    def mark_sent(self, db: Session, ids: List[int]) -> None:
+        if not ids:
+            return
+        db.query(EmailOutbox).filter(EmailOutbox.id.in_(ids)).update(
+            {
+                EmailOutbox.status: EmailOutboxStatus.SENT,
+                EmailOutbox.sent_at: func.now(),
+                EmailOutbox.last_error: None,
+            },
+            synchronize_session=False,
+        )
+        db.commit()
+
+    def mark_failed(
+        self, db: Session, id: int, error: str, retry_in: float = None
+    ) -> None:
+        # Without a retry delay the message has used up its attempts.
+        retry_at = None
+        if retry_in is not None:
+            retry_at = self.now(db) + timedelta(seconds=retry_in)
+        db.query(EmailOutbox).filter(EmailOutbox.id == id).update(
+            {
+                EmailOutbox.status: (
+                    EmailOutboxStatus.PENDING if retry_at else EmailOutboxStatus.FAILED
+                ),
+                EmailOutbox.next_attempt_at: retry_at,
+                EmailOutbox.last_error: error,
+            },
+            synchronize_session=False,
+        )
+        db.commit()
+
+
+email_outbox = CRUDEmailOutbox(EmailOutbox)
@@ -1,11 +1,10 @@
 from typing import Type
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
-from sqlalchemy import distinct
+from sqlalchemy import case, distinct, select, update
 
 from .base import CRUDBase
 from app.model.job import Job
-from app.model.job_approval_request import JobApprovalRequest
 from app.model.business import Business
 from app.model.work_location import WorkLocation
 from app.model.province import Province
@@ -13,16 +12,18 @@ from app.model.district import District
 from app.model.campaign import Campaign
 from app.model.field import Field
 from app.model.job_category import JobCategory
+from app.model.job_position import JobPosition
+from app.model.category import Category
 from app.model.company import Company
 from app.model.company_field import CompanyField
 from app.schema.job import JobCreate, JobUpdate
 from app.hepler.enum import JobStatus, SalaryType, JobApprovalStatus
+from app.core.query_stats import estimate_rows
 
 
 class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
     def __init__(self, model: Type[Job]):
         super().__init__(model)
-        self.job_approval_request = JobApprovalRequest
         self.business = Business
         self.work_location = WorkLocation
         self.province = Province
@@ -39,11 +40,6 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         **kwargs,
     ):
         query = db.query(self.model)
-        if kwargs.get("province_id") or kwargs.get("district_id"):
-            query = query.join(
-                self.work_location, self.model.id == self.work_location.job_id
-            )
-
         query = self.apply_filters(
             query,
             **kwargs,
@@ -60,10 +56,24 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             )
             .offset(skip)
             .limit(limit)
-            .distinct()
             .all()
         )
 
+    def get_page(
+        self,
+        db: Session,
+        **kwargs,
+    ):
+        query = self.apply_filters(db.query(self.model), **kwargs)
+        return self.page(
+            db,
+            query,
+            skip=kwargs.get("skip", 0),
+            limit=kwargs.get("limit", 10),
+            sort_by=kwargs.get("sort_by", "id"),
+            order_by=kwargs.get("order_by", "desc"),
+        )
+
     def get_by_campaign_id(self, db: Session, campaign_id: int):
         return (
             db.query(self.model).filter(self.model.campaign_id == campaign_id).first()
@@ -74,16 +84,24 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         db: Session,
         **kwargs,
     ):
-        query = db.query(self.model)
-        if kwargs.get("province_id") or kwargs.get("district_id"):
-            query = query.join(
-                self.work_location, self.model.id == self.work_location.job_id
-            )
+        count_limit = kwargs.get("count_limit")
+        if count_limit is not None:
+            query = self.apply_filters(db.query(self.model.id), **kwargs)
+            return self.count_query(db, query, count_limit)
+        query = db.query(func.count()).select_from(self.model)
         query = self.apply_filters(
             query,
             **kwargs,
         )
-        return query.distinct().count()
+        return query.scalar()
+
+    def estimate_count(
+        self,
+        db: Session,
+        **kwargs,
+    ):
+        query = self.apply_filters(db.query(self.model.id), **kwargs)
+        return estimate_rows(db, query.statement)
 
     def search(
         self,
@@ -94,16 +112,9 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         limit = kwargs.get("limit", 10)
         sort_by = kwargs.get("sort_by", "id")
         order_by = kwargs.get("order_by", "desc")
-        province_id = kwargs.get("province_id")
-        district_id = kwargs.get("district_id")
 
-        jobs_query = db.query(self.model)
-        if province_id or district_id:
-            jobs_query = jobs_query.join(
-                self.work_location, self.model.id == self.work_location.job_id
-            )
         jobs = (
-            self.apply_filters(jobs_query, **kwargs)
+            self.apply_filters(db.query(self.model), **kwargs)
             .order_by(
                 getattr(self.model, sort_by).desc()
                 if order_by == "desc"
@@ -111,7 +122,6 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             )
             .offset(skip)
             .limit(limit)
-            .distinct()
             .all()
         )
 
@@ -126,6 +136,16 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             func.count(distinct(self.model.id)),
         )
         query = query.join(self.model, self.work_location.job_id == self.model.id)
+        # apply_filters matches jobs with any location in the province, only
+        # the locations inside it are counted here.
+        if filters.get("province_id"):
+            query = query.filter(
+                self.work_location.province_id == filters["province_id"]
+            )
+        if filters.get("district_id"):
+            query = query.filter(
+                self.work_location.district_id == filters["district_id"]
+            )
         query = self.apply_filters(query, **filters)
         query = query.group_by(
             self.work_location.district_id,
@@ -152,50 +172,60 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         keyword = filters.get("keyword")
         approved_time = filters.get("approved_time")
 
+        # One-to-many filters are semi-joins, a job matches once however
+        # many of its rows do, so the queries need no DISTINCT.
         if company_id or field_id:
-            query = query.join(
-                self.campaign, self.model.campaign_id == self.campaign.id
-            )
+            campaigns = select(self.campaign.id)
             if company_id:
-                query = query.filter(self.campaign.company_id == company_id)
+                campaigns = campaigns.where(self.campaign.company_id == company_id)
             if field_id:
-                query = query.join(
-                    self.company, self.campaign.company_id == self.company.id
+                campaigns = campaigns.where(
+                    self.campaign.company_id.in_(
+                        select(self.company_field.company_id).where(
+                            self.company_field.field_id == field_id
+                        )
+                    )
                 )
-                query = query.join(
-                    self.company_field, self.company.id == self.company_field.company_id
-                ).filter(self.company_field.field_id == field_id)
+            query = query.filter(self.model.campaign_id.in_(campaigns))
         if campaign_id:
             query = query.filter(self.model.campaign_id == campaign_id)
         if business_id:
             query = query.filter(self.model.business_id == business_id)
         if job_status:
             query = query.filter(self.model.status == job_status)
-        if job_approve_status or approved_time:
-            query = query.join(
-                self.job_approval_request,
-                self.model.id == self.job_approval_request.job_id,
+        if approved_time:
+            query = query.filter(
+                self.model.approved_at >= approved_time,
+                self.model.approval_status == JobApprovalStatus.APPROVED,
             )
-            if approved_time:
-                query = query.filter(
-                    self.job_approval_request.updated_at >= approved_time,
-                    self.job_approval_request.status == JobApprovalStatus.APPROVED,
-                )
-            elif job_approve_status:
-                query = query.filter(
-                    self.job_approval_request.status == job_approve_status
-                )
+        elif job_approve_status:
+            query = query.filter(self.model.approval_status == job_approve_status)
 
         if province_id or district_id:
-
+            locations = (
+                select(self.work_location.id)
+                .where(self.work_location.job_id == self.model.id)
+                .correlate(self.model)
+            )
             if province_id:
-                query = query.filter(self.work_location.province_id == province_id)
+                locations = locations.where(
+                    self.work_location.province_id == province_id
+                )
             if district_id:
-                query = query.filter(self.work_location.district_id == district_id)
+                locations = locations.where(
+                    self.work_location.district_id == district_id
+                )
+            query = query.filter(locations.exists())
         if category_id:
-            query = query.join(
-                self.job_category, self.model.id == self.job_category.job_id
-            ).filter(self.job_category.category_id == category_id)
+            query = query.filter(
+                select(self.job_category.id)
+                .where(
+                    self.job_category.job_id == self.model.id,
+                    self.job_category.category_id == category_id,
+                )
+                .correlate(self.model)
+                .exists()
+            )
         if employment_type:
 
             query = query.filter(self.model.employment_type == employment_type)
@@ -225,12 +255,10 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
     def count_job_by_category(self, db: Session):
         return (
             db.query(self.job_category.category_id, func.count(distinct(self.model.id)))
-            .join(
-                self.job_category,
-                (
-                    self.model.id == self.job_category.job_id
-                    and self.model.deadline >= func.now()
-                ),
+            .join(self.job_category, self.model.id == self.job_category.job_id)
+            .filter(
+                self.model.status == JobStatus.PUBLISHED,
+                self.model.approval_status == JobApprovalStatus.APPROVED,
             )
             .group_by(self.job_category.category_id)
             .order_by(func.count(distinct(self.model.id)).desc())
@@ -241,11 +269,13 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         salary_ranges_query = []
         for salary_range in salary_ranges:
             min_salary, max_salary, type = salary_range
-            query = db.query(func.count(distinct(self.model.id)))
+            query = db.query(func.count(self.model.id)).filter(
+                self.model.status == JobStatus.PUBLISHED,
+                self.model.approval_status == JobApprovalStatus.APPROVED,
+            )
             if type == SalaryType.DEAL:
                 query = query.filter(
                     self.model.salary_type == type,
-                    self.model.deadline >= func.now(),
                 )
             else:
                 if max_salary > 0:
@@ -253,13 +283,11 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
                         self.model.min_salary >= min_salary * 1000000,
                         self.model.max_salary < max_salary * 1000000,
                         self.model.salary_type == type,
-                        self.model.deadline >= func.now(),
                     )
                 else:
                     query = query.filter(
                         self.model.min_salary >= min_salary * 1000000,
                         self.model.salary_type == type,
-                        self.model.deadline >= func.now(),
                     )
 
             salary_ranges_query.append(query.scalar())
@@ -277,5 +305,103 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
             .scalar()
         )
 
+    def active_filters(self, today):
+        return (
+            self.model.status == JobStatus.PUBLISHED,
+            self.model.approval_status == JobApprovalStatus.APPROVED,
+            self.model.deadline >= today,
+        )
+
+    def get_market_stats(self, db: Session, today, approved_time, created_time):
+        # One pass over the active jobs: the counts since approved_time and
+        # created_time are conditional counts of the same rows.
+        return (
+            db.query(
+                func.count(self.model.id),
+                func.count(case((self.model.approved_at >= approved_time, 1))),
+                func.count(case((self.model.created_at >= created_time, 1))),
+                func.count(distinct(self.campaign.company_id)),
+            )
+            .outerjoin(self.campaign, self.model.campaign_id == self.campaign.id)
+            .filter(*self.active_filters(today))
+            .one()
+        )
+
+    def count_active_by_category(self, db: Session, today):
+        return (
+            db.query(
+                self.job_category.category_id,
+                func.count(distinct(self.job_category.job_id)),
+            )
+            .join(self.model, self.model.id == self.job_category.job_id)
+            .filter(*self.active_filters(today))
+            .group_by(self.job_category.category_id)
+            .all()
+        )
+
+    def count_active_by_province(self, db: Session, today):
+        return (
+            db.query(
+                self.work_location.province_id,
+                func.count(distinct(self.work_location.job_id)),
+            )
+            .join(self.model, self.model.id == self.work_location.job_id)
+            .filter(*self.active_filters(today))
+            .group_by(self.work_location.province_id)
+            .all()
+        )
+
+    def get_expired_ids(self, db: Session, today, limit: int):
+        return [
+            id
+            for (id,) in db.query(self.model.id)
+            .filter(
+                self.model.status == JobStatus.PUBLISHED,
+                # Every approval status, so the lookup stays a range scan of
+                # the (status, approval_status, deadline) index.
+                self.model.approval_status.in_(list(JobApprovalStatus)),
+                self.model.deadline < today,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ]
+
+    def expire(self, db: Session, job_ids: list):
+        """
+        Set published jobs to EXPIRED in one statement.
+
+        The Job.status events that keep JobPosition.count and Category.count
+        do not fire for bulk updates, the counters are decreased here by the
+        number of jobs per position and category instead.
+        """
+        positions = (
+            db.query(self.model.job_position_id, func.count())
+            .filter(self.model.id.in_(job_ids))
+            .group_by(self.model.job_position_id)
+            .all()
+        )
+        categories = (
+            db.query(self.job_category.category_id, func.count())
+            .filter(self.job_category.job_id.in_(job_ids))
+            .group_by(self.job_category.category_id)
+            .all()
+        )
+        db.execute(
+            update(self.model)
+            .where(
+                self.model.id.in_(job_ids),
+                self.model.status == JobStatus.PUBLISHED,
+            )
+            .values(status=JobStatus.EXPIRED)
+        )
+        for model, counts in ((JobPosition, positions), (Category, categories)):
+            for id, count in counts:
+                db.execute(
+                    update(model)
+                    .where(model.id == id)
+                    .values(count=model.count - count)
+                )
+        db.commit()
+
 
 job = CRUDJob(Job)
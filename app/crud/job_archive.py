@@ -0,0 +1,132 @@
+from typing import List
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+
+from .base import CRUDBase
+from .retention import retention
+from app.model import (
+    ApprovalLog,
+    ApprovalLogArchive,
+    Campaign,
+    CVApplication,
+    Job,
+    JobApprovalRequest,
+    JobApprovalRequestArchive,
+    JobArchive,
+    JobCategory,
+    JobCategoryArchive,
+    JobReport,
+    JobSkill,
+    JobSkillArchive,
+    UserJobSave,
+    WorkingTime,
+    WorkingTimeArchive,
+    WorkLocation,
+    WorkLocationArchive,
+)
+from app.schema.job import JobCreate, JobUpdate
+from app.hepler.enum import JobApprovalStatus, JobStatus
+
+# Rows moved with their job, in the order their archive tables reference
+# each other.
+JOB_CHILDREN = (
+    (WorkLocation, WorkLocationArchive),
+    (JobCategory, JobCategoryArchive),
+    (JobSkill, JobSkillArchive),
+    (WorkingTime, WorkingTimeArchive),
+    (JobApprovalRequest, JobApprovalRequestArchive),
+)
+
+
+class CRUDJobArchive(CRUDBase[JobArchive, JobCreate, JobUpdate]):
+    def get_multi(
+        self,
+        db: Session,
+        **kwargs,
+    ):
+        query = self.apply_filters(db.query(self.model), **kwargs)
+        skip = kwargs.get("skip", 0)
+        limit = kwargs.get("limit", 10)
+        sort_by = kwargs.get("sort_by", "id")
+        order_by = kwargs.get("order_by", "desc")
+        return (
+            query.order_by(
+                getattr(self.model, sort_by).desc()
+                if order_by == "desc"
+                else getattr(self.model, sort_by)
+            )
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def apply_filters(self, query, **filters):
+        company_id = filters.get("company_id")
+        campaign_id = filters.get("campaign_id")
+        business_id = filters.get("business_id")
+        job_status = filters.get("job_status")
+        job_approve_status = filters.get("job_approve_status")
+
+        if company_id:
+            query = query.filter(
+                self.model.campaign_id.in_(
+                    select(Campaign.id).where(Campaign.company_id == company_id)
+                )
+            )
+        if campaign_id:
+            query = query.filter(self.model.campaign_id == campaign_id)
+        if business_id:
+            query = query.filter(self.model.business_id == business_id)
+        if job_status:
+            query = query.filter(self.model.status == job_status)
+        if job_approve_status:
+            query = query.filter(self.model.approval_status == job_approve_status)
+        return query
+
+    def get_archivable_ids(self, db: Session, before, limit: int) -> List[int]:
+        return [
+            id
+            for (id,) in db.query(Job.id)
+            .filter(
+                Job.status == JobStatus.EXPIRED,
+                # Every approval status, so the lookup stays a range scan of
+                # the (status, approval_status, deadline) index.
+                Job.approval_status.in_(list(JobApprovalStatus)),
+                Job.deadline < before,
+                # Applications and reports reference the job row and are
+                # read by candidates and admins, those jobs stay.
+                ~exists().where(CVApplication.job_id == Job.id),
+                ~exists().where(JobReport.job_id == Job.id),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ]
+
+    def archive(self, db: Session, job_ids: List[int]) -> int:
+        """Move jobs and their child rows to the archive tables in one transaction"""
+        requests = select(JobApprovalRequest.id).where(
+            JobApprovalRequest.job_id.in_(job_ids)
+        )
+        retention.copy(db, Job, JobArchive, Job.id.in_(job_ids))
+        for model, archive in JOB_CHILDREN:
+            retention.copy(db, model, archive, model.job_id.in_(job_ids))
+        retention.copy(
+            db,
+            ApprovalLog,
+            ApprovalLogArchive,
+            ApprovalLog.job_approval_request_id.in_(requests),
+        )
+
+        retention.delete(
+            db, ApprovalLog, ApprovalLog.job_approval_request_id.in_(requests)
+        )
+        for model, _ in reversed(JOB_CHILDREN):
+            retention.delete(db, model, model.job_id.in_(job_ids))
+        # Saved jobs long past their deadline are not kept.
+        retention.delete(db, UserJobSave, UserJobSave.job_id.in_(job_ids))
+        archived = retention.delete(db, Job, Job.id.in_(job_ids))
+        db.commit()
+        return archived
+
+
+job_archive = CRUDJobArchive(JobArchive)
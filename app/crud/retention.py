@@ -0,0 +1,56 @@
+from typing import List, Type
+from datetime import datetime
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+
+
+class CRUDRetention:
+    def now(self, db: Session) -> datetime:
+        # The age columns default to the database clock, cutoffs come from it.
+        return db.query(func.now()).scalar()
+
+    def get_batch(
+        self, db: Session, model: Type[Base], column, cutoff, after_id: int, limit: int
+    ) -> List[tuple]:
+        # A walk of the primary key, (id, expired) for the next limit rows.
+        return (
+            db.query(model.id, column < cutoff)
+            .filter(model.id > after_id)
+            .order_by(model.id)
+            .limit(limit)
+            .all()
+        )
+
+    def copy(self, db: Session, model: Type[Base], archive: Type[Base], condition):
+        """Insert the rows of model matching condition into archive"""
+        columns = [
+            column.name
+            for column in archive.__table__.columns
+            if column.name in model.__table__.columns
+        ]
+        db.execute(
+            insert(archive).from_select(
+                columns,
+                select(*[model.__table__.c[name] for name in columns]).where(condition),
+            )
+        )
+
+    def delete(self, db: Session, model: Type[Base], condition) -> int:
+        return db.execute(
+            delete(model).where(condition).execution_options(synchronize_session=False)
+        ).rowcount
+
+    def purge(
+        self, db: Session, model: Type[Base], ids: List[int], archive: Type[Base] = None
+    ) -> int:
+        if archive is not None:
+            self.copy(db, model, archive, model.id.in_(ids))
+        deleted = self.delete(db, model, model.id.in_(ids))
+        db.commit()
+        return deleted
+
+
+retention = CRUDRetention()
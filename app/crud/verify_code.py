@@ -10,6 +10,14 @@ class CRUDVerifyCode(CRUDBase[VerifyCode, VerifyCodeCreate, VerifyCodeUpdate]):
     def get_by_code(self, db: Session, code: str) -> VerifyCode:
         return db.query(VerifyCode).filter(VerifyCode.code == code).first()
 
+    def get_by_session_id(self, db: Session, session_id: str) -> VerifyCode:
+        return (
+            db.query(VerifyCode)
+            .filter(VerifyCode.session_id == session_id)
+            .order_by(VerifyCode.id.desc())
+            .first()
+        )
+
     def get_by_email(self, db: Session, email: str) -> VerifyCode:
         return db.query(VerifyCode).filter(VerifyCode.email == email).first()
 
@@ -0,0 +1,42 @@
+from typing import List, Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from .base import CRUDBase
+from app.model import CruitmentDemand, WorkMarket
+from app.schema.work_market import WorkMarketCreate, WorkMarketUpdate
+
+
+class CRUDWorkMarket(CRUDBase[WorkMarket, WorkMarketCreate, WorkMarketUpdate]):
+    def get_latest(self, db: Session) -> Optional[WorkMarket]:
+        return db.query(self.model).order_by(self.model.time_scan.desc()).first()
+
+    def get_by_range(self, db: Session, start, end) -> List[WorkMarket]:
+        return (
+            db.query(self.model)
+            .filter(self.model.time_scan >= start, self.model.time_scan < end)
+            .order_by(self.model.time_scan)
+            .all()
+        )
+
+    def create_snapshot(
+        self, db: Session, obj_in: WorkMarketCreate, demand: dict
+    ) -> WorkMarket:
+        # The market row and its breakdown share time_scan and are written in
+        # one transaction, so a reader never sees half a snapshot.
+        db_obj = self.model(**obj_in.model_dump())
+        db.add(db_obj)
+        if demand:
+            db.execute(
+                insert(CruitmentDemand),
+                [
+                    {"key": key, "value": value, "time_scan": obj_in.time_scan}
+                    for key, value in demand.items()
+                ],
+            )
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+
+work_market = CRUDWorkMarket(WorkMarket)
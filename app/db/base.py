@@ -3,20 +3,31 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 from app.core import constant
+from app.core.metrics import instrument_engine
+from app.core.query_stats import instrument_queries
 
-engine = create_engine(
-    constant.DATABASE_URL,
-    # settings.DATABASE_URL,
-    # f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_SERVER}:{settings.MYSQL_PORT}/{settings.MYSQL_DATABASE}",
-    pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=100,
-    connect_args={"connect_timeout": 10},
-)
+if constant.DATABASE_URL.startswith("sqlite"):
+    # Local benchmarks only, see app/bench/seed.py.
+    engine = create_engine(
+        constant.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+    )
+else:
+    engine = create_engine(
+        constant.DATABASE_URL,
+        # f"mysql+pymysql://{settings.MYSQL_USER}:{settings.MYSQL_PASSWORD}@{settings.MYSQL_SERVER}:{settings.MYSQL_PORT}/{settings.MYSQL_DATABASE}",
+        pool_pre_ping=True,
+        pool_size=20,
+        max_overflow=100,
+        connect_args={"connect_timeout": 10},
+    )
 engine.dialect.supports_sane_rowcount = engine.dialect.supports_sane_multi_rowcount = (
     False
 )
 
+instrument_engine(engine)
+instrument_queries(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
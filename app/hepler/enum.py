@@ -150,3 +150,15 @@ class VerifyType(str, Enum):
     PHONE = "phone"
     COMPANY = "company"
     IDENTIFY = "identify"
+
+
+class EmailOutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class MarketPeriod(str, Enum):
+    DAY = "day"
+    WEEK = "week"
@@ -7,3 +7,9 @@ def generate_file_name(key: str = "", file_name: str = "") -> str:
         if key
         else f"{uuid.uuid4()}.{file_name.split('.')[-1]}"
     )
+
+
+def generate_content_file_name(
+    key: str = "", extension: str = "", digest: str = ""
+) -> str:
+    return f"{key}/{digest}{extension}" if key else f"{digest}{extension}"
@@ -0,0 +1,19 @@
+from pydantic import validator
+
+from app.core import constant
+
+
+def thumbnail_validator(field: str, source: str):
+    """
+    Validator of a thumbnail url, falling back to the full-size image of
+    `source` while the thumbnail is not generated yet.
+    """
+
+    def validate_thumbnail(cls, v, values):
+        if v is None:
+            return values.get(source)
+        if not v.startswith("https://"):
+            v = constant.BUCKET_URL + v
+        return v
+
+    return validator(field, always=True, allow_reuse=True)(validate_thumbnail)
@@ -15,18 +15,37 @@ from app.db.base import engine, get_db
 from app.db.base_class import Base
 from app.db.init_db import init_db
 from app.storage.s3 import s3_service
+from app.storage.image import image_processor
 from app.storage.redis import redis_dependency
+from app.core.rate_limit import rate_limit_headers
+from app.core.metrics import record_request, close_metrics
+from app.core.query_stats import record_queries
+from app.core.security import password_hasher
+from app.core.http_client import http_client
+from app.core.auth.google_auth import google_jwks
+from app.worker.schedule import scheduler
 
 from app.api import api_router
+from app.api.api_v1.endpoint import metrics
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup event
     await redis_dependency.init()
+    google_jwks.start()
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start()
     yield
     # Shutdown event
+    await scheduler.stop()
+    await google_jwks.stop()
+    await http_client.close()
     await redis_dependency.close()
+    password_hasher.close()
+    image_processor.close()
+    s3_service.close()
+    close_metrics()
 
 
 # Base.metadata.create_all(bind=engine)
@@ -40,7 +59,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods="*",
     allow_headers="*",
+    expose_headers=[
+        "Retry-After",
+        "RateLimit-Limit",
+        "RateLimit-Remaining",
+        "RateLimit-Reset",
+    ],
 )
+app.middleware("http")(rate_limit_headers)
+app.middleware("http")(record_queries)
+app.middleware("http")(record_request)
 
 
 app.include_router(api_router)
+app.include_router(metrics.router, tags=["metrics"])
@@ -40,3 +40,13 @@ from .verify_code import VerifyCode
 from .verify_code_block import VerifyCodeBlock
 from .social_network import SocialNetwork
 from .work_location import WorkLocation
+from .email_outbox import EmailOutbox
+from .business_history_archive import BusinessHistoryArchive
+from .job_report_archive import JobReportArchive
+from .job_archive import JobArchive
+from .work_location_archive import WorkLocationArchive
+from .job_category_archive import JobCategoryArchive
+from .job_skill_archive import JobSkillArchive
+from .working_time_archive import WorkingTimeArchive
+from .job_approval_request_archive import JobApprovalRequestArchive
+from .approval_log_archive import ApprovalLogArchive
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, ForeignKey, Enum, String, DateTime
+
+from app.db.base_class import Base
+from app.hepler.enum import JobApprovalStatus
+
+
+class ApprovalLogArchive(Base):
+    job_approval_request_id = Column(
+        Integer,
+        ForeignKey("job_approval_request_archive.id", ondelete="CASCADE"),
+        index=True,
+    )
+    admin_id = Column(Integer, index=True)
+    previous_status = Column(Enum(JobApprovalStatus), nullable=False)
+    new_status = Column(Enum(JobApprovalStatus), nullable=False)
+    reason = Column(String(100), nullable=True)
+    created_at = Column(DateTime(timezone=True))
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+from app.hepler.enum import HistoryType
+
+
+class BusinessHistoryArchive(Base):
+    # Rows keep the id they had in business_history.
+    business_id = Column(Integer, index=True)
+    content = Column(String(255), nullable=False)
+    type = Column(Enum(HistoryType), nullable=False)
+    created_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Index, Integer, String, DateTime
 
 from app.db.base_class import Base
 
@@ -6,4 +6,6 @@ from app.db.base_class import Base
 class CruitmentDemand(Base):
     key = Column(String(50), nullable=False)
     value = Column(Integer, nullable=False)
-    time_scan = Column(DateTime(timezone=True), nullable=False)
+    time_scan = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    __table_args__ = (Index("ix_cruitment_demand_key_time_scan", "key", "time_scan"),)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Text, Enum, DateTime, Index
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+from app.hepler.enum import EmailOutboxStatus
+
+
+class EmailOutbox(Base):
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    subtype = Column(String(20), default="html", nullable=False)
+    status = Column(
+        Enum(EmailOutboxStatus), default=EmailOutboxStatus.PENDING, nullable=False
+    )
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
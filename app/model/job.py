@@ -9,13 +9,16 @@ from sqlalchemy import (
     Date,
     JSON,
     Text,
+    Index,
     event,
+    inspect,
+    update,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, Session
 
 from app.db.base_class import Base
-from app.hepler.enum import JobStatus, Gender, JobType, SalaryType
+from app.hepler.enum import JobStatus, Gender, JobType, SalaryType, JobApprovalStatus
 from app.model.job_approval_request import JobApprovalRequest
 from app.model.job_position import JobPosition
 from app.model.job_category import JobCategory
@@ -37,9 +40,9 @@ class Job(Base):
     )
     job_position_id = Column(Integer, nullable=False, index=True)
     title = Column(String(255), index=True, nullable=False)
-    job_description = Column(Text, nullable=False)
-    job_requirement = Column(Text, nullable=False)
-    job_benefit = Column(Text, nullable=False)
+    job_description = Column(JSON, nullable=False)
+    job_requirement = Column(JSON, nullable=False)
+    job_benefit = Column(JSON, nullable=False)
     job_location = Column(String(255), nullable=False)
     max_salary = Column(Integer, default=0, nullable=True, index=True)
     min_salary = Column(Integer, default=0, nullable=True, index=True)
@@ -50,7 +53,16 @@ class Job(Base):
     full_name_contact = Column(String(50), nullable=False)
     phone_number_contact = Column(String(10), nullable=False)
     email_contact = Column(JSON, nullable=False)
-    status = Column(Enum(JobStatus), default=JobStatus.PENDING, index=True)
+    status = Column(Enum(JobStatus), default=JobStatus.PENDING)
+    # Copy of job_approval_request.status kept in sync by the events below,
+    # so public listings filter on the job row alone.
+    approval_status = Column(
+        Enum(JobApprovalStatus),
+        default=JobApprovalStatus.PENDING,
+        server_default=JobApprovalStatus.PENDING.name,
+        nullable=False,
+    )
+    approved_at = Column(DateTime(timezone=True), nullable=True, index=True)
     employment_type = Column(Enum(JobType), default=JobType.FULL_TIME, index=True)
     gender_requirement = Column(Enum(Gender), default=Gender.OTHER, index=True)
     deadline = Column(Date, nullable=False, index=True)
@@ -69,6 +81,16 @@ class Job(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (
+        Index(
+            "ix_job_status_approval_status_deadline_id",
+            "status",
+            "approval_status",
+            "deadline",
+            "id",
+        ),
+    )
+
     business = relationship("Business", back_populates="job", uselist=False)
     job_experience = relationship("JobExperience", back_populates="job", uselist=False)
     cv_applications = relationship("CVApplication", back_populates="job")
@@ -110,6 +132,22 @@ def receive_after_insert(mapper, connection, target):
     session.close()
 
 
+@event.listens_for(JobApprovalRequest, "after_insert")
+@event.listens_for(JobApprovalRequest, "after_update")
+def receive_approval_status(mapper, connection, target):
+    if not inspect(target).attrs.status.history.has_changes():
+        return
+    approved = target.status == JobApprovalStatus.APPROVED
+    connection.execute(
+        update(Job)
+        .where(Job.id == target.job_id)
+        .values(
+            approval_status=target.status,
+            approved_at=func.now() if approved else None,
+        )
+    )
+
+
 @event.listens_for(Job.status, "set")
 def receive_after_update(target, value, oldvalue, initiator):
     session = Session.object_session(target)
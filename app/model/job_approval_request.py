@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum, DateTime, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -7,7 +7,7 @@ from app.hepler.enum import JobApprovalStatus
 
 
 class JobApprovalRequest(Base):
-    job_id = Column(Integer, ForeignKey("job.id", ondelete="CASCADE"), index=True)
+    job_id = Column(Integer, ForeignKey("job.id", ondelete="CASCADE"))
     status = Column(
         Enum(JobApprovalStatus),
         nullable=False,
@@ -17,6 +17,15 @@ class JobApprovalRequest(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
 
+    __table_args__ = (
+        Index(
+            "ix_job_approval_request_job_id_status_updated_at",
+            "job_id",
+            "status",
+            "updated_at",
+        ),
+    )
+
     job = relationship(
         "Job",
         back_populates="job_approval_request",
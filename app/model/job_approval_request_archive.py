@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, ForeignKey, Enum, DateTime
+
+from app.db.base_class import Base
+from app.hepler.enum import JobApprovalStatus
+
+
+class JobApprovalRequestArchive(Base):
+    job_id = Column(
+        Integer, ForeignKey("job_archive.id", ondelete="CASCADE"), index=True
+    )
+    status = Column(Enum(JobApprovalStatus), nullable=False)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
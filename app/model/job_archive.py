@@ -0,0 +1,77 @@
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    Enum,
+    Date,
+    JSON,
+    Text,
+)
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+
+from app.db.base_class import Base
+from app.hepler.enum import JobStatus, Gender, JobType, SalaryType, JobApprovalStatus
+
+
+class JobArchive(Base):
+    # Rows keep the id they had in job, the relationships mirror Job's so
+    # the job services can render an archived job.
+    business_id = Column(
+        Integer, ForeignKey("business.id", ondelete="CASCADE"), nullable=False
+    )
+    campaign_id = Column(
+        Integer,
+        ForeignKey("campaign.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    job_experience_id = Column(Integer, nullable=False)
+    job_position_id = Column(Integer, nullable=False)
+    title = Column(String(255), nullable=False)
+    job_description = Column(JSON, nullable=False)
+    job_requirement = Column(JSON, nullable=False)
+    job_benefit = Column(JSON, nullable=False)
+    job_location = Column(String(255), nullable=False)
+    max_salary = Column(Integer, nullable=True)
+    min_salary = Column(Integer, nullable=True)
+    salary_type = Column(Enum(SalaryType), nullable=False)
+    quantity = Column(Integer, nullable=False)
+    full_name_contact = Column(String(50), nullable=False)
+    phone_number_contact = Column(String(10), nullable=False)
+    email_contact = Column(JSON, nullable=False)
+    status = Column(Enum(JobStatus))
+    approval_status = Column(Enum(JobApprovalStatus), nullable=False)
+    approved_at = Column(DateTime(timezone=True), nullable=True)
+    employment_type = Column(Enum(JobType))
+    gender_requirement = Column(Enum(Gender))
+    deadline = Column(Date, nullable=False)
+    employer_verified = Column(Boolean)
+    is_featured = Column(Boolean)
+    is_highlight = Column(Boolean)
+    is_urgent = Column(Boolean)
+    is_paid_featured = Column(Boolean)
+    is_bg_featured = Column(Boolean)
+    is_vip_employer = Column(Boolean)
+    is_diamond_employer = Column(Boolean)
+    is_job_flash = Column(Boolean)
+    working_time_text = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    campaign = relationship("Campaign", viewonly=True)
+    work_locations = relationship("WorkLocationArchive", viewonly=True)
+    working_times = relationship("WorkingTimeArchive", viewonly=True)
+    job_categories = relationship(
+        "Category", secondary="job_category_archive", viewonly=True
+    )
+    must_have_skills = relationship(
+        "Skill", secondary="job_skill_archive", viewonly=True
+    )
+    should_have_skills = relationship(
+        "Skill", secondary="job_skill_archive", viewonly=True
+    )
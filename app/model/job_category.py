@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -6,8 +6,10 @@ from app.db.base_class import Base
 
 class JobCategory(Base):
     job_id = Column(Integer, ForeignKey("job.id", ondelete="CASCADE"), index=True)
-    category_id = Column(
-        Integer, ForeignKey("category.id", ondelete="CASCADE"), index=True
+    category_id = Column(Integer, ForeignKey("category.id", ondelete="CASCADE"))
+
+    __table_args__ = (
+        Index("ix_job_category_category_id_job_id", "category_id", "job_id"),
     )
 
     job = relationship(
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, ForeignKey
+
+from app.db.base_class import Base
+
+
+class JobCategoryArchive(Base):
+    job_id = Column(
+        Integer, ForeignKey("job_archive.id", ondelete="CASCADE"), index=True
+    )
+    category_id = Column(Integer, ForeignKey("category.id", ondelete="CASCADE"))
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+
+
+class JobReportArchive(Base):
+    # Rows keep the id they had in job_report.
+    job_id = Column(Integer, index=True)
+    user_id = Column(Integer, index=True)
+    report_type = Column(String(10))
+    report_content = Column(String(100))
+    report_status = Column(String(10))
+    report_created_at = Column(DateTime(timezone=True))
+    report_updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, ForeignKey
+
+from app.db.base_class import Base
+
+
+class JobSkillArchive(Base):
+    job_id = Column(
+        Integer, ForeignKey("job_archive.id", ondelete="CASCADE"), index=True
+    )
+    skill_id = Column(Integer, ForeignKey("skill.id", ondelete="CASCADE"))
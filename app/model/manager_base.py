@@ -12,6 +12,7 @@ class ManagerBase(Base):
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
     avatar = Column(String(255), nullable=True)
+    avatar_thumbnail = Column(String(255), nullable=True)
     role = Column(Enum(Role), default=Role.BUSINESS)
     type_account = Column(Enum(TypeAccount), default=TypeAccount.BUSINESS)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
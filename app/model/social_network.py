@@ -13,7 +13,7 @@ class SocialNetwork(Base):
     phone_number = Column(String(10), nullable=True)
     avatar = Column(String(255), nullable=True)
     email = Column(String(255), nullable=False)
-    access_token = Column(String(500), nullable=False)
+    access_token = Column(String(500), nullable=True)
     is_active = Column(Boolean, default=True)
     role = Column(Enum(Role), default=Role.SOCIAL_NETWORK)
     is_verified = Column(Boolean, default=False)
@@ -16,6 +16,7 @@ class User(Base):
     role = Column(Enum(Role), default=Role.USER)
     is_verified = Column(Boolean, default=False)
     avatar = Column(String(255), nullable=True)
+    avatar_thumbnail = Column(String(255), nullable=True)
     type_account = Column(Enum(TypeAccount), default=TypeAccount.NORMAL)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text
+from sqlalchemy import Column, Integer, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -10,7 +10,6 @@ class WorkLocation(Base):
         Integer,
         ForeignKey("province.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     district_id = Column(
         Integer,
@@ -20,6 +19,15 @@ class WorkLocation(Base):
     )
     description = Column(Text, nullable=True)
 
+    __table_args__ = (
+        Index(
+            "ix_work_location_province_id_district_id_job_id",
+            "province_id",
+            "district_id",
+            "job_id",
+        ),
+    )
+
     job = relationship(
         "Job",
         back_populates="work_locations",
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, ForeignKey, Text
+
+from app.db.base_class import Base
+
+
+class WorkLocationArchive(Base):
+    job_id = Column(
+        Integer, ForeignKey("job_archive.id", ondelete="CASCADE"), index=True
+    )
+    province_id = Column(Integer, nullable=False)
+    district_id = Column(Integer, nullable=True)
+    description = Column(Text, nullable=True)
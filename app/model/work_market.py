@@ -8,4 +8,4 @@ class WorkMarket(Base):
     quantity_job_recruitment = Column(Integer, nullable=False)
     quantity_job_recruitment_yesterday = Column(Integer, nullable=False)
     quantity_job_new_today = Column(Integer, nullable=False)
-    time_scan = Column(DateTime, nullable=False)
+    time_scan = Column(DateTime, nullable=False, index=True)
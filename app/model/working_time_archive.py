@@ -0,0 +1,13 @@
+from sqlalchemy import Column, ForeignKey, Integer, Time
+
+from app.db.base_class import Base
+
+
+class WorkingTimeArchive(Base):
+    job_id = Column(
+        Integer, ForeignKey("job_archive.id", ondelete="CASCADE"), index=True
+    )
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+    date_from = Column(Integer, nullable=False)
+    date_to = Column(Integer, nullable=False)
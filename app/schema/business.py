@@ -7,6 +7,7 @@ from datetime import datetime
 from app.hepler.enum import Role, Gender, FolderBucket
 from app.core import constant
 from app.hepler.generate_file_name import generate_file_name
+from app.hepler.thumbnail import thumbnail_validator
 
 
 class BusinessBase(BaseModel):
@@ -37,6 +38,7 @@ class BusinessItemResponse(BusinessBase):
     full_name: str
     email: str
     avatar: Optional[str] = None
+    avatar_thumbnail: Optional[str] = None
     is_active: bool
     role: Role
     work_location: Optional[str] = None
@@ -60,6 +62,8 @@ class BusinessItemResponse(BusinessBase):
                 v = constant.BUCKET_URL + v
         return v
 
+    validate_avatar_thumbnail = thumbnail_validator("avatar_thumbnail", "avatar")
+
 
 class BusinessGetRequest(BaseModel):
     id: int
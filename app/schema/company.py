@@ -9,6 +9,7 @@ from app.hepler.enum import CompanyType, FolderBucket
 from app.core import constant
 from app.hepler.generate_file_name import generate_file_name
 from app.schema.page import Pagination
+from app.hepler.thumbnail import thumbnail_validator
 
 
 class CompanyBase(BaseModel):
@@ -63,6 +64,8 @@ class CompanyItemResponse(BaseModel):
     total_active_jobs: int = None
     tax_code: str
     banner: Optional[str] = None
+    logo_thumbnail: Optional[str] = None
+    banner_thumbnail: Optional[str] = None
 
     @validator("logo")
     def validate_logo(cls, v):
@@ -83,6 +86,10 @@ class CompanyItemResponse(BaseModel):
                 v = constant.BUCKET_URL + v
         return v
 
+    validate_logo_thumbnail = thumbnail_validator("logo_thumbnail", "logo")
+
+    validate_banner_thumbnail = thumbnail_validator("banner_thumbnail", "banner")
+
 
 class CompanyPrivateResponse(BaseModel):
     id: int
@@ -101,6 +108,8 @@ class CompanyPrivateResponse(BaseModel):
     is_verified: bool
     total_active_jobs: int = 0
     banner: Optional[str] = None
+    logo_thumbnail: Optional[str] = None
+    banner_thumbnail: Optional[str] = None
 
     model_config = ConfigDict(from_attribute=True, extra="ignore")
 
@@ -123,11 +132,16 @@ class CompanyPrivateResponse(BaseModel):
                 v = constant.BUCKET_URL + v
         return v
 
+    validate_logo_thumbnail = thumbnail_validator("logo_thumbnail", "logo")
+
+    validate_banner_thumbnail = thumbnail_validator("banner_thumbnail", "banner")
+
 
 class CompanyJobResponse(CompanyBase):
     id: int
     name: str
     logo: Optional[str] = None
+    logo_thumbnail: Optional[str] = None
 
     @validator("logo")
     def validate_logo(cls, v):
@@ -136,6 +150,8 @@ class CompanyJobResponse(CompanyBase):
                 v = constant.BUCKET_URL + v
         return v
 
+    validate_logo_thumbnail = thumbnail_validator("logo_thumbnail", "logo")
+
     @validator("company_short_description")
     def validate_company_short_description(cls, v):
         if v is not None:
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+
+class CruitmentDemandCreate(BaseModel):
+    key: str
+    value: int
+    time_scan: datetime
+
+
+class CruitmentDemandUpdate(BaseModel):
+    pass
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class EmailOutboxCreate(BaseModel):
+    recipient: str
+    subject: str
+    body: str
+    subtype: str = "html"
+
+
+class EmailOutboxUpdate(BaseModel):
+    pass
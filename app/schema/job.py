@@ -2,7 +2,6 @@ from pydantic import BaseModel, validator, ConfigDict
 import re
 from typing import Optional, List, Any, Union
 from datetime import datetime, date
-import json
 
 from app.hepler.enum import (
     SalaryType,
@@ -70,7 +69,7 @@ class JobItemResponse(JobBase):
     employer_verified: bool = False
     is_new: bool = False
     is_hot: bool = False
-    email_contact: Any
+    email_contact: List[str]
     status: JobStatus
     locations: List[object]
     categories: List[object]
@@ -79,27 +78,9 @@ class JobItemResponse(JobBase):
     should_have_skills: List[object]
     company: object
 
-    @validator("email_contact")
-    def validate_email_contact(cls, v):
-        return json.loads(v) if isinstance(v, str) else v
-
-    @validator("job_description")
-    def validate_job_description(cls, v):
-        if v is not None:
-            return json.loads(v) if isinstance(v, str) else v
-        return v
-
-    @validator("job_requirement")
-    def validate_job_requirement(cls, v):
-        if v is not None:
-            return json.loads(v) if isinstance(v, str) else v
-        return v
 
-    @validator("job_benefit")
-    def validate_job_benefit(cls, v):
-        if v is not None:
-            return json.loads(v) if isinstance(v, str) else v
-        return v
+class JobArchiveItemResponse(JobItemResponse):
+    archived_at: Optional[datetime] = None
 
 
 class JobItemResponseGeneral(BaseModel):
@@ -164,24 +145,6 @@ class JobItemResponseUser(BaseModel):
 
     model_config = ConfigDict(from_attribute=True, extra="ignore")
 
-    @validator("job_description")
-    def validate_job_description(cls, v):
-        if v is not None:
-            return json.loads(v) if isinstance(v, str) else v
-        return v
-
-    @validator("job_requirement")
-    def validate_job_requirement(cls, v):
-        if v is not None:
-            return json.loads(v) if isinstance(v, str) else v
-        return v
-
-    @validator("job_benefit")
-    def validate_job_benefit(cls, v):
-        if v is not None:
-            return json.loads(v) if isinstance(v, str) else v
-        return v
-
 
 class JobSearchResponseUser(BaseModel):
     id: int
@@ -253,6 +216,7 @@ class JobFilterByBusiness(PaginationJob):
     business_id: Optional[int] = None
     company_id: Optional[int] = None
     campaign_id: Optional[int] = None
+    archived: Optional[bool] = False
 
 
 class JobFilterByUser(PaginationJob):
@@ -343,22 +307,7 @@ class JobCreateRequest(JobBase):
         for email in v:
             if not re.match(constant.REGEX_EMAIL, email):
                 raise ValueError("Invalid email")
-        if isinstance(v, list):
-            v = json.dumps(list(set(v)))
-            print(type(v))
-        return v
-
-    @validator("job_description")
-    def validate_job_description(cls, v):
-        return json.dumps(v) if isinstance(v, str) else v
-
-    @validator("job_requirement")
-    def validate_job_requirement(cls, v):
-        return json.dumps(v) if isinstance(v, str) else v
-
-    @validator("job_benefit")
-    def validate_job_benefit(cls, v):
-        return json.dumps(v) if isinstance(v, str) else v
+        return list(dict.fromkeys(v))
 
     @validator("working_times")
     def validate_working_times(cls, v):
@@ -366,7 +315,7 @@ class JobCreateRequest(JobBase):
 
 
 class JobCreate(JobBase):
-    email_contact: str
+    email_contact: List[str]
     business_id: int
     campaign_id: int
     employer_verified: bool = False
@@ -412,26 +361,7 @@ class JobUpdateRequest(BaseModel):
             for email in v:
                 if not re.match(constant.REGEX_EMAIL, email):
                     raise ValueError("Invalid email")
-            if isinstance(v, list):
-                v = json.dumps(list(set(v)))
-        return v
-
-    @validator("job_description")
-    def validate_job_description(cls, v):
-        if v:
-            return json.dumps(v) if isinstance(v, str) else v
-        return v
-
-    @validator("job_requirement")
-    def validate_job_requirement(cls, v):
-        if v:
-            return json.dumps(v) if isinstance(v, str) else v
-        return v
-
-    @validator("job_benefit")
-    def validate_job_benefit(cls, v):
-        if v:
-            return json.dumps(v) if isinstance(v, str) else v
+            return list(dict.fromkeys(v))
         return v
 
 
@@ -444,7 +374,7 @@ class JobUpdate(BaseModel):
     job_requirement: Optional[str] = None
     job_benefit: Optional[str] = None
     phone_number_contact: Optional[str] = None
-    email_contact: Optional[str] = None
+    email_contact: Optional[List[str]] = None
     full_name_contact: Optional[str] = None
     employment_type: JobType = None
     gender_requirement: Gender = None
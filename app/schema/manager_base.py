@@ -7,6 +7,7 @@ from datetime import datetime
 from app.core import constant
 from app.hepler.enum import Role, TypeAccount, FolderBucket
 from app.hepler.generate_file_name import generate_file_name
+from app.hepler.thumbnail import thumbnail_validator
 
 
 class ManagerBaseBase(BaseModel):
@@ -34,6 +35,7 @@ class ManagerBaseBase(BaseModel):
 class ManagerBaseItemResponse(ManagerBaseBase):
     id: int
     avatar: Optional[str] = None
+    avatar_thumbnail: Optional[str] = None
     is_active: bool
     last_login: Optional[datetime]
     role: Role
@@ -46,6 +48,8 @@ class ManagerBaseItemResponse(ManagerBaseBase):
                 v = constant.BUCKET_URL + v
         return v
 
+    validate_avatar_thumbnail = thumbnail_validator("avatar_thumbnail", "avatar")
+
 
 class ManagerBaseGetRequest(BaseModel):
     email: str = Field(..., example="1@email.com")
@@ -84,7 +88,7 @@ class ManagerBaseCreateRequest(ManagerBaseBase):
                 raise ValueError("Invalid image type")
             elif v.size > constant.MAX_IMAGE_SIZE:
                 raise ValueError("Image size must be at most 2MB")
-            v.filename = generate_file_name(v.filename, FolderBucket.AVATAR)
+            v.filename = generate_file_name(FolderBucket.AVATAR, v.filename)
         return v
 
     @validator("role")
@@ -127,7 +131,7 @@ class ManagerBaseUpdateRequest(BaseModel):
                 raise ValueError("Invalid image type")
             elif v.size > constant.MAX_IMAGE_SIZE:
                 raise ValueError("Image size must be at most 2MB")
-            v.filename = generate_file_name(v.filename, FolderBucket.AVATAR)
+            v.filename = generate_file_name(FolderBucket.AVATAR, v.filename)
         return v
 
     @validator("password")
@@ -62,7 +62,7 @@ class SocialNetworkGetRequest(BaseModel):
 
 class SocialNetworkCreateRequest(SocialNetworkBase):
     role: Role = Role.SOCIAL_NETWORK
-    access_token: str
+    access_token: Optional[str] = None
     user_id: Optional[int] = None
 
 
@@ -0,0 +1,58 @@
+from pydantic import BaseModel, validator, ConfigDict
+
+from app.hepler.enum import FolderBucket
+from app.core import constant
+
+UPLOAD_RULES = {
+    FolderBucket.LOGO: (constant.ALLOWED_IMAGE_TYPES, constant.MAX_IMAGE_SIZE),
+    FolderBucket.AVATAR: (constant.ALLOWED_IMAGE_TYPES, constant.MAX_IMAGE_SIZE),
+    FolderBucket.CV: (constant.ALLOWED_CV_TYPES, constant.MAX_CV_SIZE),
+}
+
+
+class UploadIntentRequest(BaseModel):
+    type: FolderBucket
+    file_name: str
+    content_type: str
+    size: int
+
+    model_config = ConfigDict(from_attribute=True, extra="ignore")
+
+    @validator("type")
+    def validate_type(cls, v):
+        if v not in UPLOAD_RULES:
+            raise ValueError("Invalid upload type")
+        return v
+
+    @validator("content_type")
+    def validate_content_type(cls, v, values):
+        allowed_types, _ = UPLOAD_RULES.get(values.get("type"), ([], 0))
+        if v not in allowed_types:
+            raise ValueError("Invalid file type")
+        return v
+
+    @validator("size")
+    def validate_size(cls, v, values):
+        _, max_size = UPLOAD_RULES.get(values.get("type"), ([], 0))
+        if v <= 0 or v > max_size:
+            raise ValueError(f"File size must be at most {max_size} bytes")
+        return v
+
+
+class UploadConfirmRequest(BaseModel):
+    type: FolderBucket
+    key: str
+
+    model_config = ConfigDict(from_attribute=True, extra="ignore")
+
+    @validator("type")
+    def validate_type(cls, v):
+        if v not in UPLOAD_RULES:
+            raise ValueError("Invalid upload type")
+        return v
+
+    @validator("key")
+    def validate_key(cls, v):
+        if not v or v.startswith("/") or "\\" in v or ".." in v.split("/"):
+            raise ValueError("Invalid key")
+        return v
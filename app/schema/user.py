@@ -6,6 +6,7 @@ from typing import Optional
 from app.hepler.enum import Role, TypeAccount, FolderBucket
 from app.core import constant
 from app.hepler.generate_file_name import generate_file_name
+from app.hepler.thumbnail import thumbnail_validator
 
 
 class UserBase(BaseModel):
@@ -34,6 +35,7 @@ class UserBase(BaseModel):
 class UserItemResponse(UserBase):
     id: int
     avatar: Optional[str] = None
+    avatar_thumbnail: Optional[str] = None
     is_active: bool = True
     role: Role = Role.USER
     phone_number: Optional[str] = None
@@ -46,6 +48,8 @@ class UserItemResponse(UserBase):
                 v = constant.BUCKET_URL + v
         return v
 
+    validate_avatar_thumbnail = thumbnail_validator("avatar_thumbnail", "avatar")
+
     @validator("is_active")
     def validate_is_active(cls, v):
         return v or True
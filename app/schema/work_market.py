@@ -0,0 +1,49 @@
+from pydantic import BaseModel, ConfigDict, validator
+from typing import Optional
+from datetime import date, datetime, timedelta
+
+from app.core.config import settings
+from app.hepler.enum import MarketPeriod
+
+
+class WorkMarketCreate(BaseModel):
+    quantity_company_recruitment: int
+    quantity_job_recruitment: int
+    quantity_job_recruitment_yesterday: int
+    quantity_job_new_today: int
+    time_scan: datetime
+
+
+class WorkMarketUpdate(BaseModel):
+    pass
+
+
+class WorkMarketHistoryRequest(BaseModel):
+    period: Optional[MarketPeriod] = MarketPeriod.DAY
+    to_date: Optional[date] = None
+    from_date: Optional[date] = None
+    key: Optional[str] = None
+
+    model_config = ConfigDict(from_attribute=True, extra="ignore")
+
+    @validator("period")
+    def validate_period(cls, v):
+        return v or MarketPeriod.DAY
+
+    @validator("to_date", always=True)
+    def validate_to_date(cls, v):
+        return v or datetime.now().date()
+
+    @validator("from_date", always=True)
+    def validate_from_date(cls, v, values):
+        to_date = values.get("to_date")
+        if to_date is None:
+            return v
+        v = v or to_date - timedelta(days=30)
+        if v > to_date:
+            raise ValueError("from_date must be before to_date")
+        if (to_date - v).days >= settings.MARKET_HISTORY_MAX_DAYS:
+            raise ValueError(
+                f"The range must be shorter than {settings.MARKET_HISTORY_MAX_DAYS} days"
+            )
+        return v
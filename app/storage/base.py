@@ -0,0 +1,108 @@
+import asyncio
+from abc import ABC, abstractmethod
+import hashlib
+import mimetypes
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app.core import constant
+from app.hepler.generate_file_name import generate_content_file_name
+
+
+class PendingUpload:
+    def __init__(self, storage, key: str, future: Future):
+        self.storage = storage
+        self.key = key
+        self.future = future
+
+    def wait(self):
+        """Block until the upload finished, re-raising its error"""
+        return self.future.result()
+
+    def succeeded(self) -> bool:
+        """Block until the upload finished and report whether it succeeded"""
+        try:
+            self.future.result()
+        except Exception:
+            return False
+        return True
+
+    def discard(self):
+        """Roll back the upload once it finished"""
+        # A deduplicated upload reused an object other rows point to, so only
+        # objects written by this upload are deleted.
+        if self.succeeded() and self.future.result():
+            self.storage.delete_file(self.key)
+
+
+class Storage(ABC):
+    def __init__(self, max_workers: int = 10):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="storage"
+        )
+
+    @abstractmethod
+    def upload_file(self, file, key):
+        pass
+
+    @abstractmethod
+    def upload_bytes(self, data: bytes, key, content_type: str):
+        pass
+
+    @abstractmethod
+    def delete_file(self, key):
+        pass
+
+    @abstractmethod
+    def get_file(self, key):
+        pass
+
+    @abstractmethod
+    def get_file_url(self, key):
+        pass
+
+    @abstractmethod
+    def head_file(self, key):
+        pass
+
+    @abstractmethod
+    def generate_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ):
+        pass
+
+    def content_key(self, file, folder: str) -> str:
+        """Key of the file derived from the sha256 of its content"""
+        digest = hashlib.sha256()
+        file.file.seek(0)
+        for chunk in iter(lambda: file.file.read(constant.HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        file.file.seek(0)
+        # The validated content type names the extension, the file name may
+        # have been rewritten by the schema validators.
+        extension = mimetypes.guess_extension(file.content_type or "")
+        if not extension:
+            extension = "." + file.filename.split(".")[-1]
+        return generate_content_file_name(folder, extension, digest.hexdigest())
+
+    def upload_file_deduplicated(self, file, key) -> bool:
+        """Upload the file unless an object already exists under the key"""
+        if self.head_file(key):
+            return False
+        self.upload_file(file, key)
+        return True
+
+    def upload_file_background(self, file, key) -> PendingUpload:
+        """Start the upload on the storage pool and return immediately"""
+        future = self.executor.submit(self.upload_file_deduplicated, file, key)
+        return PendingUpload(self, key, future)
+
+    async def upload_file_async(self, file, key):
+        return await asyncio.wrap_future(
+            self.executor.submit(self.upload_file_deduplicated, file, key)
+        )
+
+    async def delete_file_async(self, key):
+        return await asyncio.wrap_future(self.executor.submit(self.delete_file, key))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
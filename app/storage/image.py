@@ -0,0 +1,156 @@
+import hashlib
+import io
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+from app.core import constant
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.storage.s3 import s3_service
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpg": ("JPEG", "image/jpeg"),
+}
+
+
+def render_derivatives(data: bytes, size: tuple) -> dict:
+    """Render the thumbnail of an image, runs in the image process pool"""
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(size)
+        image = image.convert("RGBA")
+
+        rendered = {}
+        for extension, (format, content_type) in DERIVATIVE_FORMATS.items():
+            output = image
+            if format == "JPEG":
+                output = Image.new("RGB", image.size, (255, 255, 255))
+                output.paste(image, mask=image.getchannel("A"))
+            buffer = io.BytesIO()
+            output.save(buffer, format=format, quality=constant.IMAGE_QUALITY)
+            rendered[extension] = (buffer.getvalue(), content_type)
+        return rendered
+
+
+class ImageProcessor:
+    def __init__(self, storage, max_workers: int = 2):
+        self.storage = storage
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def derivative_key(self, key: str, digest: str, extension: str) -> str:
+        # Named by the sha256 of the source, like the content-addressed keys,
+        # so a presigned key posted to again gets new thumbnails.
+        folder, _, _ = key.rpartition("/")
+        return (
+            f"{folder}/{digest}_thumb.{extension}"
+            if folder
+            else f"{digest}_thumb.{extension}"
+        )
+
+    def generate(self, model, id: int, column: str, key: str, data: bytes = None):
+        """
+        Generate the thumbnails of an uploaded image off the request path.
+
+        The WebP thumbnail key is stored on `<column>_thumbnail` of the row once
+        the derivatives are uploaded, as long as `<column>` still holds `key`.
+        A JPEG thumbnail is stored next to it for clients without WebP.
+
+        The storage steps run on the storage pool and the resize on the image
+        process pool, each step is submitted when the previous one is done so
+        no thread waits for the resize. The returned future resolves to the
+        thumbnail key, None when the image could not be processed.
+        """
+        if not key or key.rsplit(".", 1)[-1].lower() not in constant.RASTER_EXTENSIONS:
+            return None
+        result = Future()
+        job = (model, id, column, key)
+        prepared = self.storage.executor.submit(self._prepare, key, data)
+        prepared.add_done_callback(partial(self._on_prepared, result, job))
+        return result
+
+    def generate_from_file(self, file, model, id: int, column: str, key: str):
+        file.file.seek(0)
+        return self.generate(model, id, column, key, file.file.read())
+
+    def _prepare(self, key: str, data: bytes = None):
+        data = data or self.storage.get_file(key)
+        if data is None:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        # Derivatives are content-addressed, existing ones are reused.
+        if self.storage.head_file(self.derivative_key(key, digest, "webp")):
+            return digest, None
+        return digest, data
+
+    def _on_prepared(self, result: Future, job: tuple, prepared: Future):
+        try:
+            if prepared.result() is None:
+                result.set_result(None)
+                return
+            digest, data = prepared.result()
+            if data is None:
+                self._submit_store(result, job, digest, {})
+                return
+            rendered = self.pool.submit(
+                render_derivatives, data, constant.IMAGE_THUMBNAIL_SIZE
+            )
+            rendered.add_done_callback(partial(self._on_rendered, result, job, digest))
+        except Exception as e:
+            self._fail(result, job, e)
+
+    def _on_rendered(self, result: Future, job: tuple, digest: str, rendered: Future):
+        try:
+            self._submit_store(result, job, digest, rendered.result())
+        except Exception as e:
+            self._fail(result, job, e)
+
+    def _submit_store(self, result: Future, job: tuple, digest: str, rendered: dict):
+        stored = self.storage.executor.submit(self._store, digest, rendered, *job)
+        stored.add_done_callback(partial(self._on_stored, result, job))
+
+    def _on_stored(self, result: Future, job: tuple, stored: Future):
+        try:
+            result.set_result(stored.result())
+        except Exception as e:
+            self._fail(result, job, e)
+
+    def _fail(self, result: Future, job: tuple, error: Exception):
+        logger.error("Generate thumbnail of %s failed: %s", job[3], error)
+        result.set_result(None)
+
+    def _store(self, digest: str, rendered: dict, model, id: int, column: str, key):
+        for extension, (content, content_type) in rendered.items():
+            self.storage.upload_bytes(
+                content, self.derivative_key(key, digest, extension), content_type
+            )
+        thumbnail_key = self.derivative_key(key, digest, "webp")
+        db = SessionLocal()
+        try:
+            db.query(model).filter(
+                model.id == id, getattr(model, column) == key
+            ).update({f"{column}_thumbnail": thumbnail_key}, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        return thumbnail_key
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+
+image_processor = ImageProcessor(s3_service, max_workers=settings.IMAGE_PROCESS_WORKERS)
@@ -0,0 +1,59 @@
+import shutil
+from pathlib import Path
+
+from app.storage.base import Storage
+
+
+class LocalStorage(Storage):
+    """Filesystem stand-in for S3, used for local development and tests"""
+
+    def __init__(self, root: str, base_url: str = "", max_workers: int = 10):
+        super().__init__(max_workers=max_workers)
+        self.root = Path(root)
+        self.base_url = base_url
+
+    def path(self, key) -> Path:
+        """Path of the key, refusing keys that point outside the root"""
+        root = self.root.resolve()
+        path = (root / key).resolve()
+        if not path.is_relative_to(root) or path == root:
+            raise ValueError(f"Invalid key {key}")
+        return path
+
+    def upload_file(self, file, key):
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file.file.seek(0)
+        with path.open("wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
+        return str(path)
+
+    def upload_bytes(self, data: bytes, key, content_type: str):
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return str(path)
+
+    def delete_file(self, key):
+        self.path(key).unlink(missing_ok=True)
+
+    def get_file(self, key):
+        path = self.path(key)
+        if not path.exists():
+            return None
+        return path.read_bytes()
+
+    def head_file(self, key):
+        path = self.path(key)
+        if not path.exists():
+            return None
+        return {"size": path.stat().st_size, "content_type": None}
+
+    def get_file_url(self, key):
+        return f"{self.base_url}{key}"
+
+    def generate_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ):
+        """Direct uploads need a bucket, None tells the caller they are unavailable"""
+        return None
@@ -0,0 +1,104 @@
+from typing import Optional, Tuple
+
+from app.core import constant
+from app.storage.redis import RedisBackend
+
+# KEYS[1] session, KEYS[2] lockout of the email
+# ARGV[1] code, ARGV[2] email, ARGV[3] manager base id, ARGV[4] session ttl
+ISSUE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'code', ARGV[1], 'email', ARGV[2],
+    'manager_base_id', ARGV[3], 'attempts', 0)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+# KEYS[1] session, KEYS[2] lockout of the email
+# ARGV[1] code, ARGV[2] email, ARGV[3] max attempts, ARGV[4] lockout ttl
+VERIFY_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return {-1, 0}
+end
+local session = redis.call('HMGET', KEYS[1], 'code', 'email')
+if not session[1] or session[2] ~= ARGV[2] then
+    return {0, 0}
+end
+if session[1] == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return {1, 0}
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts >= tonumber(ARGV[3]) then
+    redis.call('DEL', KEYS[1])
+    redis.call('SET', KEYS[2], 1, 'EX', ARGV[4])
+    return {-2, attempts}
+end
+return {-3, attempts}
+"""
+
+
+class OTPResult:
+    BLOCKED = -1
+    NOT_FOUND = 0
+    VERIFIED = 1
+    LOCKED_OUT = -2
+    INCORRECT = -3
+
+
+class OTPStore:
+    """
+    One time codes kept in Redis with native TTLs.
+
+    Issuing and checking a code are single Lua scripts, so the attempt
+    counter, the comparison and the lockout cannot race between workers.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "otp",
+        expire: int = constant.OTP_EXPIRE,
+        block_expire: int = constant.OTP_BLOCK_EXPIRE,
+        max_attempts: int = constant.OTP_MAX_ATTEMPTS,
+    ):
+        self.prefix = prefix
+        self.expire = expire
+        self.block_expire = block_expire
+        self.max_attempts = max_attempts
+
+    def session_key(self, session_id: str) -> str:
+        return f"{self.prefix}:session:{session_id}"
+
+    def block_key(self, email: str) -> str:
+        return f"{self.prefix}:block:{email.lower()}"
+
+    async def issue(
+        self,
+        redis: RedisBackend,
+        session_id: str,
+        email: str,
+        code: str,
+        manager_base_id: int,
+    ) -> bool:
+        """Store a code for the session, False when the email is locked out"""
+        issued = await redis.run_script(
+            ISSUE_SCRIPT,
+            keys=[self.session_key(session_id), self.block_key(email)],
+            args=[code, email, manager_base_id, self.expire],
+        )
+        return bool(issued)
+
+    async def verify(
+        self, redis: RedisBackend, session_id: str, email: str, code: str
+    ) -> Tuple[int, Optional[int]]:
+        """Check a code in one round trip, returns (OTPResult, attempts)"""
+        result, attempts = await redis.run_script(
+            VERIFY_SCRIPT,
+            keys=[self.session_key(session_id), self.block_key(email)],
+            args=[code, email, self.max_attempts, self.block_expire],
+        )
+        return int(result), int(attempts)
+
+
+otp_store = OTPStore()
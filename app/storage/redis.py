@@ -1,10 +1,48 @@
 from redis.asyncio import Redis
+import functools
 import json
+import logging
 from typing import Any, Optional
 
 from app.core.config import settings
+from app.core.metrics import record_cache
 from typing import Set, Any, Optional
 
+logger = logging.getLogger(__name__)
+
+# KEYS[1] lock
+# ARGV[1] owner token, ARGV[2] lease in milliseconds
+RENEW_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1] lock
+# ARGV[1] owner token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def track_write(method):
+    """Count and log failed cache writes, the callers ignore them"""
+
+    @functools.wraps(method)
+    async def wrapper(self, key: str, *args, **kwargs):
+        try:
+            return await method(self, key, *args, **kwargs)
+        except Exception as e:
+            record_cache(key, "write_error")
+            logger.warning("Redis write of %s failed: %s", key, e)
+            raise
+
+    return wrapper
+
 
 class RedisBackend:
 
@@ -17,6 +55,7 @@ class RedisBackend:
         expire: int,
     ):
         self.expire = expire
+        self.scripts = {}
         self.connection = Redis(
             host=host,
             port=port,
@@ -24,13 +63,23 @@ class RedisBackend:
             db=db,
         )
 
+    async def read(self, key: str, command) -> Any:
+        """Run a read command, counting cache hits, misses and errors"""
+        try:
+            response = await command
+        except Exception as e:
+            record_cache(key, "error")
+            logger.warning("Redis read of %s failed: %s", key, e)
+            raise
+        record_cache(key, "hit" if response else "miss")
+        return response
+
     async def get(self, key: str) -> Any:
         """Get Value from Key"""
-        response = await self.connection.get(
-            key,
-        )
+        response = await self.read(key, self.connection.get(key))
         return response
 
+    @track_write
     async def set(self, key: str, value: str, expire: int = None):
         """Set Value to Key"""
         await self.connection.set(key, value, expire or self.expire)
@@ -39,6 +88,7 @@ class RedisBackend:
         """Get Keys by Pattern"""
         return await self.connection.keys(pattern)
 
+    @track_write
     async def set_list(self, key: str, value: list, expire: int = None):
         """Set Value to Key"""
         for v in value:
@@ -47,8 +97,10 @@ class RedisBackend:
 
     async def get_list(self, key: str) -> list:
         """Get Value from Key"""
-        return [json.loads(v) for v in await self.connection.lrange(key, 0, -1)]
+        values = await self.read(key, self.connection.lrange(key, 0, -1))
+        return [json.loads(v) for v in values]
 
+    @track_write
     async def set_dict(self, key: str, value: dict, expire: int = None):
         """Set Value to Key"""
         await self.connection.hmset(key, value)
@@ -56,12 +108,47 @@ class RedisBackend:
 
     async def get_dict(self, key: str) -> dict:
         """Get Value from Key"""
-        return await self.connection.hgetall(key)
+        return await self.read(key, self.connection.hgetall(key))
 
     async def delete(self, key: str):
         """Delete Key"""
         await self.connection.delete(key)
 
+    async def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Delete Keys by Pattern, scanning instead of blocking on KEYS"""
+        deleted = 0
+        keys = []
+        async for key in self.connection.scan_iter(match=pattern, count=batch_size):
+            keys.append(key)
+            if len(keys) >= batch_size:
+                deleted += await self.connection.delete(*keys)
+                keys = []
+        if keys:
+            deleted += await self.connection.delete(*keys)
+        return deleted
+
+    async def acquire_lock(self, key: str, token: str, lease: float) -> bool:
+        """Take Lock for lease seconds unless another owner holds it"""
+        return bool(
+            await self.connection.set(key, token, px=int(lease * 1000), nx=True)
+        )
+
+    async def renew_lock(self, key: str, token: str, lease: float) -> bool:
+        """Extend Lock held by token, False when it has been lost"""
+        return bool(
+            await self.run_script(RENEW_LOCK_SCRIPT, [key], [token, int(lease * 1000)])
+        )
+
+    async def release_lock(self, key: str, token: str) -> bool:
+        """Release Lock held by token, never one taken over by another owner"""
+        return bool(await self.run_script(RELEASE_LOCK_SCRIPT, [key], [token]))
+
+    async def run_script(self, script: str, keys: list, args: list) -> Any:
+        """Run Lua Script, loaded once and called by sha afterwards"""
+        if script not in self.scripts:
+            self.scripts[script] = self.connection.register_script(script)
+        return await self.scripts[script](keys=keys, args=args)
+
 
 class RedisDependency:
     redis: Optional[RedisBackend] = None
@@ -1,25 +1,34 @@
 import boto3
 from typing import List, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
+from app.core import constant
+from app.storage.base import Storage
+from app.storage.local import LocalStorage
 
 
-class S3:
+class S3(Storage):
     def __init__(
         self,
         aws_access_key_id: str,
         aws_secret_access_key: str,
         bucket_name: str,
         client: Optional[boto3.client] = None,
+        max_pool_connections: int = 10,
     ):
+        super().__init__(max_workers=max_pool_connections)
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.bucket_name = bucket_name
+        # boto3 clients are thread-safe, one client (and its connection pool)
+        # is shared by every upload running on the storage pool.
         self.client = client or boto3.client(
             "s3",
             aws_access_key_id=self.aws_access_key_id,
             aws_secret_access_key=self.aws_secret_access_key,
+            config=Config(max_pool_connections=max_pool_connections),
         )
 
     def upload_file(self, file, key):
@@ -28,12 +37,25 @@ class S3:
                 file.file,
                 self.bucket_name,
                 key,
-                ExtraArgs={"ContentType": file.content_type},
+                ExtraArgs={
+                    "ContentType": file.content_type,
+                    "CacheControl": constant.IMMUTABLE_CACHE_CONTROL,
+                },
             )
             return f"{self.bucket_name}.s3.amazonaws.com/{key}"
         except ClientError as e:
             raise e
 
+    def upload_bytes(self, data: bytes, key, content_type: str):
+        self.client.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            CacheControl=constant.IMMUTABLE_CACHE_CONTROL,
+        )
+        return f"{self.bucket_name}.s3.amazonaws.com/{key}"
+
     def delete_file(self, key):
         try:
             self.client.delete_object(Bucket=self.bucket_name, Key=key)
@@ -51,12 +73,51 @@ class S3:
                 return None
             raise e
 
+    def head_file(self, key):
+        try:
+            response = self.client.head_object(Bucket=self.bucket_name, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ["404", "NoSuchKey", "NotFound"]:
+                return None
+            raise e
+        return {
+            "size": response["ContentLength"],
+            "content_type": response.get("ContentType"),
+        }
+
+    def generate_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ):
+        # The key is not derived from the content and can be posted to again
+        # until the policy expires, so caches revalidate it by its ETag.
+        return self.client.generate_presigned_post(
+            Bucket=self.bucket_name,
+            Key=key,
+            Fields={
+                "Content-Type": content_type,
+                "Cache-Control": constant.REVALIDATE_CACHE_CONTROL,
+            },
+            Conditions=[
+                {"Content-Type": content_type},
+                {"Cache-Control": constant.REVALIDATE_CACHE_CONTROL},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=expires_in,
+        )
+
     def get_file_url(self, key):
         return f"https://{self.bucket_name}.s3.amazonaws.com/{key}"
 
 
-s3_service = S3(
-    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    bucket_name=settings.AWS_BUCKET_NAME,
-)
+if settings.STORAGE_BACKEND == "local":
+    s3_service = LocalStorage(
+        root=settings.LOCAL_STORAGE_DIR,
+        max_workers=settings.STORAGE_MAX_CONCURRENCY,
+    )
+else:
+    s3_service = S3(
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        bucket_name=settings.AWS_BUCKET_NAME,
+        max_pool_connections=settings.STORAGE_MAX_CONCURRENCY,
+    )
@@ -0,0 +1,80 @@
+"""
+Pytest plugin asserting SQL query budgets per endpoint.
+
+Enable it with `pytest -p app.testing.query_budget` or by adding
+`pytest_plugins = ["app.testing.query_budget"]` to a conftest, as
+tests/conftest.py does. Then either
+wrap the requests of a test:
+
+    def test_search_job(client, query_budget):
+        with query_budget(12):
+            client.get("/v1/api/job/search")
+
+or put a budget on the whole test with @pytest.mark.query_budget(12).
+The failure lists the statement fingerprints with how often each ran.
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.core.query_stats import QueryStats
+
+
+@contextmanager
+def count_queries(engine):
+    stats = QueryStats()
+
+    def after_cursor_execute(conn, cursor, statement, *args):
+        stats.add(statement, 0.0)
+
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def check_budget(stats: QueryStats, budget: int):
+    if stats.count <= budget:
+        return
+    lines = [
+        f"{count}x {statement}" for statement, count in stats.fingerprints.most_common()
+    ]
+    pytest.fail(
+        f"{stats.count} queries over a budget of {budget}:\n" + "\n".join(lines),
+        pytrace=False,
+    )
+
+
+@pytest.fixture
+def query_budget():
+    from app.db.base import engine
+
+    @contextmanager
+    def budget(limit: int):
+        with count_queries(engine) as stats:
+            yield stats
+        check_budget(stats, limit)
+
+    return budget
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "query_budget(limit): fail when the test runs more SQL statements"
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+    from app.db.base import engine
+
+    with count_queries(engine) as stats:
+        result = yield
+    check_budget(stats, marker.args[0])
+    return result
@@ -0,0 +1,149 @@
+"""
+Email outbox worker.
+
+Run with: python -m app.worker.email_outbox
+
+Claims pending rows of the email_outbox table in batches and delivers them
+over a single SMTP connection that is kept open between batches and closed
+after EMAIL_SMTP_IDLE_TIMEOUT seconds without mail. Failed messages are
+retried with exponential backoff until EMAIL_OUTBOX_MAX_ATTEMPTS is reached.
+
+For local runs point MAIL_SERVER/MAIL_PORT at an SMTP stand-in, for example
+python -m aiosmtpd -n -l localhost:1025 with MAIL_STARTTLS=false and
+USE_CREDENTIALS=false.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from email.message import EmailMessage
+from email.utils import formataddr
+
+import aiosmtplib
+
+from app.core import constant
+from app.core.config import settings
+from app.core.email_config import conf
+from app.crud import email_outbox as email_outboxCRUD
+from app.db.base import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def build_message(row) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = formataddr((conf.MAIL_FROM_NAME, conf.MAIL_FROM))
+    message["To"] = row.recipient
+    message["Subject"] = row.subject
+    message.set_content(row.body, subtype=row.subtype)
+    return message
+
+
+def retry_delay(attempts: int) -> float:
+    delay = constant.EMAIL_RETRY_BASE_DELAY * 2 ** (attempts - 1)
+    return min(delay, constant.EMAIL_RETRY_MAX_DELAY) * random.uniform(0.8, 1.2)
+
+
+class EmailOutboxWorker:
+    def __init__(self, batch_size: int = None, poll_interval: float = None):
+        self.batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+        self.poll_interval = poll_interval or settings.EMAIL_OUTBOX_POLL_INTERVAL
+        self.max_attempts = settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.smtp = None
+        self.last_used = 0.0
+        self.running = False
+
+    async def connect(self) -> aiosmtplib.SMTP:
+        if self.smtp and self.smtp.is_connected:
+            return self.smtp
+        self.smtp = aiosmtplib.SMTP(
+            hostname=conf.MAIL_SERVER,
+            port=conf.MAIL_PORT,
+            use_tls=conf.MAIL_SSL_TLS,
+            start_tls=conf.MAIL_STARTTLS,
+            validate_certs=conf.VALIDATE_CERTS,
+            timeout=conf.TIMEOUT,
+        )
+        await self.smtp.connect()
+        if conf.USE_CREDENTIALS:
+            await self.smtp.login(conf.MAIL_USERNAME, conf.MAIL_PASSWORD)
+        return self.smtp
+
+    async def disconnect(self):
+        if self.smtp and self.smtp.is_connected:
+            try:
+                await self.smtp.quit()
+            except aiosmtplib.SMTPException:
+                self.smtp.close()
+        self.smtp = None
+
+    async def send(self, row):
+        smtp = await self.connect()
+        try:
+            await smtp.send_message(build_message(row))
+        except aiosmtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection, reconnect once.
+            await self.disconnect()
+            smtp = await self.connect()
+            await smtp.send_message(build_message(row))
+
+    async def process_batch(self) -> int:
+        with SessionLocal(expire_on_commit=False) as db:
+            rows = await asyncio.to_thread(
+                email_outboxCRUD.claim_batch,
+                db,
+                self.batch_size,
+                constant.EMAIL_SEND_LEASE,
+            )
+            if not rows:
+                return 0
+
+            sent = []
+            for row in rows:
+                try:
+                    await self.send(row)
+                    sent.append(row.id)
+                except Exception as e:
+                    logger.warning("Send email %s failed: %s", row.id, e)
+                    if isinstance(e, aiosmtplib.SMTPServerDisconnected):
+                        await self.disconnect()
+                    retry_in = None
+                    if row.attempts < self.max_attempts:
+                        retry_in = retry_delay(row.attempts)
+                    await asyncio.to_thread(
+                        email_outboxCRUD.mark_failed, db, row.id, str(e), retry_in
+                    )
+            await asyncio.to_thread(email_outboxCRUD.mark_sent, db, sent)
+            self.last_used = time.monotonic()
+            return len(rows)
+
+    async def run(self):
+        self.running = True
+        try:
+            while self.running:
+                try:
+                    processed = await self.process_batch()
+                except Exception:
+                    logger.exception("Email outbox batch failed")
+                    await self.disconnect()
+                    processed = 0
+                if processed >= self.batch_size:
+                    continue
+                if (
+                    self.smtp
+                    and time.monotonic() - self.last_used
+                    > constant.EMAIL_SMTP_IDLE_TIMEOUT
+                ):
+                    await self.disconnect()
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            await self.disconnect()
+
+    def stop(self):
+        self.running = False
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(EmailOutboxWorker().run())
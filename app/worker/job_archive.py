@@ -0,0 +1,60 @@
+"""
+Job archive worker.
+
+Run with: python -m app.worker.job_archive
+
+Moves jobs that expired more than JOB_ARCHIVE_AFTER_DAYS ago, with their
+work_location, job_category, job_skill, working_time, job_approval_request
+and approval_log rows, to the matching *_archive tables, so the tables read
+by the public job search only hold live jobs. Each batch of
+JOB_ARCHIVE_BATCH_SIZE jobs is one transaction locking its rows with SKIP
+LOCKED, RETENTION_BATCH_PAUSE seconds pass between batches.
+
+Jobs with applications or reports stay in place, those rows reference the
+job. The business job endpoints read archived jobs through
+CRUDJobArchive. The scheduler of the API processes runs it on
+JOB_ARCHIVE_SCHEDULE, see app.worker.schedule.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.core.metrics import record_retention
+from app.crud import job_archive as job_archiveCRUD
+from app.db.base import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def archive_batch(batch_size: int) -> int:
+    before = datetime.now().date() - timedelta(days=settings.JOB_ARCHIVE_AFTER_DAYS)
+    with SessionLocal() as db:
+        job_ids = job_archiveCRUD.get_archivable_ids(db, before, batch_size)
+        if not job_ids:
+            return 0
+        return job_archiveCRUD.archive(db, job_ids)
+
+
+class JobArchiveWorker:
+    def __init__(self, batch_size: int = None, pause: float = None):
+        self.batch_size = batch_size or settings.JOB_ARCHIVE_BATCH_SIZE
+        self.pause = settings.RETENTION_BATCH_PAUSE if pause is None else pause
+
+    async def run_once(self) -> int:
+        archived = 0
+        while True:
+            count = await asyncio.to_thread(archive_batch, self.batch_size)
+            archived += count
+            if count < self.batch_size:
+                break
+            await asyncio.sleep(self.pause)
+        logger.info("Archived %d jobs", archived)
+        record_retention("job", "archived", archived)
+        return archived
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(JobArchiveWorker().run_once())
@@ -0,0 +1,59 @@
+"""
+Job expiry worker.
+
+Run with: python -m app.worker.job_expiry
+
+Moves published jobs whose deadline has passed to EXPIRED in batches of
+JOB_EXPIRY_BATCH_SIZE, then exits. The scheduler in app.worker.schedule
+runs it every JOB_EXPIRY_INTERVAL seconds. Each batch locks
+its rows with SKIP LOCKED, so several workers can run side by side. The
+position and category counters are decreased with the batch and the cached
+listings and counts are dropped afterwards, so public queries can rely on
+the status alone.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.job.service_job import evict_job_caches
+from app.crud import job as jobCRUD
+from app.db.base import SessionLocal
+from app.storage.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+def expire_batch(batch_size: int) -> int:
+    with SessionLocal() as db:
+        job_ids = jobCRUD.get_expired_ids(db, datetime.now().date(), batch_size)
+        if job_ids:
+            jobCRUD.expire(db, job_ids)
+        return len(job_ids)
+
+
+class JobExpiryWorker:
+    def __init__(self, redis=None, batch_size: int = None):
+        self.redis = redis or redis_client
+        self.batch_size = batch_size or settings.JOB_EXPIRY_BATCH_SIZE
+
+    async def run_once(self) -> int:
+        expired = 0
+        while True:
+            count = await asyncio.to_thread(expire_batch, self.batch_size)
+            expired += count
+            if count < self.batch_size:
+                break
+        if expired:
+            logger.info("Expired %d jobs", expired)
+            try:
+                await evict_job_caches(self.redis)
+            except Exception as e:
+                logger.warning("Evict job caches failed: %s", e)
+        return expired
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(JobExpiryWorker().run_once())
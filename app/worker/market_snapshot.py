@@ -0,0 +1,40 @@
+"""
+Recruitment market snapshot worker.
+
+Run with: python -m app.worker.market_snapshot
+
+Counts the active jobs, those approved in the last 24 hours, those created
+today and the companies with an active job, and writes them as a WorkMarket
+row together with the active jobs per category and per province as
+CruitmentDemand rows sharing its time_scan, then exits. The scheduler of the
+API processes takes a snapshot on MARKET_SNAPSHOT_SCHEDULE (daily by
+default), see app.worker.schedule. GET /job/cruitment_demand reads the
+latest row and GET /job/cruitment_demand/history rolls the rows up by day or
+week.
+"""
+
+import asyncio
+import logging
+
+from app.core.market.service_market import take_snapshot
+from app.db.base import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot():
+    with SessionLocal() as db:
+        work_market = take_snapshot(db)
+        return work_market.time_scan
+
+
+class MarketSnapshotWorker:
+    async def run_once(self):
+        time_scan = await asyncio.to_thread(snapshot)
+        logger.info("Market snapshot taken at %s", time_scan)
+        return time_scan
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(MarketSnapshotWorker().run_once())
@@ -0,0 +1,145 @@
+"""
+Retention purges of the append-only tables.
+
+Run with: python -m app.worker.retention
+
+Every table has a policy: the rows whose age column is older than the
+retention are deleted, or moved to an archive table first. The rows are
+walked in primary key order in batches of RETENTION_BATCH_SIZE, each batch
+is its own short transaction and RETENTION_BATCH_PAUSE seconds pass between
+batches, so the purge never holds long locks. The tables only grow at the
+end, a batch reaching rows that are kept ends the walk.
+
+The scheduler of the API processes runs it on RETENTION_SCHEDULE, see
+app.worker.schedule. The rows purged per table are logged and counted in
+the retention_rows_total metric.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Dict, List, Type
+
+from app import crud
+from app.core import constant
+from app.core.config import settings
+from app.core.metrics import record_retention
+from app.db.base import SessionLocal
+from app.db.base_class import Base
+from app.model import (
+    Blacklist,
+    BusinessHistory,
+    BusinessHistoryArchive,
+    JobReport,
+    JobReportArchive,
+    VerifyCode,
+    VerifyCodeBlock,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionPolicy:
+    def __init__(
+        self,
+        model: Type[Base],
+        column,
+        retention: timedelta,
+        archive: Type[Base] = None,
+    ):
+        self.model = model
+        self.column = column
+        self.retention = retention
+        self.archive = archive
+        self.name = model.__tablename__
+
+
+def get_policies() -> List[RetentionPolicy]:
+    token_lifetime = max(settings.ACCESS_TOKEN_EXPIRE, settings.REFRESH_TOKEN_EXPIRE)
+    audit = timedelta(days=settings.VERIFY_CODE_RETENTION_DAYS)
+    return [
+        # A revoked token is only checked until it expires by itself.
+        RetentionPolicy(
+            Blacklist, Blacklist.created_at, timedelta(seconds=token_lifetime)
+        ),
+        RetentionPolicy(
+            VerifyCode,
+            VerifyCode.created_at,
+            timedelta(seconds=constant.OTP_EXPIRE) + audit,
+        ),
+        RetentionPolicy(
+            VerifyCodeBlock,
+            VerifyCodeBlock.created_at,
+            timedelta(seconds=constant.OTP_BLOCK_EXPIRE) + audit,
+        ),
+        RetentionPolicy(
+            BusinessHistory,
+            BusinessHistory.created_at,
+            timedelta(days=settings.BUSINESS_HISTORY_RETENTION_DAYS),
+            archive=BusinessHistoryArchive,
+        ),
+        RetentionPolicy(
+            JobReport,
+            JobReport.report_created_at,
+            timedelta(days=settings.JOB_REPORT_RETENTION_DAYS),
+            archive=JobReportArchive,
+        ),
+    ]
+
+
+def purge_table(policy: RetentionPolicy, batch_size: int, pause: float) -> int:
+    purged = 0
+    after_id = 0
+    with SessionLocal() as db:
+        cutoff = crud.retention.now(db) - policy.retention
+        while True:
+            rows = crud.retention.get_batch(
+                db, policy.model, policy.column, cutoff, after_id, batch_size
+            )
+            # The transaction of the read is ended before the pause.
+            db.commit()
+            expired = [id for id, is_expired in rows if is_expired]
+            if expired:
+                purged += crud.retention.purge(
+                    db, policy.model, expired, policy.archive
+                )
+            if len(rows) < batch_size or len(expired) < len(rows):
+                return purged
+            after_id = rows[-1][0]
+            time.sleep(pause)
+
+
+class RetentionWorker:
+    def __init__(
+        self,
+        policies: List[RetentionPolicy] = None,
+        batch_size: int = None,
+        pause: float = None,
+    ):
+        self.policies = policies or get_policies()
+        self.batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+        self.pause = settings.RETENTION_BATCH_PAUSE if pause is None else pause
+
+    async def run_once(self) -> Dict[str, int]:
+        report = {}
+        for policy in self.policies:
+            try:
+                report[policy.name] = await asyncio.to_thread(
+                    purge_table, policy, self.batch_size, self.pause
+                )
+            except Exception:
+                logger.exception("Purge of %s failed", policy.name)
+                continue
+            action = "archived" if policy.archive is not None else "deleted"
+            record_retention(policy.name, action, report[policy.name])
+        logger.info(
+            "Purged %s",
+            ", ".join(f"{name}: {rows}" for name, rows in report.items()),
+        )
+        return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(RetentionWorker().run_once())
@@ -0,0 +1,28 @@
+"""
+Periodic tasks of the API processes.
+
+The scheduler is started from the lifespan of app.main when
+SCHEDULER_ENABLED is set, see app.core.scheduler for how a single process
+is chosen to run each task.
+"""
+
+from app.core.config import settings
+from app.core.scheduler import Scheduler
+from app.worker.job_archive import JobArchiveWorker
+from app.worker.job_expiry import JobExpiryWorker
+from app.worker.market_snapshot import MarketSnapshotWorker
+from app.worker.retention import RetentionWorker
+
+scheduler = Scheduler()
+scheduler.register(
+    "job_expiry", JobExpiryWorker().run_once, settings.JOB_EXPIRY_INTERVAL
+)
+scheduler.register(
+    "market_snapshot",
+    MarketSnapshotWorker().run_once,
+    settings.MARKET_SNAPSHOT_SCHEDULE,
+)
+scheduler.register("retention", RetentionWorker().run_once, settings.RETENTION_SCHEDULE)
+scheduler.register(
+    "job_archive", JobArchiveWorker().run_once, settings.JOB_ARCHIVE_SCHEDULE
+)
@@ -0,0 +1,161 @@
+"""
+Shared fixtures of the test suite.
+
+Run with: pip install -r requirements-test.txt && pytest
+
+The tests run against a SQLite file filled by app.bench.seed and an in
+memory fakeredis server, so neither MySQL nor Redis is needed. The settings
+without a default get test values unless the environment already has them,
+DATABASE_URL always points at the test file.
+"""
+
+import os
+import shutil
+import tempfile
+from argparse import Namespace
+
+import pytest
+
+pytest_plugins = ["app.testing.query_budget"]
+
+TEST_DIR = tempfile.mkdtemp(prefix="tvnow-test-")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DIR}/test.db"
+for name, value in {
+    "PROJECT_NAME": "TVNow",
+    "SECRET_KEY": "test-secret",
+    "SECURITY_ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE": "3600",
+    "REFRESH_TOKEN_EXPIRE": "86400",
+    "MYSQL_USER": "test",
+    "MYSQL_PASSWORD": "test",
+    "MYSQL_SERVER": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_DATABASE": "test",
+    "FIRST_SUPERUSER": "admin",
+    "FIRST_SUPERUSER_EMAIL": "admin@test.tvnow.vn",
+    "FIRST_SUPERUSER_PASSWORD": "@Password1234",
+    "FIRST_SUPERUSER_PHONE_NUMBER": "0912345678",
+    "MAIL_USERNAME": "test",
+    "MAIL_PASSWORD": "test",
+    "MAIL_FROM": "noreply@test.tvnow.vn",
+    "MAIL_PORT": "25",
+    "MAIL_SERVER": "localhost",
+    "MAIL_FROM_NAME": "TVNow",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+    "GOOGLE_PROJECT_ID": "test",
+    "GOOGLE_AUTH_URI": "http://localhost",
+    "GOOGLE_TOKEN_URI": "http://localhost",
+    "GOOGLE_AUTH_PROVIDER_X509_CERT_URL": "http://localhost",
+    "GOOGLE_REDIRECT_URI": "http://localhost",
+    "GOOGLE_JAVASCRIPT_ORIGIN": "http://localhost",
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "AWS_BUCKET_NAME": "test",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "",
+    "REDIS_DB": "0",
+    "REDIS_EXPIRE": "60",
+    "STORAGE_BACKEND": "local",
+    "LOCAL_STORAGE_DIR": f"{TEST_DIR}/media",
+    "SCHEDULER_ENABLED": "false",
+}.items():
+    os.environ.setdefault(name, value)
+
+SEED = Namespace(
+    provinces=5,
+    districts=4,
+    categories=8,
+    fields=6,
+    skills=20,
+    positions=10,
+    companies=40,
+    campaigns=2,
+    jobs=600,
+    users=10,
+    approved_ratio=0.85,
+    batch_size=500,
+    seed=2024,
+)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    """Create the tables and fill them once for the whole session"""
+    from app.bench.seed import Seeder
+    from app.db.base import engine
+    from app.db.base_class import Base
+
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        Seeder(conn, SEED).run()
+    return engine
+
+
+@pytest.fixture
+def db(seeded_db):
+    from app.db.base import SessionLocal
+
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def scratch_db(seeded_db, tmp_path):
+    """A sessionmaker on a copy of the seeded database, for tests that change rows"""
+    import sqlite3
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    path = tmp_path / "scratch.db"
+    source, target = sqlite3.connect(f"{TEST_DIR}/test.db"), sqlite3.connect(path)
+    source.backup(target)
+    source.close()
+    target.close()
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def redis():
+    """The Redis backends of the app, talking to a fresh fakeredis server"""
+    import fakeredis
+
+    from app.storage.redis import redis_client, redis_dependency
+
+    server = fakeredis.FakeServer()
+    connection = redis_client.connection
+    redis_client.connection = fakeredis.FakeAsyncRedis(server=server)
+    redis_client.scripts = {}
+    redis_dependency.redis = redis_client
+    yield redis_client
+    redis_client.connection = connection
+    redis_client.scripts = {}
+    redis_dependency.redis = None
+
+
+@pytest.fixture
+def client(seeded_db, redis):
+    import anyio
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    # The lifespan, and with it the scheduler and the JWKS refresh, is not
+    # started. Every request runs on one event loop, as the fakeredis
+    # connections are bound to the loop they were opened on.
+    client = TestClient(app)
+    with anyio.from_thread.start_blocking_portal(**client.async_backend) as portal:
+        client.portal = portal
+        yield client
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import timedelta
+
+import aiosmtplib
+import pytest
+
+from app.core import constant
+from app.core.email.service_email import enqueue_email
+from app.crud import email_outbox as email_outboxCRUD
+from app.hepler.enum import EmailOutboxStatus
+from app.model import EmailOutbox
+from app.worker.email_outbox import EmailOutboxWorker
+
+
+class StubSMTP:
+    def __init__(self, refused=()):
+        self.refused = set(refused)
+        self.sent = []
+        self.is_connected = True
+
+    async def send_message(self, message):
+        if message["To"] in self.refused:
+            raise aiosmtplib.SMTPResponseException(550, "Mailbox unavailable")
+        self.sent.append(message["To"])
+
+    async def quit(self):
+        self.is_connected = False
+
+
+@pytest.fixture
+def outbox(db):
+    db.query(EmailOutbox).delete()
+    db.commit()
+    yield db
+    db.query(EmailOutbox).delete()
+    db.commit()
+
+
+def make_worker(smtp: StubSMTP, monkeypatch) -> EmailOutboxWorker:
+    worker = EmailOutboxWorker(batch_size=10)
+
+    async def connect():
+        worker.smtp = smtp
+        return smtp
+
+    monkeypatch.setattr(worker, "connect", connect)
+    return worker
+
+
+def enqueue(db, *recipients):
+    for recipient in recipients:
+        assert enqueue_email(db, "Subject", recipient, "<p>Body</p>")
+
+
+def rows(db) -> dict:
+    db.expire_all()
+    return {row.recipient: row for row in db.query(EmailOutbox)}
+
+
+def test_claim_leases_rows(outbox):
+    enqueue(outbox, "a@test.vn", "b@test.vn", "c@test.vn")
+
+    claimed = email_outboxCRUD.claim_batch(outbox, 2, constant.EMAIL_SEND_LEASE)
+    assert len(claimed) == 2
+    assert len(email_outboxCRUD.claim_batch(outbox, 2, constant.EMAIL_SEND_LEASE)) == 1
+    # Every row is leased now.
+    assert email_outboxCRUD.claim_batch(outbox, 2, constant.EMAIL_SEND_LEASE) == []
+
+    now = email_outboxCRUD.now(outbox)
+    for row in rows(outbox).values():
+        assert row.status == EmailOutboxStatus.SENDING
+        assert row.attempts == 1
+        assert row.next_attempt_at > now
+
+
+def test_expired_lease_is_claimed_again(outbox):
+    enqueue(outbox, "a@test.vn")
+    (row,) = email_outboxCRUD.claim_batch(outbox, 10, constant.EMAIL_SEND_LEASE)
+    row.next_attempt_at = email_outboxCRUD.now(outbox) - timedelta(seconds=1)
+    outbox.commit()
+
+    (again,) = email_outboxCRUD.claim_batch(outbox, 10, constant.EMAIL_SEND_LEASE)
+    assert again.id == row.id
+    assert again.attempts == 2
+
+
+def test_worker_sends_the_batch(outbox, monkeypatch):
+    enqueue(outbox, "a@test.vn", "b@test.vn")
+    smtp = StubSMTP()
+    worker = make_worker(smtp, monkeypatch)
+
+    assert asyncio.run(worker.process_batch()) == 2
+    assert sorted(smtp.sent) == ["a@test.vn", "b@test.vn"]
+    for row in rows(outbox).values():
+        assert row.status == EmailOutboxStatus.SENT
+        assert row.sent_at is not None
+    assert asyncio.run(worker.process_batch()) == 0
+
+
+def test_failed_send_backs_off(outbox, monkeypatch):
+    enqueue(outbox, "a@test.vn", "refused@test.vn")
+    worker = make_worker(StubSMTP(refused=["refused@test.vn"]), monkeypatch)
+
+    before = email_outboxCRUD.now(outbox)
+    asyncio.run(worker.process_batch())
+
+    sent, failed = rows(outbox)["a@test.vn"], rows(outbox)["refused@test.vn"]
+    assert sent.status == EmailOutboxStatus.SENT
+    assert failed.status == EmailOutboxStatus.PENDING
+    assert failed.attempts == 1
+    assert "Mailbox unavailable" in failed.last_error
+    assert failed.next_attempt_at >= before + timedelta(
+        seconds=constant.EMAIL_RETRY_BASE_DELAY * 0.8
+    )
+    # The row is not due before its backoff has passed.
+    assert asyncio.run(worker.process_batch()) == 0
+
+
+def test_send_gives_up_after_max_attempts(outbox, monkeypatch):
+    enqueue(outbox, "refused@test.vn")
+    worker = make_worker(StubSMTP(refused=["refused@test.vn"]), monkeypatch)
+    row = rows(outbox)["refused@test.vn"]
+    row.attempts = worker.max_attempts - 1
+    outbox.commit()
+
+    asyncio.run(worker.process_batch())
+
+    row = rows(outbox)["refused@test.vn"]
+    assert row.status == EmailOutboxStatus.FAILED
+    assert row.attempts == worker.max_attempts
+    assert row.next_attempt_at is None
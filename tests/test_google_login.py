@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.core import constant
+from app.core.auth import service_user_auth
+from app.model import SocialNetwork
+
+
+@pytest.fixture
+def google(db, monkeypatch):
+    payload = {
+        "sub": "108234567890",
+        "email": "google.login@test.vn",
+        "email_verified": True,
+        "name": "Google Login",
+        "picture": "https://lh3.googleusercontent.com/a/photo",
+        "jti": "f0a1b2c3d4",
+    }
+
+    async def verify_google_id_token(id_token):
+        return payload
+
+    async def get_google_user_info(token):
+        return {**payload, "id": payload["sub"]}
+
+    monkeypatch.setattr(
+        service_user_auth, "verify_google_id_token", verify_google_id_token
+    )
+    monkeypatch.setattr(service_user_auth, "get_google_user_info", get_google_user_info)
+    yield payload
+    db.query(SocialNetwork).filter(SocialNetwork.email == payload["email"]).delete()
+    db.commit()
+
+
+def stored(db, email) -> SocialNetwork:
+    db.expire_all()
+    return db.query(SocialNetwork).filter(SocialNetwork.email == email).one()
+
+
+def test_id_token_login_stores_no_access_token(db, google):
+    status, status_code, response = asyncio.run(
+        service_user_auth.authenticate_google(db, {"id_token": "id-token"})
+    )
+    assert (status, status_code) == (constant.SUCCESS, 200)
+    assert response["user"].email == google["email"]
+    social_network = stored(db, google["email"])
+    assert social_network.social_id == google["sub"]
+    assert social_network.access_token is None
+
+
+def test_access_token_login_stores_the_token(db, google):
+    status, status_code, _ = asyncio.run(
+        service_user_auth.authenticate_google(db, {"access_token": "ya29.token"})
+    )
+    assert (status, status_code) == (constant.SUCCESS, 200)
+    assert stored(db, google["email"]).access_token == "ya29.token"
+
+    # The next login finds the account instead of creating another one.
+    status, status_code, _ = asyncio.run(
+        service_user_auth.authenticate_google(db, {"id_token": "id-token"})
+    )
+    assert (status, status_code) == (constant.SUCCESS, 200)
+    assert stored(db, google["email"]).access_token == "ya29.token"
@@ -0,0 +1,77 @@
+import io
+
+import pytest
+from PIL import Image
+
+from app.model import Company
+from app.storage.image import ImageProcessor
+from app.storage.local import LocalStorage
+
+
+def png(color: str = "red") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (800, 400), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def processor(tmp_path):
+    storage = LocalStorage(root=str(tmp_path))
+    processor = ImageProcessor(storage, max_workers=1)
+    yield processor
+    processor.close()
+    storage.close()
+
+
+@pytest.fixture
+def company(db):
+    company = db.query(Company).first()
+    company.logo = "logo/source.png"
+    company.logo_thumbnail = None
+    db.commit()
+    return company
+
+
+def test_thumbnails_are_stored_on_the_row(db, processor, company):
+    storage = processor.storage
+    storage.upload_bytes(png(), company.logo, "image/png")
+
+    thumbnail_key = processor.generate(Company, company.id, "logo", company.logo)
+    thumbnail_key = thumbnail_key.result(timeout=30)
+
+    assert thumbnail_key.startswith("logo/") and thumbnail_key.endswith("_thumb.webp")
+    with Image.open(io.BytesIO(storage.get_file(thumbnail_key))) as thumbnail:
+        assert max(thumbnail.size) <= 256
+    assert storage.head_file(thumbnail_key.replace(".webp", ".jpg"))
+    db.refresh(company)
+    assert company.logo_thumbnail == thumbnail_key
+
+
+def test_thumbnails_follow_the_content(processor, company):
+    storage = processor.storage
+    storage.upload_bytes(png("red"), company.logo, "image/png")
+    first = processor.generate(Company, company.id, "logo", company.logo)
+    first = first.result(timeout=30)
+    # The same key posted to again gets thumbnails of its new content.
+    storage.delete_file(company.logo)
+    storage.upload_bytes(png("blue"), company.logo, "image/png")
+    second = processor.generate(Company, company.id, "logo", company.logo)
+    assert second.result(timeout=30) != first
+
+
+def test_row_changed_meanwhile_is_not_updated(db, processor, company):
+    data = png()
+    future = processor.generate(Company, company.id, "logo", "logo/old.png", data)
+    assert future.result(timeout=30)
+    db.refresh(company)
+    assert company.logo_thumbnail is None
+
+
+def test_unprocessable_images(processor, company):
+    assert processor.generate(Company, company.id, "logo", "logo/a.svg") is None
+    missing = processor.generate(Company, company.id, "logo", "logo/missing.png")
+    assert missing.result(timeout=30) is None
+    broken = processor.generate(
+        Company, company.id, "logo", company.logo, b"not an image"
+    )
+    assert broken.result(timeout=30) is None
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import date, time, timedelta
+
+import pytest
+from sqlalchemy import exists
+
+from app.core.auth.auth_handler import signJWT
+from app.core.config import settings
+from app.crud.job_archive import JOB_CHILDREN
+from app.db.base import get_db
+from app.hepler.enum import JobApprovalStatus, JobStatus
+from app.model import (
+    ApprovalLog,
+    ApprovalLogArchive,
+    CVApplication,
+    Job,
+    JobApprovalRequest,
+    JobApprovalRequestArchive,
+    JobArchive,
+    JobReport,
+    ManagerBase,
+    WorkingTime,
+)
+from app.worker import job_archive
+from app.worker.job_archive import JobArchiveWorker
+
+
+@pytest.fixture
+def session(scratch_db, monkeypatch):
+    from app.main import app
+
+    monkeypatch.setattr(job_archive, "SessionLocal", scratch_db)
+
+    def get_scratch_db():
+        with scratch_db() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = get_scratch_db
+    with scratch_db() as session:
+        yield session
+    app.dependency_overrides.pop(get_db)
+
+
+def children(db, job_id: int) -> dict:
+    counts = {
+        model.__tablename__: db.query(model).filter(model.job_id == job_id).count()
+        for model, _ in JOB_CHILDREN
+    }
+    counts["approval_log"] = (
+        db.query(ApprovalLog)
+        .join(JobApprovalRequest)
+        .filter(JobApprovalRequest.job_id == job_id)
+        .count()
+    )
+    return counts
+
+
+def archived_children(db, job_id: int) -> dict:
+    counts = {
+        model.__tablename__: db.query(archive).filter(archive.job_id == job_id).count()
+        for model, archive in JOB_CHILDREN
+    }
+    requests = [
+        id
+        for (id,) in db.query(JobApprovalRequestArchive.id).filter(
+            JobApprovalRequestArchive.job_id == job_id
+        )
+    ]
+    counts["approval_log"] = (
+        db.query(ApprovalLogArchive)
+        .filter(ApprovalLogArchive.job_approval_request_id.in_(requests))
+        .count()
+    )
+    return counts
+
+
+def bearer(user) -> dict:
+    token = signJWT(user)
+    # PyJWT 1.x encodes to bytes.
+    if isinstance(token, bytes):
+        token = token.decode()
+    return {"Authorization": f"Bearer {token}"}
+
+
+def expire_long_ago(db, job_ids: list):
+    deadline = date.today() - timedelta(days=settings.JOB_ARCHIVE_AFTER_DAYS + 10)
+    db.query(Job).filter(Job.id.in_(job_ids)).update(
+        {Job.status: JobStatus.EXPIRED, Job.deadline: deadline},
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+def test_old_jobs_move_with_their_rows(session, client):
+    no_references = ~exists().where(CVApplication.job_id == Job.id) & ~exists().where(
+        JobReport.job_id == Job.id
+    )
+    archived, applied, reported = [
+        id for (id,) in session.query(Job.id).filter(no_references).limit(3)
+    ]
+    session.add(
+        CVApplication(
+            job_id=applied,
+            user_id=1,
+            cv="cv/applied.pdf",
+            full_name="Applicant",
+            email="applicant@test.vn",
+            phone_number="0912345678",
+        )
+    )
+    session.add(JobReport(job_id=reported, user_id=1, report_type="spam"))
+    request = (
+        session.query(JobApprovalRequest)
+        .filter(JobApprovalRequest.job_id == archived)
+        .one()
+    )
+    session.add(
+        ApprovalLog(
+            job_approval_request_id=request.id,
+            previous_status=JobApprovalStatus.PENDING,
+            new_status=JobApprovalStatus.APPROVED,
+        )
+    )
+    session.add(
+        WorkingTime(
+            job_id=archived,
+            start_time=time(8),
+            end_time=time(17),
+            date_from=2,
+            date_to=6,
+        )
+    )
+    session.commit()
+    expire_long_ago(session, [archived, applied, reported])
+    before = children(session, archived)
+    assert all(before.values()), before
+
+    assert asyncio.run(JobArchiveWorker(batch_size=1, pause=0).run_once()) == 1
+
+    session.expire_all()
+    assert session.get(Job, archived) is None
+    assert session.get(JobArchive, archived) is not None
+    assert children(session, archived) == dict.fromkeys(before, 0)
+    assert archived_children(session, archived) == before
+    # Applications and reports reference their job, it stays.
+    assert session.get(Job, applied) is not None
+    assert session.get(Job, reported) is not None
+
+    business = session.get(ManagerBase, session.get(JobArchive, archived).business_id)
+    headers = bearer(business)
+    response = client.get(f"/v1/api/business/job/{archived}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["data"]["id"] == archived
+    response = client.get(
+        "/v1/api/business/job",
+        params={"archived": True, "limit": 100},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert archived in [job["id"] for job in response.json()["data"]]
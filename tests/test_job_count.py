@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from app.core import constant
+from app.core.config import settings
+from app.core.job import service_job
+from app.crud import job as jobCRUD
+from app.schema import job as job_schema
+
+
+@pytest.fixture
+def params():
+    return job_schema.JobCount().model_dump()
+
+
+async def count_with_ttl(db, redis, params):
+    count, exact = await service_job.count_search_jobs(db, redis, params)
+    ttls = [await redis.connection.ttl(key) for key in await redis.keys("*")]
+    return count, exact, ttls
+
+
+def test_exact_by_default(db, redis, params):
+    assert settings.JOB_COUNT_MODE == "exact"
+    count, exact, ttls = asyncio.run(count_with_ttl(db, redis, params))
+    assert (count, exact) == (jobCRUD.count(db, **params), True)
+    # New and approved jobs show up in the total within a minute.
+    assert len(ttls) == 1
+    assert 0 < ttls[0] <= constant.JOB_COUNT_EXACT_CACHE_EXPIRE
+
+
+def test_estimates_are_cached_apart_from_exact_counts(db, redis, params, monkeypatch):
+    exact = jobCRUD.count(db, **params)
+    monkeypatch.setattr(settings, "JOB_COUNT_EXACT_LIMIT", 10)
+    monkeypatch.setattr(jobCRUD, "estimate_count", lambda db, **params: exact * 2)
+
+    async def run():
+        monkeypatch.setattr(settings, "JOB_COUNT_MODE", "approximate")
+        count, is_exact, ttls = await count_with_ttl(db, redis, params)
+        assert (count, is_exact) == (exact * 2, False)
+        assert ttls[0] > constant.JOB_COUNT_EXACT_CACHE_EXPIRE
+
+        # Switching the mode does not serve the cached estimate.
+        monkeypatch.setattr(settings, "JOB_COUNT_MODE", "exact")
+        count, is_exact, ttls = await count_with_ttl(db, redis, params)
+        assert (count, is_exact) == (exact, True)
+        assert len(ttls) == 2
+
+    asyncio.run(run())
@@ -0,0 +1,71 @@
+import asyncio
+from collections import Counter
+from datetime import date
+
+import pytest
+
+from app.hepler.enum import JobStatus
+from app.model import Category, Job, JobCategory, JobPosition
+from app.worker import job_expiry
+from app.worker.job_expiry import JobExpiryWorker
+
+
+@pytest.fixture
+def session(scratch_db, monkeypatch):
+    monkeypatch.setattr(job_expiry, "SessionLocal", scratch_db)
+    with scratch_db() as session:
+        yield session
+
+
+def counters(db, model) -> dict:
+    return dict(db.query(model.id, model.count))
+
+
+def statuses(db) -> dict:
+    return dict(db.query(Job.id, Job.status))
+
+
+def test_expire_sets_status_and_decreases_counters(session, redis):
+    today = date.today()
+    due = [
+        job
+        for job in session.query(Job).filter(Job.status == JobStatus.PUBLISHED)
+        if job.deadline < today
+    ]
+    assert due
+    due_ids = {job.id for job in due}
+    position_deltas = Counter(job.job_position_id for job in due)
+    category_deltas = Counter(
+        category_id
+        for (category_id,) in session.query(JobCategory.category_id).filter(
+            JobCategory.job_id.in_(due_ids)
+        )
+    )
+    positions = counters(session, JobPosition)
+    categories = counters(session, Category)
+    before = statuses(session)
+
+    async def run():
+        await redis.set("count_job_by_category", "[]")
+        # A small batch, so the worker has to walk several of them.
+        expired = await JobExpiryWorker(redis, batch_size=7).run_once()
+        return expired, await redis.get("count_job_by_category")
+
+    expired, cached = asyncio.run(run())
+
+    assert expired == len(due_ids)
+    assert cached is None
+    session.expire_all()
+    after = statuses(session)
+    for id, status in after.items():
+        expected = JobStatus.EXPIRED if id in due_ids else before[id]
+        assert status == expected
+    assert counters(session, JobPosition) == {
+        id: count - position_deltas[id] for id, count in positions.items()
+    }
+    assert counters(session, Category) == {
+        id: count - category_deltas[id] for id, count in categories.items()
+    }
+
+    # Nothing is due any more.
+    assert asyncio.run(JobExpiryWorker(redis).run_once()) == 0
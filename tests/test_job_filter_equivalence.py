@@ -0,0 +1,95 @@
+import random
+
+import pytest
+from sqlalchemy import func
+
+from app import crud
+from app.bench.job_filter_equivalence import compare, get_ids, random_filters
+from app.hepler.enum import JobApprovalStatus, JobStatus, SalaryType
+from app.model import Campaign, CompanyField, Job, JobCategory, WorkLocation
+
+PUBLIC = {
+    "job_status": JobStatus.PUBLISHED,
+    "job_approve_status": JobApprovalStatus.APPROVED,
+    "limit": 50,
+}
+
+
+def most_common(db, column, onclause):
+    """The value of the column shared by the most published jobs"""
+    return (
+        db.query(column)
+        .join(Job, onclause)
+        .filter(Job.status == JobStatus.PUBLISHED)
+        .group_by(column)
+        .order_by(func.count().desc(), column)
+        .limit(1)
+        .scalar()
+    )
+
+
+@pytest.fixture
+def values(db):
+    location = (
+        db.query(WorkLocation.province_id, WorkLocation.district_id)
+        .filter(
+            WorkLocation.district_id
+            == most_common(db, WorkLocation.district_id, WorkLocation.job_id == Job.id)
+        )
+        .first()
+    )
+    company_id = most_common(db, Campaign.company_id, Job.campaign_id == Campaign.id)
+    return {
+        "province_id": location.province_id,
+        "district_id": location.district_id,
+        "category_id": most_common(
+            db, JobCategory.category_id, JobCategory.job_id == Job.id
+        ),
+        "company_id": company_id,
+        "field_id": db.query(CompanyField.field_id)
+        .filter(CompanyField.company_id == company_id)
+        .limit(1)
+        .scalar(),
+    }
+
+
+CASES = {
+    "province": ["province_id"],
+    "province_district": ["province_id", "district_id"],
+    "district": ["district_id"],
+    "category": ["category_id"],
+    "company": ["company_id"],
+    "field": ["field_id"],
+    "company_field": ["company_id", "field_id"],
+    "province_category": ["province_id", "category_id"],
+    "combined": ["province_id", "district_id", "category_id", "company_id"],
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_filters_match_legacy(db, values, name):
+    filters = {**PUBLIC, **{key: values[key] for key in CASES[name]}}
+    assert compare(db, filters) == []
+
+
+def test_salary_filters_match_legacy(db, values):
+    filters = {
+        **PUBLIC,
+        "province_id": values["province_id"],
+        "salary_type": SalaryType.VND,
+        "min_salary": 5000000,
+    }
+    assert compare(db, filters) == []
+
+
+def test_single_filters_are_not_empty(db, values):
+    for key in ("province_id", "district_id", "category_id", "company_id"):
+        assert crud.job.count(db, **PUBLIC, **{key: values[key]}) > 0, key
+
+
+def test_random_filters_match_legacy(db):
+    rng = random.Random(2024)
+    ids = get_ids(db)
+    for _ in range(100):
+        filters = random_filters(rng, ids)
+        assert compare(db, filters) == [], filters
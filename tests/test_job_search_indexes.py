@@ -0,0 +1,35 @@
+import pytest
+
+from app import crud
+from app.bench.explain_job_search import (
+    COMBINATIONS,
+    PUBLIC,
+    capture,
+    full_scans,
+    indexes_used,
+)
+
+# The composite index each filter is expected to be served by.
+FILTER_INDEXES = {
+    "job_status": "ix_job_status_approval_status_deadline_id",
+    "province_id": "ix_work_location_province_id_district_id_job_id",
+    "category_id": "ix_job_category_category_id_job_id",
+}
+
+
+@pytest.mark.parametrize("method", ["search", "count"])
+@pytest.mark.parametrize("name", list(COMBINATIONS))
+def test_filters_use_indexes(db, name, method):
+    filters = {**PUBLIC, **COMBINATIONS[name]}
+    run = getattr(crud.job, method)
+    statements = capture(lambda: run(db, **filters))
+    assert statements
+    conn = db.connection()
+    scans, indexes = set(), set()
+    for statement, parameters in statements:
+        scans.update(full_scans(conn, statement, parameters))
+        indexes.update(indexes_used(conn, statement, parameters))
+    assert not scans, f"{name} ({method}) scans {', '.join(sorted(scans))}"
+    for filter, index in FILTER_INDEXES.items():
+        if filter in filters:
+            assert index in indexes, f"{name} ({method}) does not use {index}"
@@ -0,0 +1,86 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from app.core import constant
+from app.core.market import service_market
+from app.hepler.enum import MarketPeriod
+from app.model import WorkMarket
+
+
+def snapshot(time_scan: datetime, active: int, new_today: int):
+    return SimpleNamespace(
+        time_scan=time_scan,
+        values={"active": active, "number_of_job_new_today": new_today},
+    )
+
+
+# Monday 2026-10-12 to Tuesday 2026-10-20, ordered by time_scan.
+ROWS = [
+    snapshot(datetime(2026, 10, 12, 0, 5), active=100, new_today=1),
+    snapshot(datetime(2026, 10, 12, 12, 0), active=110, new_today=7),
+    snapshot(datetime(2026, 10, 13, 0, 5), active=120, new_today=3),
+    snapshot(datetime(2026, 10, 18, 23, 59), active=131, new_today=5),
+    snapshot(datetime(2026, 10, 19, 0, 5), active=90, new_today=2),
+    snapshot(datetime(2026, 10, 20, 0, 5), active=95, new_today=4),
+]
+
+
+def closings():
+    return service_market.daily_closings(ROWS, lambda row: row.values)
+
+
+def test_last_snapshot_of_the_day_wins():
+    assert closings() == [
+        (date(2026, 10, 12), {"active": 110, "number_of_job_new_today": 7}),
+        (date(2026, 10, 13), {"active": 120, "number_of_job_new_today": 3}),
+        (date(2026, 10, 18), {"active": 131, "number_of_job_new_today": 5}),
+        (date(2026, 10, 19), {"active": 90, "number_of_job_new_today": 2}),
+        (date(2026, 10, 20), {"active": 95, "number_of_job_new_today": 4}),
+    ]
+
+
+def test_daily_rollup():
+    items = service_market.rollup(closings(), MarketPeriod.DAY)
+    assert [item["date"] for item in items] == [
+        "2026-10-12",
+        "2026-10-13",
+        "2026-10-18",
+        "2026-10-19",
+        "2026-10-20",
+    ]
+    assert items[0] == {
+        "date": "2026-10-12",
+        "active": 110,
+        "number_of_job_new_today": 7,
+    }
+
+
+def test_weekly_rollup_sums_flows_and_averages_stocks():
+    items = service_market.rollup(closings(), MarketPeriod.WEEK)
+    assert items == [
+        # Weeks start on Monday and only count the days with a snapshot.
+        {
+            "date": "2026-10-12",
+            "days": 3,
+            "active": round((110 + 120 + 131) / 3),
+            "number_of_job_new_today": 7 + 3 + 5,
+        },
+        {
+            "date": "2026-10-19",
+            "days": 2,
+            "active": round((90 + 95) / 2),
+            "number_of_job_new_today": 2 + 4,
+        },
+    ]
+
+
+def test_demand_is_not_computed_in_the_request(scratch_db):
+    with scratch_db() as db:
+        status, status_code, _ = service_market.get_cruitment_demand(db)
+        assert (status, status_code) == (constant.ERROR, 404)
+        assert db.query(WorkMarket).count() == 0
+
+        work_market = service_market.take_snapshot(db)
+        status, status_code, response = service_market.get_cruitment_demand(db)
+        assert (status, status_code) == (constant.SUCCESS, 200)
+        assert response == service_market.get_market_info(work_market)
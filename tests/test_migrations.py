@@ -0,0 +1,63 @@
+import pathlib
+
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+from app.core import constant
+from app.model import Base
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+BASELINE = "1c0e5b7a9d20"
+
+# Tables that later revisions create on top of the baseline.
+LATER_TABLES = {
+    "email_outbox",
+    "business_history_archive",
+    "job_report_archive",
+    "job_archive",
+    "work_location_archive",
+    "job_category_archive",
+    "job_skill_archive",
+    "working_time_archive",
+    "job_approval_request_archive",
+    "approval_log_archive",
+}
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path}/migrations.db"
+    # alembic/env.py takes the URL from the settings.
+    monkeypatch.setattr(constant, "DATABASE_URL", url)
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    return config
+
+
+def tables(config) -> set:
+    engine = sa.create_engine(constant.DATABASE_URL)
+    try:
+        return set(sa.inspect(engine).get_table_names()) - {"alembic_version"}
+    finally:
+        engine.dispose()
+
+
+def test_revisions_form_one_chain(config):
+    script = ScriptDirectory.from_config(config)
+    assert script.get_bases() == [BASELINE]
+    (head,) = script.get_heads()
+    revisions = list(script.walk_revisions(BASELINE, head))
+    assert revisions[-1].revision == BASELINE
+    for revision in revisions:
+        assert not revision.is_merge_point and not revision.is_branch_point
+
+
+def test_baseline_creates_the_schema_later_revisions_alter(config):
+    command.upgrade(config, BASELINE)
+    assert tables(config) == set(Base.metadata.tables) - LATER_TABLES
+
+    command.downgrade(config, "base")
+    assert tables(config) == set()
@@ -0,0 +1,33 @@
+import pytest
+
+from app.core.query_stats import QueryStats
+from app.testing.query_budget import check_budget
+
+# The page and its total are one statement, the serialization of every job
+# still loads its locations, times, skills, categories and company one by one.
+SEARCH_QUERIES = 2
+SEARCH_QUERIES_PER_JOB = 11
+
+
+def test_search_job_within_budget(client, query_budget):
+    limit = 10
+    with query_budget(SEARCH_QUERIES + SEARCH_QUERIES_PER_JOB * limit) as stats:
+        response = client.get("/v1/api/job/search", params={"limit": limit})
+    assert response.status_code == 200
+    assert stats.count > 0
+
+
+@pytest.mark.query_budget(SEARCH_QUERIES + SEARCH_QUERIES_PER_JOB)
+def test_search_job_marker_budget(client):
+    response = client.get("/v1/api/job/search", params={"limit": 1})
+    assert response.status_code == 200
+
+
+def test_budget_failure_lists_fingerprints():
+    stats = QueryStats()
+    for id in range(3):
+        stats.add(f"SELECT * FROM job WHERE id = {id}", 0.0)
+    with pytest.raises(pytest.fail.Exception) as error:
+        check_budget(stats, 2)
+    assert "3 queries over a budget of 2" in str(error.value)
+    assert "3x" in str(error.value)
@@ -0,0 +1,127 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from app import crud
+from app.hepler.enum import HistoryType
+from app.model import (
+    Blacklist,
+    Business,
+    BusinessHistory,
+    BusinessHistoryArchive,
+    Job,
+    JobReport,
+    JobReportArchive,
+    User,
+    VerifyCode,
+    VerifyCodeBlock,
+)
+from app.worker import retention
+from app.worker.retention import RetentionWorker, get_policies
+
+OLD = timedelta(days=400)
+RECENT = timedelta(days=1)
+
+
+@pytest.fixture
+def session(scratch_db, monkeypatch):
+    monkeypatch.setattr(retention, "SessionLocal", scratch_db)
+    with scratch_db() as session:
+        for model in (
+            Blacklist,
+            VerifyCode,
+            VerifyCodeBlock,
+            BusinessHistory,
+            BusinessHistoryArchive,
+            JobReport,
+            JobReportArchive,
+        ):
+            session.query(model).delete()
+        session.commit()
+        yield session
+
+
+def add_history(db, ages) -> list:
+    now = crud.retention.now(db)
+    business_id = db.query(Business.id).first()[0]
+    rows = [
+        BusinessHistory(
+            business_id=business_id,
+            content=f"history {index}",
+            type=HistoryType.LOGIN,
+            created_at=now - age,
+        )
+        for index, age in enumerate(ages)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return [row.id for row in rows]
+
+
+def run(batch_size: int = 2) -> dict:
+    worker = RetentionWorker(get_policies(), batch_size=batch_size, pause=0)
+    return asyncio.run(worker.run_once())
+
+
+def remaining(db, model) -> list:
+    db.expire_all()
+    return [id for (id,) in db.query(model.id).order_by(model.id)]
+
+
+def test_expired_rows_are_archived_and_recent_rows_kept(session):
+    ids = add_history(session, [OLD, OLD, OLD, RECENT, RECENT])
+
+    run()
+
+    assert remaining(session, BusinessHistory) == ids[3:]
+    archived = session.query(BusinessHistoryArchive).order_by(BusinessHistoryArchive.id)
+    assert [(row.id, row.content) for row in archived] == [
+        (id, f"history {index}") for index, id in enumerate(ids[:3])
+    ]
+
+
+def test_walk_ends_with_the_batch_of_the_first_kept_row(session):
+    # The tables only grow at the end, an old row behind a kept one is left
+    # for the next run once the batch reaching the kept row is purged.
+    ids = add_history(session, [OLD, OLD, RECENT, OLD, OLD])
+
+    report = run(batch_size=2)
+
+    assert report["business_history"] == 3
+    assert remaining(session, BusinessHistory) == [ids[2], ids[4]]
+
+
+def test_report_of_every_table(session):
+    now = crud.retention.now(session)
+    job_id = session.query(Job.id).first()[0]
+    user_id = session.query(User.id).first()[0]
+    session.add_all(
+        [
+            Blacklist(token="expired", created_at=now - OLD),
+            Blacklist(token="live", created_at=now - timedelta(seconds=1)),
+            JobReport(
+                job_id=job_id,
+                user_id=user_id,
+                report_type="spam",
+                report_status="closed",
+                report_created_at=now - OLD,
+            ),
+        ]
+    )
+    session.commit()
+    add_history(session, [OLD, RECENT])
+
+    report = run()
+
+    assert report == {
+        "blacklist": 1,
+        "verify_code": 0,
+        "verify_code_block": 0,
+        "business_history": 1,
+        "job_report": 1,
+    }
+    session.expire_all()
+    assert [row.token for row in session.query(Blacklist)] == ["live"]
+    assert session.query(JobReport).count() == 0
+    assert session.query(JobReportArchive).count() == 1
@@ -0,0 +1,192 @@
+import asyncio
+import random
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+from app.core import scheduler as scheduler_module
+from app.core.scheduler import CronSchedule, Scheduler
+from app.storage.redis import RedisBackend
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def fake_backend(server) -> RedisBackend:
+    backend = RedisBackend(host="localhost", port=6379, password="", db=0, expire=60)
+    backend.connection = fakeredis.FakeAsyncRedis(server=server)
+    return backend
+
+
+def make_schedulers(count: int, clock: FakeClock, lease: float = 60):
+    server = fakeredis.FakeServer()
+    return [
+        Scheduler(
+            redis=fake_backend(server),
+            clock=clock,
+            rng=random.Random(index),
+            lease=lease,
+            poll_interval=5,
+            prefix="test",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def results(monkeypatch):
+    runs = []
+    monkeypatch.setattr(
+        scheduler_module,
+        "record_task_run",
+        lambda task, result, duration, finished_at: runs.append((task, result)),
+    )
+    return runs
+
+
+async def tick_all(schedulers) -> list:
+    started = []
+    for scheduler in schedulers:
+        started += await scheduler.tick()
+    await asyncio.gather(*started)
+    return started
+
+
+def test_each_slot_runs_once_across_instances(results):
+    async def run():
+        clock = FakeClock()
+        schedulers = make_schedulers(3, clock)
+        runs = []
+        for index, scheduler in enumerate(schedulers):
+
+            async def task(index=index):
+                runs.append(index)
+
+            scheduler.register("snapshot", task, 60, jitter=0)
+
+        # The first tick only schedules the task.
+        assert await tick_all(schedulers) == []
+        for slot in range(5):
+            clock.now += 60
+            assert len(await tick_all(schedulers)) == 1
+            # Ticking again within the slot starts nothing.
+            assert await tick_all(schedulers) == []
+        return runs
+
+    runs = asyncio.run(run())
+    assert len(runs) == 5
+    assert results == [("snapshot", "success")] * 5
+
+
+def test_running_task_is_not_started_again(results):
+    async def run():
+        clock = FakeClock()
+        first, second = make_schedulers(2, clock)
+        release = asyncio.Event()
+        runs = []
+
+        async def slow():
+            runs.append("first")
+            await release.wait()
+
+        async def task():
+            runs.append("second")
+
+        first.register("reconcile", slow, 60, jitter=0)
+        second.register("reconcile", task, 60, jitter=0)
+        await tick_all([first, second])
+
+        clock.now += 60
+        started = await first.tick()
+        assert len(started) == 1
+        # The next slot comes while the first run still holds the lease.
+        clock.now += 60
+        assert await first.tick() == []
+        assert await second.tick() == []
+        assert runs == ["first"]
+
+        release.set()
+        await asyncio.gather(*started)
+        clock.now += 60
+        await tick_all([second, first])
+        return runs
+
+    runs = asyncio.run(run())
+    assert runs == ["first", "second"]
+    assert results == [("reconcile", "success")] * 2
+
+
+def test_lost_lease_is_reported(results):
+    async def run():
+        clock = FakeClock()
+        (scheduler,) = make_schedulers(1, clock, lease=0.3)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        scheduler.register("purge", slow, 60, jitter=0)
+        await scheduler.tick()
+        clock.now += 60
+        started = await scheduler.tick()
+        task = scheduler.tasks["purge"]
+
+        # Another owner takes the lock over, the renewal finds it gone.
+        await scheduler.redis.connection.set(scheduler.lock_key(task), "other")
+        for _ in range(50):
+            if task.lock_lost:
+                break
+            await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(*started)
+        owner = await scheduler.redis.connection.get(scheduler.lock_key(task))
+        return task.lock_lost, owner
+
+    lock_lost, owner = asyncio.run(run())
+    assert lock_lost
+    # The lock of the new owner is not released.
+    assert owner == b"other"
+    assert results == [("purge", "lock_lost")]
+
+
+def timestamp(*args) -> float:
+    return datetime(*args).timestamp()
+
+
+@pytest.mark.parametrize(
+    "expression, after, expected",
+    [
+        ("5 0 * * *", (2026, 10, 19, 0, 5), (2026, 10, 20, 0, 5)),
+        ("5 0 * * *", (2026, 10, 19, 0, 4, 59), (2026, 10, 19, 0, 5)),
+        ("*/15 * * * *", (2026, 10, 19, 10, 16), (2026, 10, 19, 10, 30)),
+        ("0 9-17/4 * * *", (2026, 10, 19, 13, 0), (2026, 10, 19, 17, 0)),
+        ("@monthly", (2026, 12, 15), (2027, 1, 1)),
+        ("0 3 * * 0", (2026, 10, 19), (2026, 10, 25, 3, 0)),
+        ("0 3 * * 7", (2026, 10, 19), (2026, 10, 25, 3, 0)),
+        ("0 0 29 2 *", (2026, 3, 1), (2028, 2, 29)),
+        # A restricted day and weekday match on either: the 13th or a Friday.
+        ("0 0 13 * 5", (2026, 10, 7), (2026, 10, 9)),
+        ("0 0 13 * 5", (2026, 10, 10), (2026, 10, 13)),
+        ("0 0 13 * 5", (2026, 10, 13), (2026, 10, 16)),
+        # With one of them unrestricted only the other one counts.
+        ("0 0 13 * *", (2026, 10, 14), (2026, 11, 13)),
+        ("0 0 * * 5", (2026, 10, 10), (2026, 10, 16)),
+    ],
+)
+def test_cron_next_after(expression, after, expected):
+    schedule = CronSchedule(expression)
+    assert schedule.next_after(timestamp(*after)) == timestamp(*expected)
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "60 * * * *", "0 0 32 * *", "5-1 * * * *", "0 0 30 2 *"]
+)
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression).next_after(timestamp(2026, 10, 19))
@@ -0,0 +1,105 @@
+import asyncio
+import io
+
+import pytest
+from starlette.datastructures import Headers, UploadFile
+
+from app.storage.base import Storage
+from app.storage.local import LocalStorage
+
+
+def upload(content: bytes, filename: str = "logo.png", content_type="image/png"):
+    return UploadFile(
+        io.BytesIO(content),
+        filename=filename,
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = LocalStorage(root=str(tmp_path / "media"))
+    yield storage
+    storage.close()
+
+
+def test_incomplete_backend_fails_at_construction():
+    class Incomplete(Storage):
+        def upload_file(self, file, key):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_content_key_depends_on_content_only(storage):
+    first = storage.content_key(upload(b"same", "a.png"), "logo")
+    second = storage.content_key(upload(b"same", "b.png/renamed.logo"), "logo")
+    other = storage.content_key(upload(b"other"), "logo")
+    assert first == second != other
+    assert first.startswith("logo/") and first.endswith(".png")
+
+
+def test_upload_is_deduplicated(storage):
+    key = "logo/digest.png"
+    assert storage.upload_file_deduplicated(upload(b"first"), key) is True
+    assert storage.upload_file_deduplicated(upload(b"second"), key) is False
+    assert storage.get_file(key) == b"first"
+
+
+def test_background_upload_can_be_discarded(storage):
+    key = "logo/digest.png"
+    pending = storage.upload_file_background(upload(b"content"), key)
+    assert pending.succeeded()
+    assert pending.wait() is True
+    assert storage.get_file(key) == b"content"
+    pending.discard()
+    assert storage.head_file(key) is None
+
+
+def test_discarding_a_deduplicated_upload_keeps_the_object(storage):
+    key = "logo/digest.png"
+    storage.upload_file_deduplicated(upload(b"content"), key)
+    pending = storage.upload_file_background(upload(b"content"), key)
+    assert pending.wait() is False
+    pending.discard()
+    assert storage.get_file(key) == b"content"
+
+
+def test_failed_background_upload(storage):
+    pending = storage.upload_file_background(upload(b"content"), "../outside.png")
+    assert not pending.succeeded()
+    with pytest.raises(ValueError):
+        pending.wait()
+    pending.discard()
+
+
+def test_async_upload_and_delete(storage):
+    key = "avatar/digest.png"
+
+    async def run():
+        written = await storage.upload_file_async(upload(b"content"), key)
+        await storage.delete_file_async(key)
+        return written
+
+    assert asyncio.run(run()) is True
+    assert storage.head_file(key) is None
+
+
+@pytest.mark.parametrize(
+    "key", ["../outside.png", "/etc/passwd", "logo/../../outside.png", "", "."]
+)
+def test_keys_outside_the_root_are_refused(storage, tmp_path, key):
+    with pytest.raises(ValueError):
+        storage.upload_bytes(b"content", key, "image/png")
+    with pytest.raises(ValueError):
+        storage.delete_file(key)
+    with pytest.raises(ValueError):
+        storage.head_file(key)
+    assert not (tmp_path / "outside.png").exists()
+
+
+def test_nested_keys_stay_inside_the_root(storage, tmp_path):
+    storage.upload_bytes(b"content", "logo/../avatar/a.png", "image/png")
+    assert (tmp_path / "media" / "avatar" / "a.png").read_bytes() == b"content"
+    assert storage.head_file("avatar/a.png") == {"size": 7, "content_type": None}
@@ -0,0 +1,152 @@
+import pytest
+
+from app.core import constant
+from app.core.upload import service_upload
+from app.hepler.enum import FolderBucket, Role
+from app.model import User
+from app.schema.upload import UploadConfirmRequest
+from app.storage.local import LocalStorage
+from app.storage.s3 import S3
+
+
+class Owner:
+    def __init__(self, role: Role, id: int):
+        self.role = role
+        self.id = id
+
+
+class StubS3Client:
+    def generate_presigned_post(self, **kwargs):
+        return {"url": "https://bucket.s3.amazonaws.com", "fields": kwargs["Fields"]}
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = LocalStorage(root=str(tmp_path))
+    monkeypatch.setattr(service_upload, "s3_service", storage)
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    bucket = S3("key", "secret", "bucket", client=StubS3Client())
+    monkeypatch.setattr(service_upload, "s3_service", bucket)
+    yield bucket
+    bucket.close()
+
+
+@pytest.fixture
+def thumbnails(monkeypatch):
+    generated = []
+    monkeypatch.setattr(
+        service_upload.image_processor,
+        "generate",
+        lambda model, id, column, key, data=None: generated.append((column, key)),
+    )
+    return generated
+
+
+INTENT = {
+    "type": FolderBucket.AVATAR,
+    "file_name": "avatar.png",
+    "content_type": "image/png",
+    "size": 1024,
+}
+
+
+def test_intent_key_is_namespaced_by_account(bucket):
+    for role, prefix in (
+        (Role.USER, "user/7/avatar/"),
+        (Role.SOCIAL_NETWORK, "social_network/7/avatar/"),
+        (Role.BUSINESS, "business/7/avatar/"),
+    ):
+        status, status_code, response = service_upload.create_upload_intent(
+            INTENT, Owner(role, 7), [FolderBucket.AVATAR]
+        )
+        assert (status, status_code) == (constant.SUCCESS, 200)
+        assert response["key"].startswith(prefix)
+        assert response["key"].endswith(".png")
+        assert response["fields"]["Content-Type"] == "image/png"
+        # The key can be posted to again, it is not cached as immutable.
+        assert response["fields"]["Cache-Control"] == constant.REVALIDATE_CACHE_CONTROL
+
+
+def test_intent_rejects_other_types(bucket):
+    status, status_code, _ = service_upload.create_upload_intent(
+        INTENT, Owner(Role.USER, 7), [FolderBucket.CV]
+    )
+    assert (status, status_code) == (constant.ERROR, 403)
+
+
+def test_intent_without_bucket_is_rejected(storage):
+    status, status_code, _ = service_upload.create_upload_intent(
+        INTENT, Owner(Role.USER, 7), [FolderBucket.AVATAR]
+    )
+    assert (status, status_code) == (constant.ERROR, 501)
+
+
+def test_confirm_stores_the_avatar(db, storage, thumbnails):
+    user = db.query(User).first()
+    key = f"user/{user.id}/avatar/uploaded.png"
+    storage.upload_bytes(b"png", key, "image/png")
+
+    status, status_code, response = service_upload.confirm_user_upload(
+        db, {"type": FolderBucket.AVATAR, "key": key}, user
+    )
+
+    assert (status, status_code) == (constant.SUCCESS, 200)
+    db.refresh(user)
+    assert user.avatar == key
+    assert thumbnails == [("avatar", key)]
+
+
+@pytest.mark.parametrize(
+    "owner, key",
+    [
+        # The same id in another account kind.
+        (Owner(Role.BUSINESS, 7), "user/7/avatar/a.png"),
+        (Owner(Role.USER, 7), "business/7/avatar/a.png"),
+        (Owner(Role.USER, 7), "social_network/7/avatar/a.png"),
+        # Another account of the same kind, another upload type.
+        (Owner(Role.USER, 7), "user/8/avatar/a.png"),
+        (Owner(Role.USER, 7), "user/7/cv/a.png"),
+    ],
+)
+def test_confirm_checks_the_prefix(storage, owner, key):
+    storage.upload_bytes(b"png", key, "image/png")
+    upload_data = UploadConfirmRequest(type=FolderBucket.AVATAR, key=key)
+    status, status_code, _ = service_upload.check_uploaded_file(upload_data, owner)
+    assert (status, status_code) == (constant.ERROR, 403)
+    assert storage.head_file(key)
+
+
+def test_confirm_missing_file(storage):
+    upload_data = UploadConfirmRequest(
+        type=FolderBucket.AVATAR, key="user/7/avatar/missing.png"
+    )
+    status, status_code, _ = service_upload.check_uploaded_file(
+        upload_data, Owner(Role.USER, 7)
+    )
+    assert (status, status_code) == (constant.ERROR, 404)
+
+
+def test_confirm_deletes_oversized_file(storage):
+    key = "user/7/avatar/large.png"
+    storage.upload_bytes(b"0" * (constant.MAX_IMAGE_SIZE + 1), key, "image/png")
+    upload_data = UploadConfirmRequest(type=FolderBucket.AVATAR, key=key)
+    status, status_code, _ = service_upload.check_uploaded_file(
+        upload_data, Owner(Role.USER, 7)
+    )
+    assert (status, status_code) == (constant.ERROR, 400)
+    assert storage.head_file(key) is None
+
+
+@pytest.mark.parametrize(
+    "key", ["", "/etc/passwd", "../user/7/avatar/a.png", "user/7/avatar/../../x"]
+)
+def test_confirm_rejects_escaping_keys(db, storage, key):
+    status, status_code, _ = service_upload.confirm_user_upload(
+        db, {"type": FolderBucket.AVATAR, "key": key}, Owner(Role.USER, 7)
+    )
+    assert (status, status_code) == (constant.ERROR, 400)